@@ -2,17 +2,41 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from importlib import metadata
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 RGBAColor = tuple[int, int, int, int]
-ColorCell = RGBAColor | None
-Frame = list[list[ColorCell]]
-NEAREST = Image.Resampling.NEAREST
+Frame = np.ndarray
+# Sorts after every packed 24-bit RGB key, so it always lands on the last slot.
+_TRANSPARENT_KEY = 0xFFFFFFFF
+# Below this output size, thread start-up costs more than the copy itself.
+_PARALLEL_SCALE_MIN_BYTES = 8 * 1024 * 1024
+
+
+def _has_pillow_simd() -> bool:
+    # Pillow-SIMD installs as a drop-in "PIL" package under its own
+    # distribution name, so the import alone cannot tell them apart.
+    try:
+        metadata.version("Pillow-SIMD")
+    except metadata.PackageNotFoundError:
+        return False
+    return True
+
+
+_HAS_SIMD = _has_pillow_simd()
 
 
 class PixelRenderError(ValueError):
@@ -24,7 +48,7 @@ class PixelAnimation:
     width: int
     height: int
     fps: int
-    frames: list[Frame]
+    frames: np.ndarray
 
 
 def _positive_int(value: object, field_name: str) -> int:
@@ -33,7 +57,7 @@ def _positive_int(value: object, field_name: str) -> int:
     return value
 
 
-def parse_hex_color(value: str) -> tuple[int, int, int, int]:
+def parse_hex_color(value: str) -> RGBAColor:
     text = value.strip()
     if not text.startswith("#"):
         raise PixelRenderError(f"Invalid color '{value}'. Expected a hex color starting with '#'.")
@@ -50,19 +74,22 @@ def parse_hex_color(value: str) -> tuple[int, int, int, int]:
     if len(hex_part) in {3, 4}:
         hex_part = "".join(ch * 2 for ch in hex_part)
 
-    if len(hex_part) == 6:
-        hex_part += "FF"
+    channels = bytes.fromhex(hex_part)
+    alpha = channels[3] if len(channels) == 4 else 255
+    return channels[0], channels[1], channels[2], alpha
 
-    red = int(hex_part[0:2], 16)
-    green = int(hex_part[2:4], 16)
-    blue = int(hex_part[4:6], 16)
-    alpha = int(hex_part[6:8], 16)
-    return red, green, blue, alpha
+
+def _parse_json(data: bytes) -> object:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    # need to handle the stdlib exception either way.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
 
 
 def _load_animation(path: Path, fps_override: int | None) -> PixelAnimation:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = _parse_json(path.read_bytes())
     except OSError as exc:
         raise PixelRenderError(f"Unable to read '{path}': {exc}") from exc
     except json.JSONDecodeError as exc:
@@ -85,24 +112,25 @@ def _load_animation(path: Path, fps_override: int | None) -> PixelAnimation:
     if not isinstance(raw_frames, list) or not raw_frames:
         raise PixelRenderError("'frames' must be a non-empty array.")
 
-    frames: list[Frame] = []
+    # Pixel art reuses a small palette, so each distinct string is parsed once.
+    color_cache: dict[str, RGBAColor] = {}
+    frames = np.zeros((len(raw_frames), height, width, 4), dtype=np.uint8)
     for frame_index, raw_frame in enumerate(raw_frames, start=1):
         if not isinstance(raw_frame, list) or len(raw_frame) != height:
             raise PixelRenderError(
                 f"Frame {frame_index} must contain exactly {height} rows."
             )
 
-        frame_rows: Frame = []
+        frame = frames[frame_index - 1]
         for row_index, raw_row in enumerate(raw_frame, start=1):
             if not isinstance(raw_row, list) or len(raw_row) != width:
                 raise PixelRenderError(
                     f"Frame {frame_index}, row {row_index} must contain exactly {width} columns."
                 )
 
-            row: list[ColorCell] = []
+            row = frame[row_index - 1]
             for col_index, raw_color in enumerate(raw_row, start=1):
                 if raw_color is None:
-                    row.append(None)
                     continue
 
                 if not isinstance(raw_color, str):
@@ -110,80 +138,187 @@ def _load_animation(path: Path, fps_override: int | None) -> PixelAnimation:
                         f"Frame {frame_index}, row {row_index}, col {col_index} must be string or null."
                     )
 
-                try:
-                    parsed_color = parse_hex_color(raw_color)
-                except PixelRenderError as exc:
-                    raise PixelRenderError(
-                        f"Frame {frame_index}, row {row_index}, col {col_index}: {exc}"
-                    ) from exc
+                parsed_color = color_cache.get(raw_color)
+                if parsed_color is None:
+                    try:
+                        parsed_color = parse_hex_color(raw_color)
+                    except PixelRenderError as exc:
+                        raise PixelRenderError(
+                            f"Frame {frame_index}, row {row_index}, col {col_index}: {exc}"
+                        ) from exc
+                    color_cache[raw_color] = parsed_color
 
-                row.append(parsed_color)
-
-            frame_rows.append(row)
-        frames.append(frame_rows)
+                row[col_index - 1] = parsed_color
 
     return PixelAnimation(width=width, height=height, fps=fps, frames=frames)
 
 
-def _render_frame(frame: Frame, width: int, height: int, scale: int) -> Image.Image:
-    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    pixels = image.load()
-
-    for y, row in enumerate(frame):
-        for x, color in enumerate(row):
-            if color is None:
-                continue
-            pixels[x, y] = color
-
-    if scale != 1:
-        image = image.resize((width * scale, height * scale), NEAREST)
-    return image
+def _scale_frames(frames: np.ndarray, scale: int) -> np.ndarray:
+    """Nearest-neighbor upscale every frame into a single new buffer.
+
+    Works for both RGBA frames (n, h, w, 4) and palette indices (n, h, w).
+    Large animations are copied frame by frame on a thread pool, since NumPy
+    releases the GIL while filling the output.
+    """
+    if scale == 1:
+        return frames
+    count, height, width = frames.shape[:3]
+    channels = frames.shape[3:]
+    scaled = np.empty((count, height * scale, width * scale, *channels), dtype=frames.dtype)
+    # View each output frame as (h, scale, w, scale, ...) and broadcast the
+    # source pixel across its scale x scale block.
+    blocks = scaled.reshape(count, height, scale, width, scale, *channels)
+    source = frames[:, :, None, :, None]
+
+    if count == 1 or scaled.nbytes < _PARALLEL_SCALE_MIN_BYTES:
+        blocks[...] = source
+        return scaled
+
+    def scale_frame(index: int) -> None:
+        blocks[index] = source[index]
+
+    with ThreadPoolExecutor(max_workers=min(count, os.cpu_count() or 1)) as executor:
+        list(executor.map(scale_frame, range(count)))
+    return scaled
+
+
+def _render_frame(frame: Frame, mode: str = "RGBA") -> Image.Image:
+    # Transparent cells are left as zeros by _load_animation, so the frame
+    # buffer can be handed to Pillow as-is, without copying.
+    height, width = frame.shape[:2]
+    return Image.frombuffer(mode, (width, height), frame, "raw", mode, 0, 1)
+
+
+def _build_palette(frames: np.ndarray) -> tuple[np.ndarray, bytes, int | None] | None:
+    """Map every pixel to a shared GIF palette, or return None past 256 colors.
+
+    GIF only supports on/off transparency, so any pixel with zero alpha shares
+    one transparent slot and the alpha of the remaining pixels is dropped.
+    """
+    rgb = frames[..., :3].astype(np.uint32)
+    keys = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+    keys[frames[..., 3] == 0] = _TRANSPARENT_KEY
+
+    colors, indices = np.unique(keys, return_inverse=True)
+    if len(colors) > 256:
+        return None
+
+    transparency: int | None = None
+    if colors[-1] == _TRANSPARENT_KEY:
+        transparency = len(colors) - 1
+        colors = colors.copy()
+        colors[-1] = 0
+
+    palette = np.stack(
+        [(colors >> 16) & 0xFF, (colors >> 8) & 0xFF, colors & 0xFF], axis=-1
+    ).astype(np.uint8)
+    return indices.reshape(keys.shape).astype(np.uint8), palette.tobytes(), transparency
+
+
+def _render_gif_frames(animation: PixelAnimation, scale: int) -> list[Image.Image]:
+    # The palette is built before scaling so the color lookup touches each
+    # source pixel once.
+    paletted = _build_palette(animation.frames)
+    if paletted is None:
+        return [_render_frame(frame) for frame in _scale_frames(animation.frames, scale)]
+
+    indices, palette, transparency = paletted
+    images: list[Image.Image] = []
+    for frame in _scale_frames(indices, scale):
+        image = _render_frame(frame, mode="P")
+        image.putpalette(palette)
+        if transparency is not None:
+            image.info["transparency"] = transparency
+        images.append(image)
+    return images
+
+
+def _merge_duplicate_frames(
+    images: list[Image.Image], duration_ms: int
+) -> tuple[list[Image.Image], list[int]]:
+    """Collapse runs of identical frames into one frame with a longer duration."""
+    unique_images: list[Image.Image] = []
+    durations: list[int] = []
+    previous: bytes | None = None
+    for image in images:
+        data = image.tobytes()
+        if data == previous:
+            durations[-1] += duration_ms
+            continue
+        unique_images.append(image)
+        durations.append(duration_ms)
+        previous = data
+    return unique_images, durations
+
+
+def _transparent_mask(image: Image.Image) -> np.ndarray:
+    pixels = np.asarray(image)
+    if image.mode == "RGBA":
+        return pixels[..., 3] == 0
+    transparency = image.info.get("transparency")
+    if transparency is None:
+        return np.zeros(pixels.shape, dtype=bool)
+    return pixels == transparency
+
+
+def _gif_disposal(images: list[Image.Image]) -> int:
+    """Pick the GIF disposal method for the animation.
+
+    Keeping each frame on screen (disposal 1) lets Pillow encode every later
+    frame as just the rectangle that changed. Transparent pixels would then
+    show whatever an earlier frame painted there, so that is only safe when
+    every frame is transparent in exactly the same places. Otherwise frames
+    clear to the background (disposal 2).
+    """
+    first_mask = _transparent_mask(images[0])
+    for image in images[1:]:
+        if not np.array_equal(_transparent_mask(image), first_mask):
+            return 2
+    return 1
 
 
 def _save_gif(images: list[Image.Image], output_path: Path, fps: int) -> None:
     duration_ms = max(1, round(1000 / fps))
-    first, *rest = images
+    unique_images, durations = _merge_duplicate_frames(images, duration_ms)
+    first, *rest = unique_images
     first.save(
         output_path,
         format="GIF",
         save_all=True,
         append_images=rest,
-        duration=duration_ms,
+        duration=durations,
         loop=0,
-        disposal=2,
+        disposal=_gif_disposal(unique_images),
         optimize=False,
     )
 
 
-def _save_png(images: list[Image.Image], output_path: Path) -> None:
-    if len(images) == 1:
-        images[0].save(output_path, format="PNG")
+def _save_png(frames: np.ndarray, output_path: Path) -> None:
+    if len(frames) == 1:
+        Image.fromarray(frames[0]).save(output_path, format="PNG")
         return
 
-    frame_width, frame_height = images[0].size
-    sprite_sheet = Image.new(
-        "RGBA", (frame_width * len(images), frame_height), (0, 0, 0, 0)
-    )
-    for index, image in enumerate(images):
-        sprite_sheet.paste(image, (index * frame_width, 0))
-    sprite_sheet.save(output_path, format="PNG")
+    # Lay frames out left to right: (n, h, w, 4) -> (h, n * w, 4).
+    count, height, width, channels = frames.shape
+    sheet = frames.transpose(1, 0, 2, 3).reshape(height, count * width, channels)
+    Image.fromarray(sheet).save(output_path, format="PNG")
 
 
 def _render(input_path: Path, output_path: Path, scale: int, fps_override: int | None) -> None:
     animation = _load_animation(input_path, fps_override=fps_override)
-    images = [
-        _render_frame(frame, width=animation.width, height=animation.height, scale=scale)
-        for frame in animation.frames
-    ]
+    suffix = output_path.suffix.lower()
+    if suffix == ".gif":
+        images = _render_gif_frames(animation, scale=scale)
+    else:
+        frames = _scale_frames(animation.frames, scale)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    suffix = output_path.suffix.lower()
     if suffix == ".gif":
         _save_gif(images, output_path, fps=animation.fps)
         return
     if suffix == ".png":
-        _save_png(images, output_path)
+        _save_png(frames, output_path)
         return
 
     raise PixelRenderError("Output file extension must be .gif or .png.")
@@ -193,6 +328,7 @@ def _build_parser(prog_name: str) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog=prog_name,
         description="Render pixel matrix JSON into GIF or PNG images.",
+        epilog=f"Imaging backend: {'Pillow-SIMD' if _HAS_SIMD else 'Pillow'}.",
     )
     parser.add_argument("input", help="Path to the input JSON file.")
     parser.add_argument(
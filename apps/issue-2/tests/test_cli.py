@@ -6,7 +6,7 @@ from pathlib import Path
 
 from PIL import Image
 
-from pixel_render.cli import main
+from pixel_render.cli import main, parse_hex_color
 
 
 def _write_json(path: Path, payload: dict) -> None:
@@ -40,6 +40,58 @@ def test_generate_gif_with_scale_and_two_frames() -> None:
             assert getattr(image, "n_frames", 1) == 2
 
 
+def test_gif_merges_identical_consecutive_frames() -> None:
+    black = [["#000000"] * 2 for _ in range(2)]
+    white = [["#FFFFFF"] * 2 for _ in range(2)]
+    payload = {
+        "width": 2,
+        "height": 2,
+        "fps": 10,
+        "frames": [black, black, black, white],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="pixel-render-") as temp_dir:
+        tmp_path = Path(temp_dir)
+        input_file = tmp_path / "hold.json"
+        output_file = tmp_path / "hold.gif"
+        _write_json(input_file, payload)
+
+        exit_code = main([str(input_file), "--out", str(output_file)])
+        assert exit_code == 0
+
+        with Image.open(output_file) as image:
+            assert image.n_frames == 2
+            assert image.info["duration"] == 300
+
+
+def test_gif_keeps_frames_only_when_transparency_is_stable() -> None:
+    opaque = {
+        "width": 2,
+        "height": 1,
+        "fps": 2,
+        "frames": [[["#000", "#fff"]], [["#fff", "#000"]]],
+    }
+    changing = {
+        "width": 2,
+        "height": 1,
+        "fps": 2,
+        "frames": [[["#000", "#fff"]], [[None, "#000"]]],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="pixel-render-") as temp_dir:
+        tmp_path = Path(temp_dir)
+        for name, payload, disposal in (("opaque", opaque, 1), ("changing", changing, 2)):
+            input_file = tmp_path / f"{name}.json"
+            output_file = tmp_path / f"{name}.gif"
+            _write_json(input_file, payload)
+
+            exit_code = main([str(input_file), "--out", str(output_file)])
+            assert exit_code == 0
+
+            with Image.open(output_file) as image:
+                assert image.disposal_method == disposal
+
+
 def test_generate_single_frame_png_from_issue_example() -> None:
     payload = {
         "width": 5,
@@ -123,6 +175,40 @@ def test_png_keeps_transparent_pixels_and_alpha_hex() -> None:
             assert rgba.getpixel((1, 1)) == (0, 0, 255, 128)
 
 
+def test_gif_uses_shared_palette_with_transparency() -> None:
+    payload = {
+        "width": 2,
+        "height": 1,
+        "fps": 2,
+        "frames": [
+            [[None, "#ff0000"]],
+            [["#00ff00", None]],
+        ],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="pixel-render-") as temp_dir:
+        tmp_path = Path(temp_dir)
+        input_file = tmp_path / "palette.json"
+        output_file = tmp_path / "palette.gif"
+        _write_json(input_file, payload)
+
+        exit_code = main([str(input_file), "--out", str(output_file)])
+        assert exit_code == 0
+
+        with Image.open(output_file) as image:
+            assert image.mode == "P"
+            rgba = image.convert("RGBA")
+            assert rgba.getpixel((0, 0))[3] == 0
+            assert rgba.getpixel((1, 0)) == (255, 0, 0, 255)
+
+
+def test_parse_hex_color_supports_all_lengths() -> None:
+    assert parse_hex_color("#f00") == (255, 0, 0, 255)
+    assert parse_hex_color("#f008") == (255, 0, 0, 136)
+    assert parse_hex_color("#00ff00") == (0, 255, 0, 255)
+    assert parse_hex_color("#0000ff80") == (0, 0, 255, 128)
+
+
 def test_invalid_output_extension_returns_error() -> None:
     payload = {
         "width": 1,
@@ -139,3 +225,15 @@ def test_invalid_output_extension_returns_error() -> None:
 
         exit_code = main([str(input_file), "--out", str(output_file)])
         assert exit_code == 1
+
+
+def test_invalid_json_returns_error(capsys) -> None:
+    with tempfile.TemporaryDirectory(prefix="pixel-render-") as temp_dir:
+        tmp_path = Path(temp_dir)
+        input_file = tmp_path / "broken.json"
+        output_file = tmp_path / "output.png"
+        input_file.write_text('{\n  "width": }', encoding="utf-8")
+
+        exit_code = main([str(input_file), "--out", str(output_file)])
+        assert exit_code == 1
+        assert "line 2" in capsys.readouterr().err
@@ -5,6 +5,7 @@ This module implements semantic chunking strategy that splits documents
 into meaningful chunks while preserving context and semantic coherence.
 """
 
+import os
 import re
 from typing import List, Tuple
 from dataclasses import dataclass
@@ -38,6 +39,10 @@ class DocumentChunker:
     - Chinese text support
     """
     
+    # Regex patterns (compiled for performance)
+    SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+|(?<=[。！？])|(?:\n\n+)')
+    CODE_BLOCK_PATTERN = re.compile(r'```[\s\S]*?```')
+    
     def __init__(
         self,
         chunk_size: int = 512,
@@ -73,12 +78,29 @@ class DocumentChunker:
             Number of tokens
         """
         if self.tokenizer:
-            return len(self.tokenizer.encode(text))
+            return len(self.tokenizer.encode_ordinary(text))
         else:
             # Fallback: rough estimate (1 token ≈ 4 chars for English, 1.5 for Chinese)
             # Use conservative estimate
             return len(text) // 3
     
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for many texts in a single tokenizer call.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Number of tokens for each text, in input order
+        """
+        if self.tokenizer:
+            encoded = self.tokenizer.encode_ordinary_batch(
+                texts, num_threads=os.cpu_count() or 1
+            )
+            return [len(tokens) for tokens in encoded]
+        return [self.count_tokens(text) for text in texts]
+    
     def split_by_sentences(self, text: str) -> List[str]:
         """
         Split text into sentences, handling both English and Chinese.
@@ -92,9 +114,7 @@ class DocumentChunker:
         # Pattern handles:
         # - English: . ! ? followed by space or newline
         # - Chinese: 。！？ (may or may not have space after)
-        # Split on Chinese punctuation or English punctuation with space
-        pattern = r'(?<=[.!?])\s+|(?<=[。！？])|(?:\n\n+)'
-        sentences = re.split(pattern, text)
+        sentences = self.SENTENCE_SPLIT_PATTERN.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
     def extract_code_blocks(self, text: str) -> Tuple[List[Tuple[int, int, str]], str]:
@@ -109,14 +129,13 @@ class DocumentChunker:
             code_blocks is list of (start, end, code) tuples
         """
         code_blocks = []
-        pattern = r'```[\s\S]*?```'
         
-        for match in re.finditer(pattern, text):
-            start, end = match.span()
-            code_blocks.append((start, end, match.group()))
+        def _capture(match: re.Match) -> str:
+            code_blocks.append((match.start(), match.end(), match.group()))
+            return '[CODE_BLOCK]'
         
-        # Replace code blocks with markers
-        cleaned_text = re.sub(pattern, '[CODE_BLOCK]', text)
+        # Record and replace code blocks with markers in a single scan
+        cleaned_text = self.CODE_BLOCK_PATTERN.sub(_capture, text)
         
         return code_blocks, cleaned_text
     
@@ -126,7 +145,8 @@ class DocumentChunker:
         
         Args:
             text: Input text to chunk
-            metadata: Optional metadata to attach to chunks
+            metadata: Optional metadata to attach to chunks (copied once and
+                shared by every chunk of the document)
             
         Returns:
             List of Chunk objects
@@ -134,7 +154,7 @@ class DocumentChunker:
         if not text or not text.strip():
             return []
         
-        metadata = metadata or {}
+        metadata = dict(metadata) if metadata else {}
         chunks = []
         
         # Extract code blocks if needed
@@ -149,18 +169,20 @@ class DocumentChunker:
         if not sentences:
             return []
         
-        # Build chunks
-        current_chunk = []
+        # Tokenize each sentence once; the overlap walk below reuses the counts
+        token_counts = self.count_tokens_batch(sentences)
+        
+        # Build chunks. The current chunk is sentences[chunk_first:i].
+        chunk_firsts = []
+        chunk_first = 0
         current_tokens = 0
         current_start = 0
         
-        for i, sentence in enumerate(sentences):
-            sentence_tokens = self.count_tokens(sentence)
-            
+        for i, sentence_tokens in enumerate(token_counts):
             # Check if adding this sentence exceeds chunk size
-            if current_tokens + sentence_tokens > self.chunk_size and current_chunk:
+            if current_tokens + sentence_tokens > self.chunk_size and i > chunk_first:
                 # Save current chunk
-                chunk_text = ' '.join(current_chunk)
+                chunk_text = ' '.join(sentences[chunk_first:i])
                 chunk_end = current_start + len(chunk_text)
                 
                 chunks.append(Chunk(
@@ -168,42 +190,49 @@ class DocumentChunker:
                     start_index=current_start,
                     end_index=chunk_end,
                     token_count=current_tokens,
-                    metadata=metadata.copy()
+                    metadata=metadata
                 ))
+                chunk_firsts.append(chunk_first)
                 
                 # Start new chunk with overlap
                 # Keep last few sentences for context
-                overlap_sentences = []
+                overlap_first = i
                 overlap_tokens = 0
-                for j in range(len(current_chunk) - 1, -1, -1):
-                    sent_tokens = self.count_tokens(current_chunk[j])
-                    if overlap_tokens + sent_tokens <= self.chunk_overlap:
-                        overlap_sentences.insert(0, current_chunk[j])
-                        overlap_tokens += sent_tokens
-                    else:
-                        break
+                while (
+                    overlap_first > chunk_first
+                    and overlap_tokens + token_counts[overlap_first - 1] <= self.chunk_overlap
+                ):
+                    overlap_first -= 1
+                    overlap_tokens += token_counts[overlap_first]
                 
-                current_chunk = overlap_sentences
+                chunk_first = overlap_first
                 current_tokens = overlap_tokens
-                current_start = chunk_end - len(' '.join(overlap_sentences))
+                current_start = chunk_end - len(' '.join(sentences[overlap_first:i]))
             
-            current_chunk.append(sentence)
             current_tokens += sentence_tokens
         
         # Add remaining chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
+        if chunk_first < len(sentences):
+            chunk_text = ' '.join(sentences[chunk_first:])
             chunks.append(Chunk(
                 text=chunk_text,
                 start_index=current_start,
                 end_index=current_start + len(chunk_text),
                 token_count=current_tokens,
-                metadata=metadata.copy()
+                metadata=metadata
             ))
+            chunk_firsts.append(chunk_first)
         
         # Re-insert code blocks if they were extracted
         if self.preserve_code_blocks and code_blocks:
-            chunks = self._reinsert_code_blocks(chunks, code_blocks, text)
+            # Markers never span sentences, so a chunk's first code block is
+            # the number of markers in the sentences before it
+            markers_before = [0]
+            for sentence in sentences:
+                markers_before.append(markers_before[-1] + sentence.count('[CODE_BLOCK]'))
+            chunks = self._reinsert_code_blocks(
+                chunks, code_blocks, [markers_before[first] for first in chunk_firsts]
+            )
         
         return chunks
     
@@ -211,7 +240,7 @@ class DocumentChunker:
         self,
         chunks: List[Chunk],
         code_blocks: List[Tuple[int, int, str]],
-        original_text: str
+        first_block_indices: List[int]
     ) -> List[Chunk]:
         """
         Re-insert code blocks into chunks.
@@ -219,17 +248,21 @@ class DocumentChunker:
         Args:
             chunks: List of chunks with [CODE_BLOCK] markers
             code_blocks: List of (start, end, code) tuples
-            original_text: Original text with code blocks
+            first_block_indices: Index into code_blocks of each chunk's first marker
             
         Returns:
             Updated chunks with code blocks restored
         """
-        # Simple approach: replace markers with actual code
-        for chunk in chunks:
-            if '[CODE_BLOCK]' in chunk.text:
-                # Find which code block(s) belong to this chunk
-                for start, end, code in code_blocks:
-                    chunk.text = chunk.text.replace('[CODE_BLOCK]', code, 1)
+        for chunk, first in zip(chunks, first_block_indices):
+            parts = chunk.text.split('[CODE_BLOCK]')
+            if len(parts) == 1:
+                continue
+            
+            pieces = [parts[0]]
+            for (_, _, code), part in zip(code_blocks[first:], parts[1:]):
+                pieces.append(code)
+                pieces.append(part)
+            chunk.text = ''.join(pieces)
         
         return chunks
     
@@ -5,11 +5,13 @@ This module provides embedding generation using sentence-transformers
 with support for Chinese and multi-language content.
 """
 
-from typing import List, Union, Optional
+from typing import Dict, List, Union, Optional
 import hashlib
-import json
+import threading
 from pathlib import Path
 
+import numpy as np
+
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -17,6 +19,12 @@ try:
 except ImportError:
     HAS_SENTENCE_TRANSFORMERS = False
 
+try:
+    from blake3 import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
 
 class Embedder:
     """
@@ -25,7 +33,7 @@ class Embedder:
     Features:
     - Multi-language support (including Chinese)
     - Batch processing
-    - Caching mechanism
+    - Caching mechanism (float32 rows in a memory-mapped file)
     - Fallback to mock embeddings for testing
     """
     
@@ -33,7 +41,8 @@ class Embedder:
         self,
         model_name: str = "paraphrase-multilingual-MiniLM-L12-v2",
         cache_dir: Optional[str] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        backend: Optional[str] = None
     ):
         """
         Initialize the embedder.
@@ -42,6 +51,9 @@ class Embedder:
             model_name: Name of the sentence-transformer model
             cache_dir: Directory for caching embeddings
             use_cache: Whether to use caching
+            backend: Optional sentence-transformers inference backend
+                ("onnx" or "openvino", requires sentence-transformers>=3.2)
+                for faster CPU inference; defaults to PyTorch
         """
         self.model_name = model_name
         self.use_cache = use_cache
@@ -52,11 +64,81 @@ class Embedder:
         
         # Initialize model
         if HAS_SENTENCE_TRANSFORMERS:
-            self.model = SentenceTransformer(model_name)
+            if backend:
+                self.model = SentenceTransformer(model_name, backend=backend)
+            else:
+                self.model = SentenceTransformer(model_name)
+                if self.model.device.type == "cuda":
+                    # fp16 halves memory traffic on GPU with negligible
+                    # effect on similarity rankings
+                    self.model.half()
             self.embedding_dim = self.model.get_sentence_embedding_dimension()
         else:
             self.model = None
             self.embedding_dim = 384  # Default dimension for paraphrase-multilingual-MiniLM
+        
+        # Cache index: cache key -> row in the vectors file
+        self._cache_index: Dict[str, int] = {}
+        self._cache_vectors: Optional[np.memmap] = None
+        self._cache_lock = threading.Lock()
+        if self.cache_dir:
+            self._load_cache_index()
+    
+    @property
+    def _cache_vectors_file(self) -> Path:
+        """Append-only file of float32 embedding rows."""
+        return self.cache_dir / f"embeddings_{self.embedding_dim}d.f32"
+    
+    @property
+    def _cache_keys_file(self) -> Path:
+        """Append-only file of "<cache key> <row>" lines."""
+        return self.cache_dir / f"embeddings_{self.embedding_dim}d.keys"
+    
+    @property
+    def _cache_row_bytes(self) -> int:
+        """Size of one float32 embedding row in bytes."""
+        return self.embedding_dim * np.dtype(np.float32).itemsize
+    
+    def _load_cache_index(self):
+        """
+        Load the cache key index.
+        
+        A partial vectors row or a key line that does not point at a
+        complete row means the files are out of step, so the cache is
+        discarded and rebuilt from scratch.
+        """
+        if not self._cache_keys_file.exists() or not self._cache_vectors_file.exists():
+            return
+        
+        try:
+            size = self._cache_vectors_file.stat().st_size
+            lines = self._cache_keys_file.read_text(encoding='utf-8').splitlines()
+        except OSError:
+            return
+        
+        rows, partial = divmod(size, self._cache_row_bytes)
+        index = {}
+        for line in lines:
+            parts = line.split()
+            if len(parts) != 2 or not parts[1].isdigit() or int(parts[1]) >= rows:
+                partial = True
+                break
+            index[parts[0]] = int(parts[1])
+        
+        if partial:
+            self._reset_cache()
+            return
+        self._cache_index = index
+    
+    def _reset_cache(self):
+        """Delete the cache files and clear the index."""
+        self._cache_index = {}
+        self._cache_vectors = None
+        for path in (self._cache_vectors_file, self._cache_keys_file):
+            try:
+                path.unlink()
+            except OSError:
+                pass
     
     def _get_cache_key(self, text: str) -> str:
         """
@@ -66,10 +148,12 @@ class Embedder:
             text: Input text
             
         Returns:
-            Cache key (SHA-256 hash)
+            Cache key (BLAKE3 hash, or SHA-256 when blake3 is not installed)
         """
-        content = f"{self.model_name}:{text}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        content = f"{self.model_name}:{text}".encode()
+        if HAS_BLAKE3:
+            return blake3(content).hexdigest()
+        return hashlib.sha256(content).hexdigest()
     
     def _load_from_cache(self, cache_key: str) -> Optional[List[float]]:
         """
@@ -84,15 +168,19 @@ class Embedder:
         if not self.use_cache or not self.cache_dir:
             return None
         
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
-                    return data['embedding']
-            except Exception:
-                return None
-        return None
+        row = self._cache_index.get(cache_key)
+        if row is None:
+            return None
+        
+        try:
+            # Remap only when the file has grown past the current mapping
+            if self._cache_vectors is None or row >= len(self._cache_vectors):
+                self._cache_vectors = np.memmap(
+                    self._cache_vectors_file, dtype=np.float32, mode='r'
+                ).reshape(-1, self.embedding_dim)
+            return self._cache_vectors[row].tolist()
+        except Exception:
+            return None
     
     def _save_to_cache(self, cache_key: str, embedding: List[float]):
         """
@@ -105,12 +193,29 @@ class Embedder:
         if not self.use_cache or not self.cache_dir:
             return
         
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({'embedding': embedding}, f)
-        except Exception:
-            pass  # Silently fail on cache write errors
+        data = np.asarray(embedding, dtype=np.float32).tobytes()
+        if len(data) != self._cache_row_bytes:
+            return
+        
+        with self._cache_lock:
+            if cache_key in self._cache_index:
+                return
+            
+            try:
+                # The row comes from where the append actually landed, so
+                # other writers on the same cache_dir cannot shift it
+                with open(self._cache_vectors_file, 'ab') as f:
+                    f.write(data)
+                    f.flush()
+                    end = f.tell()
+                if end % self._cache_row_bytes:
+                    return  # File holds a partial row; rebuilt on next load
+                row = end // self._cache_row_bytes - 1
+                with open(self._cache_keys_file, 'a', encoding='utf-8') as f:
+                    f.write(f"{cache_key} {row}\n")
+                self._cache_index[cache_key] = row
+            except Exception:
+                pass  # Silently fail on cache write errors
     
     def _generate_mock_embedding(self, text: str) -> List[float]:
         """
@@ -122,17 +227,12 @@ class Embedder:
         Returns:
             Mock embedding vector
         """
-        # Simple hash-based mock embedding
-        hash_val = hashlib.sha256(text.encode()).digest()
+        # Simple hash-based mock embedding: SHAKE-128 yields exactly two
+        # bytes per dimension, read as big-endian uint16
+        digest = hashlib.shake_128(text.encode()).digest(self.embedding_dim * 2)
+        values = np.frombuffer(digest, dtype='>u2').astype(np.float32)
         # Convert to floats in range [-1, 1]
-        embedding = [
-            (int.from_bytes(hash_val[i:i+2], 'big') / 32768.0) - 1.0
-            for i in range(0, min(len(hash_val), self.embedding_dim * 2), 2)
-        ]
-        # Pad or trim to correct dimension
-        while len(embedding) < self.embedding_dim:
-            embedding.append(0.0)
-        return embedding[:self.embedding_dim]
+        return (values / 32768.0 - 1.0).tolist()
     
     def embed(self, text: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
         """
@@ -147,17 +247,60 @@ class Embedder:
         is_single = isinstance(text, str)
         texts = [text] if is_single else text
         
-        embeddings = []
+        result = self._embed_texts(texts)
+        return result[0] if is_single else result
+    
+    def embed_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        show_progress: bool = False
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for a batch of texts.
+        
+        Args:
+            texts: List of texts
+            batch_size: Batch size for processing
+            show_progress: Whether to show progress bar
+            
+        Returns:
+            List of embedding vectors
+        """
+        if not texts:
+            return []
+        
+        # The model batches internally, so all uncached texts go in one call
+        return self._embed_texts(texts, batch_size=batch_size, show_progress=show_progress)
+    
+    def _embed_texts(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        show_progress: bool = False
+    ) -> List[List[float]]:
+        """
+        Embed texts, serving cached vectors and encoding the rest in one call.
+        
+        Args:
+            texts: List of texts
+            batch_size: Batch size passed to the model
+            show_progress: Whether to show progress bar
+            
+        Returns:
+            List of embedding vectors in input order
+        """
+        result: List[Optional[List[float]]] = [None] * len(texts)
+        cache_keys = [self._get_cache_key(t) for t in texts] if self.use_cache else []
         texts_to_embed = []
         indices_to_embed = []
         
         # Check cache first
         for i, t in enumerate(texts):
             if self.use_cache:
-                cache_key = self._get_cache_key(t)
-                cached = self._load_from_cache(cache_key)
+                cached = self._load_from_cache(cache_keys[i])
                 if cached:
-                    embeddings.append((i, cached))
+                    result[i] = cached
                     continue
             
             texts_to_embed.append(t)
@@ -169,8 +312,9 @@ class Embedder:
                 # Use real model
                 new_embeddings = self.model.encode(
                     texts_to_embed,
+                    batch_size=batch_size,
                     convert_to_numpy=True,
-                    show_progress_bar=False
+                    show_progress_bar=show_progress
                 ).tolist()
             else:
                 # Use mock embeddings
@@ -181,45 +325,11 @@ class Embedder:
             
             # Add to results and cache
             for idx, emb in zip(indices_to_embed, new_embeddings):
-                embeddings.append((idx, emb))
+                result[idx] = emb
                 if self.use_cache:
-                    cache_key = self._get_cache_key(texts_to_embed[indices_to_embed.index(idx)])
-                    self._save_to_cache(cache_key, emb)
-        
-        # Sort by original index
-        embeddings.sort(key=lambda x: x[0])
-        result = [emb for _, emb in embeddings]
-        
-        return result[0] if is_single else result
-    
-    def embed_batch(
-        self,
-        texts: List[str],
-        batch_size: int = 32,
-        show_progress: bool = False
-    ) -> List[List[float]]:
-        """
-        Generate embeddings for a batch of texts.
-        
-        Args:
-            texts: List of texts
-            batch_size: Batch size for processing
-            show_progress: Whether to show progress bar
-            
-        Returns:
-            List of embedding vectors
-        """
-        if not texts:
-            return []
-        
-        # Process in batches
-        all_embeddings = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            embeddings = self.embed(batch)
-            all_embeddings.extend(embeddings if isinstance(embeddings[0], list) else [embeddings])
+                    self._save_to_cache(cache_keys[idx], emb)
         
-        return all_embeddings
+        return result
     
     def get_embedding_dimension(self) -> int:
         """
@@ -1,31 +1,72 @@
 """
 OCR processor for extracting text from images.
 
-Supports Traditional Chinese and English using PaddleOCR.
+Supports Traditional Chinese and English using PaddleOCR, or RapidOCR
+(PaddleOCR models on ONNX Runtime / OpenVINO) for faster CPU inference.
 """
 
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Literal, Optional, Tuple
 import logging
 import hashlib
 import json
+import os
+import pickle
+import struct
+import threading
 
 try:
-    from paddleocr import PaddleOCR
-    from PIL import Image
+    from PIL import Image, ImageOps
     import cv2
     import numpy as np
-    PADDLEOCR_AVAILABLE = True
+    IMAGING_AVAILABLE = True
 except ImportError:
-    PADDLEOCR_AVAILABLE = False
+    IMAGING_AVAILABLE = False
     np = None  # Define np as None when not available
     cv2 = None
+
+try:
+    from paddleocr import PaddleOCR
+    PADDLEOCR_AVAILABLE = IMAGING_AVAILABLE
+except ImportError:
+    PADDLEOCR_AVAILABLE = False
+
+try:
+    from rapidocr_onnxruntime import RapidOCR as RapidOCRONNX
+    HAS_RAPIDOCR_ONNX = IMAGING_AVAILABLE
+except ImportError:
+    HAS_RAPIDOCR_ONNX = False
+
+try:
+    from rapidocr_openvino import RapidOCR as RapidOCROpenVINO
+    HAS_RAPIDOCR_OPENVINO = IMAGING_AVAILABLE
+except ImportError:
+    HAS_RAPIDOCR_OPENVINO = False
+
+if not (PADDLEOCR_AVAILABLE or HAS_RAPIDOCR_ONNX or HAS_RAPIDOCR_OPENVINO):
     logging.warning("PaddleOCR not available. OCR will use mock implementation.")
 
+try:
+    from blake3 import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
 
 logger = logging.getLogger(__name__)
 
+# Longest side, in pixels, that images are downscaled to before OCR
+MAX_IMAGE_DIMENSION = 2000
+
+# File extension used for each supported cache format
+CACHE_EXTENSIONS = {"pickle": "pkl", "json": "json"}
+
+# Side length of the blank image used to warm up the OCR model
+WARMUP_IMAGE_SIZE = 640
+
 
 @dataclass
 class OCRResult:
@@ -52,7 +93,15 @@ class OCRProcessor:
         languages: List[str] = None,
         confidence_threshold: float = 0.5,
         use_gpu: bool = False,
-        cache_dir: Optional[Path] = None
+        cache_dir: Optional[Path] = None,
+        denoise_strength: Literal["none", "fast", "strong"] = "fast",
+        rec_batch_num: Optional[int] = None,
+        use_angle_cls: bool = False,
+        backend: Literal["paddle", "onnx", "openvino"] = "paddle",
+        rec_model_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        cache_format: Literal["pickle", "json"] = "pickle",
+        memory_cache_size: int = 1024
     ):
         """
         Initialize OCR processor.
@@ -62,31 +111,152 @@ class OCRProcessor:
             confidence_threshold: Minimum confidence for accepting results
             use_gpu: Whether to use GPU acceleration
             cache_dir: Directory for caching OCR results
+            denoise_strength: Preprocessing denoise filter: "none", "fast"
+                (bilateral filter) or "strong" (non-local means, much slower)
+            rec_batch_num: Number of detected text lines recognized per
+                model call (default: 32 on GPU, 1 on CPU)
+            use_angle_cls: Whether to run the text angle classifier on each
+                detected line (only needed for rotated text)
+            backend: Inference engine: "paddle" (PaddleOCR), "onnx"
+                (RapidOCR on ONNX Runtime) or "openvino" (RapidOCR on
+                OpenVINO). CPU backends fall back to "paddle" with use_gpu
+                or when their package is not installed.
+            rec_model_dir: Directory of a custom PaddleOCR recognition
+                model, e.g. an int8 model quantized with PaddleSlim for
+                faster CPU inference (default: PaddleOCR's FP32 model)
+            max_workers: Size of the thread pool used by process_images_batch
+                for cache lookups, preprocessing and cache writes
+                (default: CPU count)
+            cache_format: On-disk cache format: "pickle" (fast, binary) or
+                "json" (human-readable, portable across languages)
+            memory_cache_size: Number of results kept in the in-memory LRU
+                cache in front of the disk cache (0 disables it)
         """
+        if denoise_strength not in ("none", "fast", "strong"):
+            raise ValueError(f"Invalid denoise_strength: {denoise_strength}")
+        if cache_format not in CACHE_EXTENSIONS:
+            raise ValueError(f"Invalid cache_format: {cache_format}")
+        if backend not in ("paddle", "onnx", "openvino"):
+            raise ValueError(f"Invalid backend: {backend}")
+        
         self.languages = languages or ['ch', 'en']
         self.confidence_threshold = confidence_threshold
         self.use_gpu = use_gpu
         self.cache_dir = cache_dir
+        self.denoise_strength = denoise_strength
+        self.rec_batch_num = rec_batch_num or (32 if use_gpu else 1)
+        self.use_angle_cls = use_angle_cls
+        self.backend = backend
+        self.rec_model_dir = rec_model_dir
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.cache_format = cache_format
+        
+        # In-memory LRU cache keyed on (path, mtime, size)
+        self._mem_cache: OrderedDict[Tuple[str, float, int], OCRResult] = OrderedDict()
+        self._mem_cache_max = memory_cache_size
+        self._mem_cache_lock = threading.Lock()
+        
+        # Shared pool for the CPU/I-O stages around the single OCR model
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        # Per-thread preprocessing buffers
+        self._scratch = threading.local()
         
         if cache_dir:
             cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize PaddleOCR if available
+        # Initialize the OCR engine if available
+        self.ocr = self._create_engine()
+        if self.ocr is not None:
+            self._warm_up()
+        else:
+            logger.warning("Using mock OCR implementation")
+    
+    def close(self):
+        """Shut down the batch thread pool; unusable for batches afterwards."""
+        self._pool.shutdown()
+    
+    def __enter__(self) -> "OCRProcessor":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _warm_up(self):
+        """
+        Run one dummy inference so the first real image doesn't pay for
+        graph setup and GPU kernel selection.
+        """
+        if self.use_gpu and self.backend == "paddle":
+            try:
+                import paddle
+                paddle.set_flags({'FLAGS_cudnn_exhaustive_search': True})
+            except Exception as e:
+                logger.debug(f"Could not enable cuDNN autotuning: {e}")
+        
+        try:
+            self._call_engine(np.zeros((WARMUP_IMAGE_SIZE, WARMUP_IMAGE_SIZE, 3), dtype=np.uint8))
+        except Exception as e:
+            logger.warning(f"OCR warm-up failed: {e}")
+    
+    def _create_engine(self):
+        """
+        Create the OCR engine for the configured backend.
+        
+        Updates self.backend when falling back to PaddleOCR.
+        
+        Returns:
+            OCR engine, or None when no engine is installed
+        """
+        if self.backend != "paddle" and self.use_gpu:
+            logger.info(f"OCR backend '{self.backend}' is CPU-only, using PaddleOCR on GPU")
+            self.backend = "paddle"
+        
+        if self.backend == "onnx" and HAS_RAPIDOCR_ONNX:
+            return RapidOCRONNX(
+                use_cls=self.use_angle_cls,
+                intra_op_num_threads=os.cpu_count() or -1
+            )
+        if self.backend == "openvino" and HAS_RAPIDOCR_OPENVINO:
+            return RapidOCROpenVINO(use_cls=self.use_angle_cls)
+        if self.backend != "paddle":
+            logger.warning(f"OCR backend '{self.backend}' not installed, using PaddleOCR")
+            self.backend = "paddle"
+        
         if PADDLEOCR_AVAILABLE:
-            self.ocr = PaddleOCR(
-                use_angle_cls=True,
+            options = {}
+            if self.rec_model_dir:
+                options['rec_model_dir'] = self.rec_model_dir
+            return PaddleOCR(
+                use_angle_cls=self.use_angle_cls,
                 lang='ch',  # Chinese model also supports English
-                use_gpu=use_gpu,
-                show_log=False
+                use_gpu=self.use_gpu,
+                show_log=False,
+                rec_batch_num=self.rec_batch_num,
+                **options
             )
-        else:
-            self.ocr = None
-            logger.warning("Using mock OCR implementation")
+        return None
+    
+    def _call_engine(self, image) -> list:
+        """
+        Run the OCR engine on one image.
+        
+        Returns:
+            Detected lines as PaddleOCR-style [bbox, (text, confidence)] pairs
+        """
+        if self.backend == "paddle":
+            result = self.ocr.ocr(image, cls=self.use_angle_cls)
+            return result[0] if result and result[0] else []
+        
+        # RapidOCR returns ([[bbox, text, confidence], ...] or None, elapsed)
+        result, _ = self.ocr(image)
+        return [(bbox, (text, confidence)) for bbox, text, confidence in result or []]
     
     def process_image(
         self,
         image_path: Path,
-        preprocess: bool = True
+        preprocess: bool = True,
+        boxes: bool = True
     ) -> OCRResult:
         """
         Process a single image and extract text.
@@ -94,16 +264,17 @@ class OCRProcessor:
         Args:
             image_path: Path to image file
             preprocess: Whether to preprocess image
+            boxes: Whether cached results need their text boxes; when
+                False, box data is not read from the disk cache
             
         Returns:
             OCRResult with extracted text
         """
         # Check cache first
-        if self.cache_dir:
-            cached_result = self._load_from_cache(image_path)
-            if cached_result:
-                logger.debug(f"Using cached OCR result for {image_path}")
-                return cached_result
+        stat, cached_result = self._lookup_cache(image_path, boxes)
+        if cached_result:
+            logger.debug(f"Using cached OCR result for {image_path}")
+            return cached_result
         
         # Process image
         if self.ocr is None:
@@ -114,7 +285,8 @@ class OCRProcessor:
         
         # Save to cache
         if self.cache_dir:
-            self._save_to_cache(image_path, result)
+            self._save_to_cache(image_path, result, stat)
+        self._remember(image_path, stat, result)
         
         return result
     
@@ -126,6 +298,10 @@ class OCRProcessor:
         """
         Process multiple images in batch.
         
+        Cached images are resolved up front on the shared thread pool so
+        only cache misses reach the OCR model. Misses go through a pipeline
+        that overlaps preprocessing, inference and cache writes.
+        
         Args:
             image_paths: List of image paths
             preprocess: Whether to preprocess images
@@ -133,61 +309,129 @@ class OCRProcessor:
         Returns:
             List of OCRResults
         """
-        results = []
-        for image_path in image_paths:
-            try:
-                result = self.process_image(image_path, preprocess)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error processing image {image_path}: {e}")
-                # Return empty result on error
-                results.append(OCRResult(
-                    text="",
-                    confidence=0.0,
-                    language="unknown"
-                ))
+        results: List[Optional[OCRResult]] = [None] * len(image_paths)
+        stats: List[Optional[os.stat_result]] = [None] * len(image_paths)
+        
+        # Resolve cache hits first
+        pending = []
+        lookups = self._pool.map(self._safe_lookup_cache, image_paths)
+        for i, (stat, cached_result) in enumerate(lookups):
+            stats[i] = stat
+            if cached_result:
+                results[i] = cached_result
+            else:
+                pending.append(i)
+        
+        if pending:
+            self._run_pipeline(image_paths, pending, preprocess, results, stats)
         
         return results
     
+    def _run_pipeline(
+        self,
+        image_paths: List[Path],
+        pending: List[int],
+        preprocess: bool,
+        results: List[Optional[OCRResult]],
+        stats: List[Optional[os.stat_result]]
+    ):
+        """
+        Run cache misses through a preprocess -> OCR -> cache pipeline.
+        
+        Preprocessing and cache writes run on the shared thread pool, so
+        the single OCR model in the calling thread never waits on disk I/O
+        or CPU image work. At most two images per worker are preprocessed
+        ahead of the model. Results are stored in place.
+        
+        Args:
+            image_paths: Paths passed to process_images_batch
+            pending: Indices of the images to process
+            preprocess: Whether to preprocess images
+            results: Result list to fill in
+            stats: os.stat() result for each image, from the cache lookup
+        """
+        remaining = iter(pending)
+        in_flight = {}
+        writes = []
+        
+        def submit_next():
+            i = next(remaining, None)
+            if i is not None:
+                future = self._pool.submit(self._prepare_image, image_paths[i], preprocess)
+                in_flight[future] = i
+        
+        for _ in range(self.max_workers * 2):
+            submit_next()
+        
+        # Run OCR on preprocessed images as they become ready
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = in_flight.pop(future)
+                submit_next()
+                try:
+                    image = future.result()
+                    if self.ocr is None:
+                        result = self._mock_ocr(image_paths[i])
+                    else:
+                        result = self._run_ocr(image)
+                except Exception as e:
+                    logger.error(f"Error processing image {image_paths[i]}: {e}")
+                    results[i] = self._empty_result()
+                    continue
+                results[i] = result
+                self._remember(image_paths[i], stats[i], result)
+                if self.cache_dir:
+                    writes.append(self._pool.submit(self._save_to_cache, image_paths[i], result, stats[i]))
+        
+        for write in writes:
+            write.result()
+    
+    def _empty_result(self) -> OCRResult:
+        """Result returned for images that could not be processed."""
+        return OCRResult(
+            text="",
+            confidence=0.0,
+            language="unknown"
+        )
+    
+    def _prepare_image(self, image_path: Path, preprocess: bool):
+        """Load the OCR input for an image (preprocessed array or path)."""
+        if self.ocr is None:
+            return None
+        if preprocess:
+            return self._preprocess_image(image_path)
+        return str(image_path)
+    
     def _real_ocr(self, image_path: Path, preprocess: bool) -> OCRResult:
         """Perform real OCR using PaddleOCR."""
-        # Load and optionally preprocess image
-        if preprocess:
-            image = self._preprocess_image(image_path)
-        else:
-            image = str(image_path)
-        
-        # Run OCR
-        result = self.ocr.ocr(image, cls=True)
+        return self._run_ocr(self._prepare_image(image_path, preprocess))
+    
+    def _run_ocr(self, image) -> OCRResult:
+        """Run the OCR engine on a loaded image and parse its output."""
+        lines = self._call_engine(image)
         
         # Parse results
-        if not result or not result[0]:
-            return OCRResult(
-                text="",
-                confidence=0.0,
-                language="unknown"
-            )
+        if not lines:
+            return self._empty_result()
         
-        # Extract text and confidence
-        texts = []
-        confidences = []
-        boxes = []
-        
-        for line in result[0]:
-            bbox, (text, confidence) = line
-            if confidence >= self.confidence_threshold:
-                texts.append(text)
-                confidences.append(confidence)
-                boxes.append((tuple(map(tuple, bbox)), text, confidence))
+        # Filter lines by confidence in one pass over the arrays
+        confidences = np.fromiter((line[1][1] for line in lines), dtype=np.float64, count=len(lines))
+        mask = confidences >= self.confidence_threshold
+        keep = np.flatnonzero(mask)
+        texts = [lines[i][1][0] for i in keep]
+        confidences = confidences[mask]
+        bboxes = np.asarray([line[0] for line in lines], dtype=np.float64)[mask]
+        boxes = list(zip(bboxes.tolist(), texts, confidences.tolist()))
         
         # Combine text
         full_text = '\n'.join(texts)
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        avg_confidence = float(confidences.mean()) if len(confidences) else 0.0
         
         return OCRResult(
             text=full_text,
             confidence=avg_confidence,
-            language='ch',  # PaddleOCR Chinese model
+            language='ch',  # PaddleOCR Chinese model (also used by RapidOCR)
             boxes=boxes
         )
     
@@ -208,92 +452,222 @@ class OCRProcessor:
         Preprocess image for better OCR results.
         
         Steps:
-        1. Read image
-        2. Convert to grayscale
-        3. Resize if too large
-        4. Increase contrast
-        5. Denoise
+        1. Read image as grayscale (Pillow; SIMD-accelerated with Pillow-SIMD),
+           applying its EXIF orientation as cv2.imread does
+        2. Resize if too large
+        3. Increase contrast
+        4. Denoise (per denoise_strength)
         """
-        # Read image
-        img = cv2.imread(str(image_path))
-        
-        if img is None:
-            raise ValueError(f"Cannot read image: {image_path}")
-        
-        # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        # Read image, letting JPEG decode straight to grayscale at a reduced
+        # scale when the source is much larger than needed
+        try:
+            with Image.open(image_path) as img:
+                img.draft('L', (MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION))
+                gray_img = ImageOps.exif_transpose(img).convert('L')
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Cannot read image: {image_path}") from e
         
         # Resize if too large (max 2000px on longest side)
-        height, width = gray.shape
-        max_dimension = max(height, width)
-        if max_dimension > 2000:
-            scale = 2000 / max_dimension
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            gray = cv2.resize(gray, (new_width, new_height))
-        
-        # Increase contrast using CLAHE
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        contrast = clahe.apply(gray)
+        gray_img.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION), Image.Resampling.LANCZOS)
+        gray = np.asarray(gray_img)
+        
+        # Increase contrast using CLAHE; when a denoise pass follows, the
+        # intermediate goes into this thread's scratch buffer
+        clahe, scratch = self._get_thread_scratch(gray.shape)
+        if self.denoise_strength == "none":
+            return clahe.apply(gray)
+        contrast = clahe.apply(gray, scratch)
         
         # Denoise
-        denoised = cv2.fastNlMeansDenoising(contrast, None, 10, 7, 21)
+        if self.denoise_strength == "strong":
+            return cv2.fastNlMeansDenoising(contrast, None, 10, 7, 21)
+        return cv2.bilateralFilter(contrast, d=5, sigmaColor=50, sigmaSpace=50)
+    
+    def _get_thread_scratch(self, shape: Tuple[int, int]):
+        """
+        Get the calling thread's CLAHE instance and a scratch view of shape.
         
-        return denoised
+        The scratch buffer is sized for the largest preprocessed image and
+        reused for every image the thread handles, so it must only hold
+        intermediates that are not returned to the caller.
+        """
+        local = self._scratch
+        if not hasattr(local, 'clahe'):
+            local.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+            local.buffer = np.empty(MAX_IMAGE_DIMENSION * MAX_IMAGE_DIMENSION, dtype=np.uint8)
+        return local.clahe, local.buffer[:shape[0] * shape[1]].reshape(shape)
     
-    def _get_cache_key(self, image_path: Path) -> str:
-        """Generate cache key for image."""
-        # Use file path and modification time
-        stat = image_path.stat()
-        key_str = f"{image_path}_{stat.st_mtime}_{stat.st_size}"
-        return hashlib.sha256(key_str.encode()).hexdigest()
+    def _get_cache_key(self, image_path: Path, stat: Optional[os.stat_result] = None) -> str:
+        """Generate cache key for image (BLAKE3, or SHA-256 without blake3)."""
+        # Use file path, modification time and size, fed to the hasher as raw bytes
+        if stat is None:
+            stat = os.stat(image_path)
+        hasher = blake3() if HAS_BLAKE3 else hashlib.sha256()
+        hasher.update(os.fsencode(image_path))
+        hasher.update(struct.pack("<dq", stat.st_mtime, stat.st_size))
+        return hasher.hexdigest()
     
-    def _load_from_cache(self, image_path: Path) -> Optional[OCRResult]:
-        """Load OCR result from cache."""
-        cache_key = self._get_cache_key(image_path)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+    def _lookup_cache(
+        self,
+        image_path: Path,
+        boxes: bool = True
+    ) -> Tuple[Optional[os.stat_result], Optional[OCRResult]]:
+        """
+        Look an image up in the in-memory cache, then the disk cache.
         
-        if not cache_file.exists():
-            return None
+        The image is stat'ed once here and the result is reused for every
+        cache key, so each lookup costs a single metadata syscall.
+        
+        Args:
+            image_path: Path to image file
+            boxes: Whether to load text boxes from the disk cache; results
+                loaded without them are not kept in memory
+            
+        Returns:
+            Tuple of (os.stat() result or None without caching, cached
+            result or None)
+        """
+        if self._mem_cache_max <= 0 and not self.cache_dir:
+            return None, None
+        
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            if self.cache_dir:
+                raise
+            # Without a disk cache the image is handed to OCR uncached,
+            # which reports unreadable paths itself
+            return None, None
+        if self._mem_cache_max > 0:
+            memory_key = (str(image_path), stat.st_mtime, stat.st_size)
+            with self._mem_cache_lock:
+                cached_result = self._mem_cache.get(memory_key)
+                if cached_result:
+                    self._mem_cache.move_to_end(memory_key)
+                    return stat, cached_result
+        
+        if self.cache_dir:
+            cached_result = self._load_from_cache(image_path, boxes, stat)
+            if cached_result:
+                if boxes:
+                    self._remember(image_path, stat, cached_result)
+                return stat, cached_result
+        
+        return stat, None
+    
+    def _safe_lookup_cache(
+        self,
+        image_path: Path
+    ) -> Tuple[Optional[os.stat_result], Optional[OCRResult]]:
+        """Look up an image in the caches, using an empty result on error."""
+        try:
+            return self._lookup_cache(image_path)
+        except Exception as e:
+            logger.error(f"Error processing image {image_path}: {e}")
+            return None, self._empty_result()
+    
+    def _remember(self, image_path: Path, stat: Optional[os.stat_result], result: OCRResult):
+        """Store a result in the in-memory LRU cache."""
+        if stat is None or self._mem_cache_max <= 0:
+            return
+        memory_key = (str(image_path), stat.st_mtime, stat.st_size)
+        with self._mem_cache_lock:
+            self._mem_cache[memory_key] = result
+            self._mem_cache.move_to_end(memory_key)
+            if len(self._mem_cache) > self._mem_cache_max:
+                self._mem_cache.popitem(last=False)
+    
+    def _get_cache_file(self, image_path: Path, stat: Optional[os.stat_result] = None) -> Path:
+        """Get the cache file path for an image."""
+        cache_key = self._get_cache_key(image_path, stat)
+        return self.cache_dir / f"{cache_key}.{CACHE_EXTENSIONS[self.cache_format]}"
+    
+    def _load_from_cache(
+        self,
+        image_path: Path,
+        boxes: bool = True,
+        stat: Optional[os.stat_result] = None
+    ) -> Optional[OCRResult]:
+        """
+        Load OCR result from cache.
+        
+        Text boxes live in a separate {key}.boxes file so that text-only
+        lookups skip reading them.
+        """
+        cache_file = self._get_cache_file(image_path, stat)
         
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_cache_file(cache_file)
+            
+            result_boxes = data.get('boxes', [])
+            if boxes and not result_boxes:
+                boxes_file = cache_file.with_suffix(f".boxes{cache_file.suffix}")
+                try:
+                    result_boxes = self._read_cache_file(boxes_file)
+                except FileNotFoundError:
+                    pass  # Result had no boxes
             
             return OCRResult(
                 text=data['text'],
                 confidence=data['confidence'],
                 language=data['language'],
-                boxes=data.get('boxes', [])
+                boxes=result_boxes
             )
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.warning(f"Error loading cache for {image_path}: {e}")
             return None
     
-    def _save_to_cache(self, image_path: Path, result: OCRResult):
+    def _save_to_cache(
+        self,
+        image_path: Path,
+        result: OCRResult,
+        stat: Optional[os.stat_result] = None
+    ):
         """Save OCR result to cache."""
-        cache_key = self._get_cache_key(image_path)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        cache_file = self._get_cache_file(image_path, stat)
         
         try:
             data = {
                 'text': result.text,
                 'confidence': result.confidence,
-                'language': result.language,
-                'boxes': result.boxes
+                'language': result.language
             }
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self._write_cache_file(cache_file, data)
+            if result.boxes:
+                boxes_file = cache_file.with_suffix(f".boxes{cache_file.suffix}")
+                self._write_cache_file(boxes_file, result.boxes)
                 
         except Exception as e:
             logger.warning(f"Error saving cache for {image_path}: {e}")
     
+    def _read_cache_file(self, cache_file: Path):
+        """Deserialize a cache file in the configured format."""
+        if self.cache_format == "pickle":
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _write_cache_file(self, cache_file: Path, data):
+        """Serialize data to a cache file in the configured format."""
+        if self.cache_format == "pickle":
+            with open(cache_file, 'wb') as f:
+                pickle.dump(data, f, protocol=5)
+        else:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+    
     def clear_cache(self):
         """Clear all cached OCR results."""
+        with self._mem_cache_lock:
+            self._mem_cache.clear()
         if self.cache_dir and self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            for extension in CACHE_EXTENSIONS.values():
+                for cache_file in self.cache_dir.glob(f"*.{extension}"):
+                    cache_file.unlink()
             logger.info("OCR cache cleared")
 
 
@@ -301,7 +675,15 @@ def create_ocr_processor(
     languages: List[str] = None,
     confidence_threshold: float = 0.5,
     use_gpu: bool = False,
-    cache_dir: Optional[Path] = None
+    cache_dir: Optional[Path] = None,
+    denoise_strength: Literal["none", "fast", "strong"] = "fast",
+    rec_batch_num: Optional[int] = None,
+    use_angle_cls: bool = False,
+    backend: Literal["paddle", "onnx", "openvino"] = "paddle",
+    rec_model_dir: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache_format: Literal["pickle", "json"] = "pickle",
+    memory_cache_size: int = 1024
 ) -> OCRProcessor:
     """
     Factory function to create OCRProcessor.
@@ -311,6 +693,14 @@ def create_ocr_processor(
         confidence_threshold: Minimum confidence threshold
         use_gpu: Whether to use GPU
         cache_dir: Cache directory path
+        denoise_strength: Preprocessing denoise filter ("none", "fast", "strong")
+        rec_batch_num: Text lines recognized per model call
+        use_angle_cls: Whether to classify text line angles
+        backend: Inference engine ("paddle", "onnx", "openvino")
+        rec_model_dir: Custom (e.g. int8-quantized) recognition model directory
+        max_workers: Thread pool size used for batches (default: CPU count)
+        cache_format: On-disk cache format ("pickle", "json")
+        memory_cache_size: In-memory LRU cache size (0 disables it)
         
     Returns:
         Configured OCRProcessor instance
@@ -319,5 +709,13 @@ def create_ocr_processor(
         languages=languages,
         confidence_threshold=confidence_threshold,
         use_gpu=use_gpu,
-        cache_dir=cache_dir
+        cache_dir=cache_dir,
+        denoise_strength=denoise_strength,
+        rec_batch_num=rec_batch_num,
+        use_angle_cls=use_angle_cls,
+        backend=backend,
+        rec_model_dir=rec_model_dir,
+        max_workers=max_workers,
+        cache_format=cache_format,
+        memory_cache_size=memory_cache_size
     )
@@ -6,14 +6,15 @@ vector store, OCR) to process documents from folders into a searchable knowledge
 """
 
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 import time
 
 from ..models.document import Document, DocumentMetadata, DocumentChunk, Relationship, KnowledgeBase, DocumentStatus
-from ..utils.file_scanner import FileScanner, FileChange
+from ..utils.file_scanner import FileScanner, FileChange, FileInfo
 from ..parsers.obsidian_parser import ObsidianParser
 from .chunker import DocumentChunker
 from .embedder import Embedder
@@ -79,9 +80,23 @@ class DocumentProcessor:
         self.file_scanner = file_scanner or FileScanner()
         self.max_workers = max_workers
         
+        # Shared pool for OCR running alongside document processing
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        
         # Track processed documents
         self.documents: Dict[str, Document] = {}
     
+    def close(self):
+        """Shut down this and the OCR processor's thread pools; unusable afterwards."""
+        self._pool.shutdown()
+        self.ocr_processor.close()
+    
+    def __enter__(self) -> "DocumentProcessor":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def process_folders(
         self,
         folders: List[str],
@@ -102,18 +117,24 @@ class DocumentProcessor:
         start_time = time.time()
         stats = ProcessingStats()
         
-        # Scan all folders for files
-        all_changes: List[FileChange] = []
+        # Scan all folders for files in parallel (stat and hashing are I/O-bound)
+        existing_folders = []
         for folder in folders:
-            folder_path = Path(folder)
-            if not folder_path.exists():
+            if not Path(folder).exists():
                 logger.warning(f"Folder does not exist: {folder}")
                 continue
-            
+            existing_folders.append(folder)
+        
+        scans = []
+        if existing_folders:
+            with ThreadPoolExecutor(max_workers=min(len(existing_folders), self.max_workers)) as executor:
+                scans = list(executor.map(self._scan_folder, existing_folders))
+        
+        all_changes: List[FileChange] = []
+        for folder, files in zip(existing_folders, scans):
             # Get file changes
             if force:
                 # Treat all files as new
-                files = self.file_scanner.scan_directory(folder, recursive=True)
                 changes = [
                     FileChange(
                         path=str(f.path),
@@ -125,10 +146,12 @@ class DocumentProcessor:
                     for f in files
                 ]
             else:
-                # Detect actual changes
+                # Detect actual changes against the scanner's state, one
+                # folder at a time
                 changes = self.file_scanner.detect_changes(
                     folder,
-                    recursive=True
+                    recursive=True,
+                    current_files=files
                 )
             
             all_changes.extend(changes)
@@ -136,22 +159,28 @@ class DocumentProcessor:
         # Filter to only .md files for now
         md_changes = [c for c in all_changes if c.path.endswith('.md')]
         
+        # Count change types and split deletions from work in one pass
+        counts: Counter = Counter()
+        deleted: List[FileChange] = []
+        to_process: List[FileChange] = []
+        for change in md_changes:
+            counts[change.change_type] += 1
+            if change.change_type == 'deleted':
+                deleted.append(change)
+            elif change.change_type in ('new', 'modified'):
+                to_process.append(change)
+        
         stats.total_files = len(md_changes)
-        stats.new_files = len([c for c in md_changes if c.change_type == 'new'])
-        stats.modified_files = len([c for c in md_changes if c.change_type == 'modified'])
-        stats.deleted_files = len([c for c in md_changes if c.change_type == 'deleted'])
-        stats.unchanged_files = len([c for c in md_changes if c.change_type == 'unchanged'])
+        stats.new_files = counts['new']
+        stats.modified_files = counts['modified']
+        stats.deleted_files = counts['deleted']
+        stats.unchanged_files = counts['unchanged']
         
         # Process deletions first
-        for change in md_changes:
-            if change.change_type == 'deleted':
-                self._delete_document(change.path)
+        for change in deleted:
+            self._delete_document(change.path)
         
         # Process new and modified files
-        to_process = [
-            c for c in md_changes 
-            if c.change_type in ('new', 'modified')
-        ]
         
         if not to_process:
             logger.info("No files to process")
@@ -210,6 +239,18 @@ class DocumentProcessor:
         
         return stats
     
+    def _scan_folder(self, folder: str) -> List[FileInfo]:
+        """
+        Scan one folder for files.
+        
+        Args:
+            folder: Folder path to scan
+        
+        Returns:
+            List of FileInfo objects for the folder
+        """
+        return self.file_scanner.scan_directory(folder, recursive=True)
+    
     def _process_document(self, file_path: str) -> Optional[Document]:
         """
         Process a single document through the full pipeline.
@@ -247,32 +288,47 @@ class DocumentProcessor:
                 word_count=len(plain_text.split()) if plain_text else 0
             )
             
-            # Process images with OCR if present
-            image_texts = []
-            if extracted_data.get('images'):
-                for image_ref in extracted_data['images']:
-                    # Try to resolve image path relative to document
-                    image_path = path.parent / image_ref
-                    if image_path.exists():
-                        try:
-                            ocr_text = self.ocr_processor.process_image(str(image_path))
-                            if ocr_text:
-                                image_texts.append(ocr_text)
-                        except Exception as e:
-                            logger.debug(f"OCR failed for {image_path}: {e}")
-            
-            # Combine text (document + OCR)
-            combined_text = plain_text
-            if image_texts:
-                combined_text += "\n\n" + "\n\n".join(image_texts)
+            # Start OCR on referenced images so it overlaps chunking and
+            # embedding of the document text
+            ocr_futures = []
+            for image_ref in extracted_data.get('images') or []:
+                # Extract path from dict (images are dicts not strings)
+                image_ref = image_ref.get('path', '') if isinstance(image_ref, dict) else image_ref
+                if not image_ref:
+                    continue
+                
+                # Try to resolve image path relative to document
+                image_path = path.parent / image_ref
+                if image_path.exists():
+                    future = self._pool.submit(self.ocr_processor.process_image, image_path, boxes=False)
+                    ocr_futures.append((image_path, future))
             
             # Chunk text
-            chunk_objects = self.chunker.chunk_text(combined_text)
+            chunk_objects = self.chunker.chunk_text(plain_text)
             chunks_text = [chunk.text for chunk in chunk_objects]
             
             # Generate embeddings
             embeddings = self.embedder.embed_batch(chunks_text)
             
+            # Collect OCR text
+            image_texts = []
+            for image_path, future in ocr_futures:
+                try:
+                    ocr_result = future.result()
+                    if ocr_result.text:
+                        image_texts.append(ocr_result.text)
+                except Exception as e:
+                    logger.debug(f"OCR failed for {image_path}: {e}")
+            
+            # Chunk and embed OCR text after the document text
+            if image_texts:
+                image_chunks_text = [
+                    chunk.text
+                    for chunk in self.chunker.chunk_text("\n\n".join(image_texts))
+                ]
+                chunks_text += image_chunks_text
+                embeddings += self.embedder.embed_batch(image_chunks_text)
+            
             # Create chunks
             chunks = []
             for i, (chunk_text, embedding) in enumerate(zip(chunks_text, embeddings)):
@@ -310,6 +366,7 @@ class DocumentProcessor:
                 parsed_content=parsed_doc.parsed_content,
                 metadata=metadata,
                 chunks=chunks,
+                wikilinks=parsed_doc.wikilinks or [],
                 status=DocumentStatus.ACTIVE
             )
             
@@ -349,12 +406,38 @@ class DocumentProcessor:
         2. Vector similarity
         3. Keyword overlap (future)
         """
+        # Index documents by file name for wikilink resolution
+        paths_by_stem: Dict[str, List[str]] = {}
+        for doc_path in self.documents:
+            paths_by_stem.setdefault(Path(doc_path).stem, []).append(doc_path)
+        
+        # Query similar chunks for all documents in one batched call, using
+        # each document's first chunk embedding as its representation
+        similar: Dict[str, List[Tuple[str, float, Dict[str, Any]]]] = {}
+        query_paths = [
+            doc_path for doc_path, doc in self.documents.items()
+            if doc.chunks and doc.chunks[0].embedding
+        ]
+        if query_paths:
+            try:
+                results = self.vector_store.query(
+                    query_embeddings=[self.documents[p].chunks[0].embedding for p in query_paths],
+                    n_results=6  # Get 6 to filter out self
+                )
+                for i, doc_path in enumerate(query_paths):
+                    similar[doc_path] = list(zip(
+                        results['ids'][i],
+                        results['distances'][i],
+                        results['metadatas'][i]
+                    ))
+            except Exception as e:
+                logger.debug(f"Error finding similar docs: {e}")
+        
         for doc_path, doc in self.documents.items():
             relationships = []
             
-            # 1. Extract wikilinks from content
-            parsed_doc = self.parser.parse_content(doc.raw_content, title=Path(doc_path).stem)
-            wikilinks = parsed_doc.wikilinks or []
+            # 1. Wikilinks were extracted when the document was processed
+            wikilinks = doc.wikilinks
             
             # Find matching documents
             for link in wikilinks:
@@ -362,58 +445,38 @@ class DocumentProcessor:
                 link_target = link.get('target', '') if isinstance(link, dict) else link
                 link_name = link_target.strip()
                 
-                for other_path, other_doc in self.documents.items():
+                for other_path in paths_by_stem.get(link_name, []):
                     if other_path == doc_path:
                         continue
                     
-                    other_name = Path(other_path).stem
-                    if link_name == other_name:
+                    rel = Relationship(
+                        source_doc_id=doc.doc_id,
+                        target_doc_id=self.documents[other_path].doc_id,
+                        relationship_type='wikilink',
+                        strength=1.0,  # Manual link = 100% confidence
+                        manual_link_score=1.0,
+                        metadata={'link': link}
+                    )
+                    relationships.append(rel)
+            
+            # 2. Find similar documents by vector similarity
+            for _, distance, chunk_metadata in similar.get(doc_path, []):
+                # Skip self-references
+                result_doc_id = (chunk_metadata or {}).get('source_file', '')
+                if result_doc_id and result_doc_id != doc.doc_id and result_doc_id in self.documents:
+                    # Check if not already linked
+                    if not any(r.target_doc_id == result_doc_id for r in relationships):
+                        score = 1.0 - distance
                         rel = Relationship(
                             source_doc_id=doc.doc_id,
-                            target_doc_id=other_doc.doc_id,
-                            relationship_type='wikilink',
-                            strength=1.0,  # Manual link = 100% confidence
-                            manual_link_score=1.0,
-                            metadata={'link': link}
+                            target_doc_id=result_doc_id,
+                            relationship_type='similarity',
+                            strength=score,
+                            vector_score=score,
+                            metadata={'distance': distance}
                         )
                         relationships.append(rel)
             
-            # 2. Find similar documents by vector similarity
-            # Use first chunk's embedding as document representation
-            if doc.chunks and doc.chunks[0].embedding:
-                try:
-                    # Query for similar documents
-                    results = self.vector_store.query(
-                        query_embedding=doc.chunks[0].embedding,
-                        top_k=6  # Get 6 to filter out self
-                    )
-                    
-                    for result in results:
-                        # Skip self-references
-                        result_doc_id = result.get('id', '').split('_chunk_')[0]
-                        if result_doc_id and result_doc_id != doc.doc_id:
-                            # Check if not already linked
-                            if not any(r.target_doc_id == result_doc_id for r in relationships):
-                                # Find the target document
-                                target_doc = None
-                                for other_doc in self.documents.values():
-                                    if other_doc.doc_id == result_doc_id:
-                                        target_doc = other_doc
-                                        break
-                                
-                                if target_doc:
-                                    rel = Relationship(
-                                        source_doc_id=doc.doc_id,
-                                        target_doc_id=target_doc.doc_id,
-                                        relationship_type='similarity',
-                                        strength=result.get('score', 0.0),
-                                        vector_score=result.get('score', 0.0),
-                                        metadata={'distance': result.get('distance', 0.0)}
-                                    )
-                                    relationships.append(rel)
-                except Exception as e:
-                    logger.debug(f"Error finding similar docs for {doc_path}: {e}")
-            
             # Sort by strength and keep top 5
             relationships.sort(key=lambda r: r.strength, reverse=True)
             doc.relationships = relationships[:5]
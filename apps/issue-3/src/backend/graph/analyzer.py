@@ -10,12 +10,27 @@ Provides advanced graph analysis capabilities including:
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+import weakref
 import networkx as nx
+import numpy as np
+from scipy.sparse.csgraph import connected_components
 from collections import defaultdict
+from itertools import islice, takewhile
 
+# Optional GPU backend for NetworkX dispatching
+try:
+    import nx_cugraph  # noqa: F401
+    HAS_NX_CUGRAPH = True
+except ImportError:
+    HAS_NX_CUGRAPH = False
+
+from . import louvain
 from .builder import DocumentGraph, GraphNode
 
+# Source nodes sampled for approximate betweenness (exact below this size)
+BETWEENNESS_SAMPLES = 500
+
 
 @dataclass
 class CommunityInfo:
@@ -54,20 +69,60 @@ class GraphAnalyzer:
     
     Provides various graph analysis algorithms including
     community detection, centrality metrics, and path finding.
+    
+    The NetworkX graph, CSR adjacency and computed metrics are shared by
+    all analyzers of the same DocumentGraph until its version changes.
     """
     
-    def __init__(self, graph: DocumentGraph):
+    # id(DocumentGraph) -> (weakref to graph, graph version, shared state)
+    _graph_cache: Dict[int, Tuple[Any, int, Dict[str, Any]]] = {}
+    
+    def __init__(self, graph: DocumentGraph, backend: Optional[str] = None):
         """
         Initialize analyzer with a document graph
         
         Args:
             graph: DocumentGraph to analyze
+            backend: NetworkX dispatch backend for PageRank, betweenness and
+                     Louvain (default: "cugraph" if nx-cugraph is installed)
         """
         self.graph = graph
-        self.nx_graph = graph.to_networkx()
-        self._communities: Optional[List[Set[str]]] = None
-        self._pagerank: Optional[Dict[str, float]] = None
-        self._betweenness: Optional[Dict[str, float]] = None
+        self._shared = self._shared_state(graph)
+        if "nx_graph" not in self._shared:
+            self._shared["nx_graph"] = graph.to_networkx()
+        self.nx_graph = self._shared["nx_graph"]
+        if backend is None and HAS_NX_CUGRAPH:
+            backend = "cugraph"
+        self.backend = backend
+        # NetworkX caches the converted backend graph on self.nx_graph
+        self._backend_kwargs = {"backend": backend} if backend else {}
+        self._communities: Optional[List[Set[str]]] = self._shared.get("communities")
+        self._pagerank: Optional[Dict[str, float]] = self._shared.get("pagerank")
+        self._betweenness: Optional[Dict[str, float]] = self._shared.get("betweenness")
+        # (source, weight) -> (distances, paths) from single-source Dijkstra
+        self._sp_cache: Dict[Tuple[str, str], Tuple[Dict[str, float], Dict[str, List[str]]]] = (
+            self._shared.setdefault("shortest_paths", {})
+        )
+        # Unweighted CSR adjacency of nx_graph, built on first use
+        self._csr, self._idx_to_id, self._id_to_idx = self._shared.get("csr", (None, [], {}))
+    
+    @classmethod
+    def _shared_state(cls, graph: DocumentGraph) -> Dict[str, Any]:
+        """
+        Get the analysis state shared by analyzers of this graph version
+        
+        Entries are dropped when the graph is garbage collected and replaced
+        when graph.version changes (add_node/add_edge and edge pruning).
+        """
+        key = id(graph)
+        entry = cls._graph_cache.get(key)
+        if entry is not None and entry[0]() is graph and entry[1] == graph.version:
+            return entry[2]
+        
+        ref = weakref.ref(graph, lambda _, key=key: cls._graph_cache.pop(key, None))
+        state: Dict[str, Any] = {}
+        cls._graph_cache[key] = (ref, graph.version, state)
+        return state
     
     def detect_communities(self, resolution: float = 1.0) -> List[CommunityInfo]:
         """
@@ -82,41 +137,61 @@ class GraphAnalyzer:
         """
         # Use Louvain community detection
         try:
-            import community as community_louvain
-            partition = community_louvain.best_partition(
+            if self.backend:
+                partition = {}
+                communities_gen = nx.community.louvain_communities(
+                    self.nx_graph,
+                    resolution=resolution,
+                    **self._backend_kwargs
+                )
+                for comm_id, comm in enumerate(communities_gen):
+                    for node in comm:
+                        partition[node] = comm_id
+            else:
+                import community as community_louvain
+                partition = community_louvain.best_partition(
+                    self.nx_graph,
+                    resolution=resolution
+                )
+        except ImportError:
+            # Fallback: in-repo Louvain
+            partition = louvain.best_partition(
                 self.nx_graph,
                 resolution=resolution
             )
-        except ImportError:
-            # Fallback: use NetworkX's greedy modularity
-            communities_gen = nx.community.greedy_modularity_communities(
-                self.nx_graph
-            )
-            partition = {}
-            for comm_id, comm in enumerate(communities_gen):
-                for node in comm:
-                    partition[node] = comm_id
         
         # Group nodes by community
         communities_dict: Dict[int, List[str]] = defaultdict(list)
         for node_id, comm_id in partition.items():
             communities_dict[comm_id].append(node_id)
         
+        # Count edges within each community in one pass over the edge list
+        # (upper triangle of the adjacency, self-loops included)
+        comm_index = {comm_id: i for i, comm_id in enumerate(communities_dict)}
+        csr = self._get_csr()
+        comm_arr = np.fromiter(
+            (comm_index[partition[node_id]] for node_id in self._idx_to_id),
+            dtype=np.int64,
+            count=len(self._idx_to_id)
+        )
+        rows = np.repeat(np.arange(csr.shape[0]), np.diff(csr.indptr))
+        cols = csr.indices
+        same = (rows <= cols) & (comm_arr[rows] == comm_arr[cols])
+        intra_edges = np.bincount(comm_arr[rows[same]], minlength=len(comm_index))
+        
         # Calculate community info
+        pagerank = self.calculate_pagerank()
         community_infos = []
         for comm_id, nodes in communities_dict.items():
             # Calculate density (edges within community / possible edges)
-            subgraph = self.nx_graph.subgraph(nodes)
             n = len(nodes)
             if n > 1:
                 possible_edges = n * (n - 1) / 2
-                actual_edges = subgraph.number_of_edges()
-                density = actual_edges / possible_edges if possible_edges > 0 else 0.0
+                density = int(intra_edges[comm_index[comm_id]]) / possible_edges
             else:
                 density = 0.0
             
             # Calculate average centrality
-            pagerank = self.calculate_pagerank()
             avg_centrality = sum(pagerank.get(node, 0.0) for node in nodes) / len(nodes)
             
             community_infos.append(CommunityInfo(
@@ -129,6 +204,7 @@ class GraphAnalyzer:
         
         # Cache communities
         self._communities = [set(comm.nodes) for comm in community_infos]
+        self._shared["communities"] = self._communities
         
         # Update graph nodes with community info
         for comm_info in community_infos:
@@ -142,14 +218,24 @@ class GraphAnalyzer:
         """
         Calculate PageRank centrality for all nodes
         
+        NetworkX 3's nx.pagerank runs the power iteration on a SciPy sparse
+        matrix (the former pagerank_scipy), so SciPy must be installed.
+        Scores are reused until the graph version or alpha changes.
+        
         Args:
             alpha: Damping parameter (default: 0.85)
         
         Returns:
             Dict mapping node IDs to PageRank scores
         """
-        if self._pagerank is None:
-            self._pagerank = nx.pagerank(self.nx_graph, alpha=alpha)
+        if self._pagerank is None or self._shared.get("pagerank_alpha") != alpha:
+            self._pagerank = nx.pagerank(
+                self.nx_graph,
+                alpha=alpha,
+                **self._backend_kwargs
+            )
+            self._shared["pagerank"] = self._pagerank
+            self._shared["pagerank_alpha"] = alpha
         
         # Update graph nodes
         for node_id, score in self._pagerank.items():
@@ -178,11 +264,21 @@ class GraphAnalyzer:
         """
         Calculate betweenness centrality
         
+        Large graphs use Brandes' estimator over BETWEENNESS_SAMPLES source
+        nodes; graphs up to that size are computed exactly.
+        
         Returns:
             Dict mapping node IDs to betweenness scores
         """
         if self._betweenness is None:
-            self._betweenness = nx.betweenness_centrality(self.nx_graph)
+            k = min(BETWEENNESS_SAMPLES, self.nx_graph.number_of_nodes())
+            self._betweenness = nx.betweenness_centrality(
+                self.nx_graph,
+                k=k,
+                seed=42,
+                **self._backend_kwargs
+            )
+            self._shared["betweenness"] = self._betweenness
         
         return self._betweenness
     
@@ -205,30 +301,43 @@ class GraphAnalyzer:
         if self._communities is None:
             self.detect_communities()
         
-        # Create hub documents
+        # Combined score (weighted average of metrics), aligned to node order
+        node_ids = list(self.graph.nodes)
+        n = len(node_ids)
+        k = min(top_n, n)
+        if k <= 0:
+            return []
+        
+        pr = np.fromiter((pagerank.get(i, 0.0) for i in node_ids), dtype=np.float64, count=n)
+        bt = np.fromiter((betweenness.get(i, 0.0) for i in node_ids), dtype=np.float64, count=n)
+        deg = np.fromiter(
+            (node.degree for node in self.graph.nodes.values()), dtype=np.float64, count=n
+        )
+        neg_score = -(0.5 * pr + 0.3 * bt + 0.2 * (deg / max(1, self.graph.total_nodes)))
+        
+        # Partial sort: everything above the k-th score plus the earliest
+        # nodes tied with it, then order those by score (ties by node order)
+        kth = np.partition(neg_score, k - 1)[k - 1]
+        above = np.flatnonzero(neg_score < kth)
+        tied = np.flatnonzero(neg_score == kth)[:k - len(above)]
+        top = np.concatenate([above, tied])
+        top = top[np.argsort(neg_score[top], kind="stable")]
+        
+        # Create hub documents for the top nodes only
         hubs = []
-        for node_id, node in self.graph.nodes.items():
-            hub = HubDocument(
+        for idx in top.tolist():
+            node_id = node_ids[idx]
+            node = self.graph.nodes[node_id]
+            hubs.append(HubDocument(
                 doc_id=node_id,
                 title=node.title,
                 degree=node.degree,
-                pagerank=pagerank.get(node_id, 0.0),
-                betweenness=betweenness.get(node_id, 0.0),
+                pagerank=float(pr[idx]),
+                betweenness=float(bt[idx]),
                 community=node.community
-            )
-            hubs.append(hub)
-        
-        # Sort by combined score (weighted average of metrics)
-        hubs.sort(
-            key=lambda h: (
-                0.5 * h.pagerank +
-                0.3 * h.betweenness +
-                0.2 * (h.degree / max(1, self.graph.total_nodes))
-            ),
-            reverse=True
-        )
+            ))
         
-        return hubs[:top_n]
+        return hubs
     
     def find_shortest_path(
         self,
@@ -239,6 +348,9 @@ class GraphAnalyzer:
         """
         Find shortest path between two documents
         
+        Paths from each source are computed once with single-source
+        Dijkstra and cached for later queries from the same source.
+        
         Args:
             source_id: Source document ID
             target_id: Target document ID
@@ -250,44 +362,45 @@ class GraphAnalyzer:
         if source_id not in self.nx_graph or target_id not in self.nx_graph:
             return None
         
-        try:
-            # Find shortest path (weighted)
-            path = nx.shortest_path(
+        key = (source_id, weight)
+        if key not in self._sp_cache:
+            self._sp_cache[key] = nx.single_source_dijkstra(
                 self.nx_graph,
                 source=source_id,
-                target=target_id,
                 weight=weight
             )
-            
-            # Calculate total weight
-            total_weight = 0.0
-            for i in range(len(path) - 1):
-                edge_data = self.nx_graph[path[i]][path[i+1]]
-                total_weight += edge_data.get(weight, 1.0)
-            
-            return PathInfo(
-                source_id=source_id,
-                target_id=target_id,
-                path=path,
-                length=len(path) - 1,  # Number of edges
-                total_weight=total_weight
-            )
-        except nx.NetworkXNoPath:
+        distances, paths = self._sp_cache[key]
+        
+        if target_id not in paths:
             return None
+        
+        path = paths[target_id]
+        return PathInfo(
+            source_id=source_id,
+            target_id=target_id,
+            path=path,
+            length=len(path) - 1,  # Number of edges
+            total_weight=float(distances[target_id])  # Sum of edge weights
+        )
     
     def find_all_paths(
         self,
         source_id: str,
         target_id: str,
-        max_length: int = 5
+        max_length: int = 5,
+        k: int = 20
     ) -> List[PathInfo]:
         """
-        Find all simple paths between two documents
+        Find the shortest simple paths between two documents
+        
+        Paths are generated fewest-hops first (Yen's algorithm), so the
+        search stops after k paths instead of enumerating every simple path.
         
         Args:
             source_id: Source document ID
             target_id: Target document ID
             max_length: Maximum path length (number of edges)
+            k: Maximum number of paths to return
         
         Returns:
             List of PathInfo objects
@@ -296,34 +409,35 @@ class GraphAnalyzer:
             return []
         
         try:
-            paths = list(nx.all_simple_paths(
-                self.nx_graph,
-                source=source_id,
-                target=target_id,
-                cutoff=max_length
+            paths = list(islice(
+                takewhile(
+                    lambda p: len(p) - 1 <= max_length,
+                    nx.shortest_simple_paths(self.nx_graph, source_id, target_id)
+                ),
+                k
             ))
-            
-            path_infos = []
-            for path in paths:
-                # Calculate total weight
-                total_weight = 0.0
-                for i in range(len(path) - 1):
-                    edge_data = self.nx_graph[path[i]][path[i+1]]
-                    total_weight += edge_data.get("weight", 1.0)
-                
-                path_infos.append(PathInfo(
-                    source_id=source_id,
-                    target_id=target_id,
-                    path=path,
-                    length=len(path) - 1,
-                    total_weight=total_weight
-                ))
-            
-            # Sort by length and weight
-            path_infos.sort(key=lambda p: (p.length, -p.total_weight))
-            return path_infos
         except nx.NetworkXNoPath:
             return []
+        
+        adj = self.nx_graph.adj
+        path_infos = []
+        for path in paths:
+            # Calculate total weight
+            total_weight = 0.0
+            for u, v in zip(path, path[1:]):
+                total_weight += adj[u][v].get("weight", 1.0)
+            
+            path_infos.append(PathInfo(
+                source_id=source_id,
+                target_id=target_id,
+                path=path,
+                length=len(path) - 1,
+                total_weight=total_weight
+            ))
+        
+        # Sort by length and weight
+        path_infos.sort(key=lambda p: (p.length, -p.total_weight))
+        return path_infos
     
     def get_neighbors(
         self,
@@ -343,24 +457,42 @@ class GraphAnalyzer:
         if node_id not in self.nx_graph:
             return {}
         
-        neighbors_by_distance: Dict[int, List[str]] = defaultdict(list)
-        visited = {node_id}
-        current_level = {node_id}
+        # Breadth-first search over integer node indices
+        csr = self._get_csr()
+        neighbors_by_distance: Dict[int, List[str]] = {}
+        visited = np.zeros(csr.shape[0], dtype=bool)
+        frontier = np.array([self._id_to_idx[node_id]])
+        visited[frontier] = True
         
         for distance in range(1, max_distance + 1):
-            next_level = set()
-            for node in current_level:
-                for neighbor in self.nx_graph.neighbors(node):
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        next_level.add(neighbor)
-                        neighbors_by_distance[distance].append(neighbor)
+            next_level = np.unique(csr[frontier].indices)
+            next_level = next_level[~visited[next_level]]
             
-            if not next_level:
+            if not len(next_level):
                 break
-            current_level = next_level
+            visited[next_level] = True
+            neighbors_by_distance[distance] = [self._idx_to_id[i] for i in next_level.tolist()]
+            frontier = next_level
         
-        return dict(neighbors_by_distance)
+        return neighbors_by_distance
+    
+    def _get_csr(self):
+        """
+        Get the unweighted CSR adjacency matrix of the graph
+        
+        Rows follow self._idx_to_id; built once and cached.
+        """
+        if self._csr is None:
+            self._idx_to_id = list(self.nx_graph)
+            self._id_to_idx = {node_id: i for i, node_id in enumerate(self._idx_to_id)}
+            self._csr = nx.to_scipy_sparse_array(
+                self.nx_graph,
+                nodelist=self._idx_to_id,
+                weight=None,
+                format="csr"
+            )
+            self._shared["csr"] = (self._csr, self._idx_to_id, self._id_to_idx)
+        return self._csr
     
     def calculate_clustering_coefficient(self) -> Dict[str, float]:
         """
@@ -378,20 +510,19 @@ class GraphAnalyzer:
         Returns:
             Dict with various graph statistics
         """
+        # Connected components in one pass over the CSR adjacency
+        num_components, labels = connected_components(self._get_csr(), directed=False)
+        
         stats = {
             "nodes": self.nx_graph.number_of_nodes(),
             "edges": self.nx_graph.number_of_edges(),
             "density": nx.density(self.nx_graph),
-            "is_connected": nx.is_connected(self.nx_graph),
+            "is_connected": num_components == 1,
         }
         
-        # Connected components
         if not stats["is_connected"]:
-            stats["num_components"] = nx.number_connected_components(self.nx_graph)
-            stats["largest_component_size"] = len(max(
-                nx.connected_components(self.nx_graph),
-                key=len
-            ))
+            stats["num_components"] = num_components
+            stats["largest_component_size"] = int(np.bincount(labels).max()) if len(labels) else 0
         
         # Average clustering
         stats["avg_clustering"] = nx.average_clustering(self.nx_graph)
@@ -7,11 +7,15 @@ Builds a knowledge graph from documents based on:
 - 30% Keyword matching (shared terms)
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import AbstractSet, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 import re
 
+import numpy as np
+
 try:
     import networkx as nx
     NETWORKX_AVAILABLE = True
@@ -19,6 +23,12 @@ except ImportError:
     NETWORKX_AVAILABLE = False
     nx = None
 
+try:
+    import scipy.sparse as sp
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
 from ..models.document import Document, Relationship
 
 
@@ -57,12 +67,81 @@ class GraphEdge:
         )
 
 
-@dataclass
+# Relationship types stored as int8 codes in DocumentGraph's edge arrays
+RELATIONSHIP_TYPES = ("computed", "wikilink", "similarity", "keyword")
+
+# Initial capacity of DocumentGraph's edge arrays (doubled when full)
+INITIAL_EDGE_CAPACITY = 64
+
+# Score columns stored per edge, in GraphEdge field order
+EDGE_SCORE_FIELDS = ("weight", "wikilink_score", "vector_score", "keyword_score")
+
+# Distinct (title, tags) combinations whose keywords are kept across builds
+KEYWORD_CACHE_SIZE = 65536
+
+
+@dataclass(init=False, eq=False)
 class DocumentGraph:
-    """Complete document knowledge graph."""
+    """
+    Complete document knowledge graph.
+    
+    Edges are stored column-wise in NumPy arrays (endpoint indices into an
+    ID table, scores and an int8 relationship type code). `edges` returns
+    a tuple of GraphEdge objects built on demand, so add edges with
+    add_edge() or replace them all by assigning to `edges`; changing the
+    returned GraphEdge objects does not modify the graph.
+    
+    `version` increases whenever nodes or edges are added or removed
+    through the graph's methods; GraphAnalyzer uses it to reuse results.
+    """
+    
+    nodes: Dict[str, GraphNode]
+    version: int = field(repr=False)
+    _ids: List[str] = field(repr=False)
+    _id_index: Dict[str, int] = field(repr=False)
+    _rel_types: List[str] = field(repr=False)
+    _src: np.ndarray = field(repr=False)
+    _tgt: np.ndarray = field(repr=False)
+    _scores: np.ndarray = field(repr=False)
+    _rel: np.ndarray = field(repr=False)
+    _num_edges: int = field(repr=False)
+    _adj: Dict[str, List[int]] = field(repr=False)
+    
+    def __init__(
+        self,
+        nodes: Optional[Dict[str, GraphNode]] = None,
+        edges: Iterable[GraphEdge] = ()
+    ):
+        """
+        Initialize the graph.
+        
+        Args:
+            nodes: Nodes by document ID
+            edges: Initial edges (node degrees are left unchanged)
+        """
+        self.nodes = nodes if nodes is not None else {}
+        self.version = 0
+        self._ids = []
+        self._id_index = {}
+        self._rel_types = list(RELATIONSHIP_TYPES)
+        self._src = np.empty(INITIAL_EDGE_CAPACITY, dtype=np.int32)
+        self._tgt = np.empty(INITIAL_EDGE_CAPACITY, dtype=np.int32)
+        self._scores = np.empty((INITIAL_EDGE_CAPACITY, len(EDGE_SCORE_FIELDS)))
+        self._rel = np.empty(INITIAL_EDGE_CAPACITY, dtype=np.int8)
+        self._num_edges = 0
+        self._adj = {}
+        for edge in edges:
+            self._append_edge(edge)
     
-    nodes: Dict[str, GraphNode] = field(default_factory=dict)
-    edges: List[GraphEdge] = field(default_factory=list)
+    def __eq__(self, other) -> bool:
+        """Graphs are equal when their nodes and edges (in order) are equal."""
+        if not isinstance(other, DocumentGraph):
+            return NotImplemented
+        return (
+            self.nodes == other.nodes and
+            self._num_edges == other._num_edges and
+            self.edges == other.edges
+        )
     
     @property
     def total_nodes(self) -> int:
@@ -72,7 +151,54 @@ class DocumentGraph:
     @property
     def total_edges(self) -> int:
         """Get total number of edges."""
-        return len(self.edges)
+        return self._num_edges
+    
+    @property
+    def edges(self) -> Tuple[GraphEdge, ...]:
+        """Get all edges as GraphEdge objects (a read-only snapshot)."""
+        return tuple(self._edge_at(i) for i in range(self._num_edges))
+    
+    @edges.setter
+    def edges(self, edges: Iterable[GraphEdge]):
+        """Replace all edges (node degrees are left unchanged)."""
+        self.version += 1
+        self._num_edges = 0
+        self._adj = {}
+        for edge in edges:
+            self._append_edge(edge)
+    
+    def iter_edges(self) -> Iterator[GraphEdge]:
+        """Iterate over edges, building one GraphEdge at a time."""
+        for i in range(self._num_edges):
+            yield self._edge_at(i)
+    
+    def edge_arrays(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the edge columns without building GraphEdge objects.
+        
+        Returns:
+            Tuple of (id table, source indices, target indices, weights)
+        """
+        n = self._num_edges
+        return self._ids, self._src[:n], self._tgt[:n], self._scores[:n, 0]
+    
+    def id_mask(self, doc_ids: AbstractSet[str]) -> np.ndarray:
+        """
+        Mark document IDs in the ID table used by edge_arrays().
+        
+        Looks up whichever side is smaller: each of doc_ids in the ID index,
+        or each ID table entry in doc_ids.
+        
+        Returns:
+            Boolean array over the ID table, True where the ID is in doc_ids
+        """
+        ids = self._ids
+        if len(doc_ids) < len(ids):
+            mask = np.zeros(len(ids), dtype=bool)
+            index = self._id_index
+            mask[[index[doc_id] for doc_id in doc_ids if doc_id in index]] = True
+            return mask
+        return np.fromiter((doc_id in doc_ids for doc_id in ids), dtype=bool, count=len(ids))
     
     def get_node(self, doc_id: str) -> Optional[GraphNode]:
         """Get node by document ID."""
@@ -81,10 +207,12 @@ class DocumentGraph:
     def add_node(self, node: GraphNode):
         """Add a node to the graph."""
         self.nodes[node.doc_id] = node
+        self.version += 1
     
     def add_edge(self, edge: GraphEdge):
         """Add an edge to the graph."""
-        self.edges.append(edge)
+        self._append_edge(edge)
+        self.version += 1
         
         # Update degree counts
         if edge.source_id in self.nodes:
@@ -94,10 +222,22 @@ class DocumentGraph:
     
     def get_edges_for_node(self, doc_id: str) -> List[GraphEdge]:
         """Get all edges connected to a node."""
-        return [
-            edge for edge in self.edges
-            if edge.source_id == doc_id or edge.target_id == doc_id
-        ]
+        return [self._edge_at(i) for i in self._adj.get(doc_id, [])]
+    
+    def edges_within(self, doc_ids: Set[str]) -> List[GraphEdge]:
+        """
+        Get edges with both endpoints in doc_ids, in insertion order.
+        
+        Walks only the edges of the given nodes (via the adjacency index)
+        rather than every edge in the graph.
+        """
+        ids = self._ids
+        indices: Set[int] = set()
+        for doc_id in doc_ids:
+            for i in self._adj.get(doc_id, ()):
+                if ids[self._src[i]] in doc_ids and ids[self._tgt[i]] in doc_ids:
+                    indices.add(i)
+        return [self._edge_at(i) for i in sorted(indices)]
     
     def to_networkx(self) -> Optional[any]:
         """Convert to NetworkX graph for advanced algorithms."""
@@ -106,9 +246,9 @@ class DocumentGraph:
         
         G = nx.Graph()
         
-        # Add nodes
-        for doc_id, node in self.nodes.items():
-            G.add_node(doc_id, **{
+        # Add nodes in one bulk call
+        G.add_nodes_from(
+            (doc_id, {
                 'title': node.title,
                 'file_path': node.file_path,
                 'tags': node.tags,
@@ -116,20 +256,224 @@ class DocumentGraph:
                 'centrality': node.centrality,
                 'community': node.community
             })
+            for doc_id, node in self.nodes.items()
+        )
         
-        # Add edges
-        for edge in self.edges:
-            G.add_edge(
-                edge.source_id,
-                edge.target_id,
-                weight=edge.weight,
-                wikilink_score=edge.wikilink_score,
-                vector_score=edge.vector_score,
-                keyword_score=edge.keyword_score,
-                relationship_type=edge.relationship_type
+        # Add edges straight from the columns
+        n = self._num_edges
+        ids = self._ids
+        rel_types = self._rel_types
+        G.add_edges_from(
+            (ids[s], ids[t], {
+                'weight': weight,
+                'wikilink_score': wikilink,
+                'vector_score': vector,
+                'keyword_score': keyword,
+                'relationship_type': rel_types[rel]
+            })
+            for s, t, (weight, wikilink, vector, keyword), rel in zip(
+                self._src[:n].tolist(),
+                self._tgt[:n].tolist(),
+                self._scores[:n].tolist(),
+                self._rel[:n].tolist()
             )
+        )
         
         return G
+    
+    def _keep_edges(self, mask: np.ndarray):
+        """Drop edges where mask is False, reindex adjacency and recount degrees."""
+        self.version += 1
+        n = self._num_edges
+        keep = np.flatnonzero(mask[:n])
+        m = len(keep)
+        self._src[:m] = self._src[keep]
+        self._tgt[:m] = self._tgt[keep]
+        self._scores[:m] = self._scores[keep]
+        self._rel[:m] = self._rel[keep]
+        self._num_edges = m
+        
+        self._adj = {}
+        ids = self._ids
+        for i, (s, t) in enumerate(zip(self._src[:m].tolist(), self._tgt[:m].tolist())):
+            self._adj.setdefault(ids[s], []).append(i)
+            if t != s:
+                self._adj.setdefault(ids[t], []).append(i)
+        
+        degrees = (
+            np.bincount(self._src[:m], minlength=len(self._ids)) +
+            np.bincount(self._tgt[:m], minlength=len(self._ids))
+        )
+        for doc_id, node in self.nodes.items():
+            idx = self._id_index.get(doc_id)
+            node.degree = int(degrees[idx]) if idx is not None else 0
+    
+    def _intern(self, doc_id: str) -> int:
+        """Get the ID table index for a document ID, adding it if new."""
+        idx = self._id_index.get(doc_id)
+        if idx is None:
+            idx = len(self._ids)
+            self._ids.append(doc_id)
+            self._id_index[doc_id] = idx
+        return idx
+    
+    def _append_edge(self, edge: GraphEdge):
+        """Append an edge to the columns, doubling capacity when full."""
+        n = self._num_edges
+        if n == len(self._src):
+            capacity = max(INITIAL_EDGE_CAPACITY, 2 * n)
+            self._src = np.resize(self._src, capacity)
+            self._tgt = np.resize(self._tgt, capacity)
+            self._scores = np.resize(self._scores, (capacity, len(EDGE_SCORE_FIELDS)))
+            self._rel = np.resize(self._rel, capacity)
+        
+        if edge.relationship_type not in self._rel_types:
+            self._rel_types.append(edge.relationship_type)
+        
+        self._src[n] = self._intern(edge.source_id)
+        self._tgt[n] = self._intern(edge.target_id)
+        self._scores[n] = (edge.weight, edge.wikilink_score, edge.vector_score, edge.keyword_score)
+        self._rel[n] = self._rel_types.index(edge.relationship_type)
+        self._num_edges = n + 1
+        
+        # Index the edge under both endpoints for get_edges_for_node
+        self._adj.setdefault(edge.source_id, []).append(n)
+        if edge.target_id != edge.source_id:
+            self._adj.setdefault(edge.target_id, []).append(n)
+    
+    def _edge_at(self, i: int) -> GraphEdge:
+        """Build a GraphEdge for the edge at column index i."""
+        weight, wikilink, vector, keyword = self._scores[i].tolist()
+        return GraphEdge(
+            source_id=self._ids[self._src[i]],
+            target_id=self._ids[self._tgt[i]],
+            weight=weight,
+            wikilink_score=wikilink,
+            vector_score=vector,
+            keyword_score=keyword,
+            relationship_type=self._rel_types[self._rel[i]]
+        )
+
+
+class SubgraphView:
+    """
+    Read-only view of a DocumentGraph restricted to a set of node IDs.
+    
+    Nothing is copied: `nodes` looks up the parent's nodes on access and
+    `edges` selects the parent's edges between the view's nodes each time
+    it is read, so the view follows later changes to the parent graph.
+    Use `to_graph()` to get a standalone DocumentGraph (e.g. for
+    GraphAnalyzer or GraphVisualizer).
+    """
+    
+    def __init__(self, graph: DocumentGraph, node_ids: AbstractSet[str]):
+        """
+        Initialize the view.
+        
+        Args:
+            graph: Parent graph
+            node_ids: IDs of the nodes to expose (IDs missing from the
+                      parent graph are ignored)
+        """
+        self.graph = graph
+        self.node_ids = frozenset(node_ids)
+        self.nodes: Mapping = _NodeSubset(graph.nodes, self.node_ids)
+    
+    @property
+    def total_nodes(self) -> int:
+        """Get number of nodes in the view."""
+        return len(self.nodes)
+    
+    @property
+    def total_edges(self) -> int:
+        """Get number of edges in the view."""
+        return len(self.edges)
+    
+    @property
+    def edges(self) -> List[GraphEdge]:
+        """Get the parent's edges with both endpoints in the view."""
+        return self.graph.edges_within(self.node_ids)
+    
+    def iter_edges(self) -> Iterator[GraphEdge]:
+        """Iterate over the view's edges."""
+        return iter(self.edges)
+    
+    def get_node(self, doc_id: str) -> Optional[GraphNode]:
+        """Get node by document ID."""
+        return self.nodes.get(doc_id)
+    
+    def get_edges_for_node(self, doc_id: str) -> List[GraphEdge]:
+        """Get the view's edges connected to a node."""
+        if doc_id not in self.node_ids:
+            return []
+        return [
+            edge for edge in self.graph.get_edges_for_node(doc_id)
+            if edge.source_id in self.node_ids and edge.target_id in self.node_ids
+        ]
+    
+    def edges_within(self, doc_ids: Set[str]) -> List[GraphEdge]:
+        """Get the view's edges with both endpoints in doc_ids."""
+        return self.graph.edges_within(self.node_ids.intersection(doc_ids))
+    
+    def to_graph(self) -> DocumentGraph:
+        """
+        Copy the view into a new DocumentGraph.
+        
+        Nodes are shared with the parent graph and keep their degrees.
+        """
+        return DocumentGraph(nodes=dict(self.nodes), edges=self.edges)
+    
+    def to_networkx(self) -> Optional[any]:
+        """Convert to NetworkX graph for advanced algorithms."""
+        return self.to_graph().to_networkx()
+
+
+class _NodeSubset(Mapping):
+    """Mapping over the entries of a node dict whose keys are in a set."""
+    
+    def __init__(self, nodes: Dict[str, GraphNode], node_ids: FrozenSet[str]):
+        self._nodes = nodes
+        self._node_ids = node_ids
+    
+    def __getitem__(self, doc_id: str) -> GraphNode:
+        if doc_id not in self._node_ids:
+            raise KeyError(doc_id)
+        return self._nodes[doc_id]
+    
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._node_ids and doc_id in self._nodes
+    
+    def __iter__(self) -> Iterator[str]:
+        return (doc_id for doc_id in self._node_ids if doc_id in self._nodes)
+    
+    def __len__(self) -> int:
+        return sum(1 for doc_id in self._node_ids if doc_id in self._nodes)
+
+
+@lru_cache(maxsize=KEYWORD_CACHE_SIZE)
+def _extract_keywords_cached(
+    title: str,
+    tags: Tuple[str, ...],
+    min_length: int
+) -> FrozenSet[str]:
+    """Extract keywords from a document's title and tags (see GraphBuilder._extract_keywords)."""
+    keywords = set()
+    
+    # Add tags
+    for tag in tags:
+        # Handle nested tags: "程式語言/Rust" -> ["程式語言", "Rust"]
+        parts = tag.split('/')
+        for part in parts:
+            if len(part) >= min_length:
+                keywords.add(part.lower())
+    
+    # Add title words
+    words = re.findall(r'\b\w+\b', title.lower())
+    for word in words:
+        if len(word) >= min_length:
+            keywords.add(word)
+    
+    return frozenset(keywords)
 
 
 class GraphBuilder:
@@ -184,14 +528,23 @@ class GraphBuilder:
             )
             graph.add_node(node)
         
-        # Step 2: Build edges with combined scores
-        doc_pairs = []
-        for i, doc1 in enumerate(documents):
-            for doc2 in documents[i+1:]:
-                doc_pairs.append((doc1, doc2))
-        
-        for doc1, doc2 in doc_pairs:
-            edge = self._build_edge(doc1, doc2, embeddings)
+        # Step 2: Build edges with combined scores, taking vector scores
+        # from a similarity matrix computed once for all pairs
+        vector_scores = self._vector_score_matrix(documents, embeddings) if embeddings else None
+        
+        # Extract each document's keywords once and score all overlapping
+        # pairs together
+        keyword_sets = [self._extract_keywords(doc) for doc in documents]
+        keyword_scores = self._keyword_score_pairs(keyword_sets)
+        
+        for i, j in self._candidate_pairs(documents, keyword_scores, vector_scores):
+            edge = self._build_edge(
+                documents[i],
+                documents[j],
+                embeddings,
+                vector_score=float(vector_scores[i, j]) if vector_scores is not None else None,
+                keyword_score=keyword_scores.get((i, j), 0.0)
+            )
             
             # Only add if above threshold
             if edge and edge.weight >= self.min_edge_weight:
@@ -202,11 +555,50 @@ class GraphBuilder:
         
         return graph
     
+    def _candidate_pairs(
+        self,
+        documents: List[Document],
+        keyword_scores: Dict[Tuple[int, int], float],
+        vector_scores: Optional[np.ndarray] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Find document index pairs (i < j) whose edge could reach min_edge_weight.
+        
+        A pair without a wikilink or shared keyword can only score through
+        its vector similarity (50% weight), so such pairs are skipped unless
+        0.5 * vector_score alone reaches the threshold.
+        
+        Returns:
+            Sorted list of (i, j) pairs
+        """
+        index = {doc.doc_id: i for i, doc in enumerate(documents)}
+        pairs: Set[Tuple[int, int]] = set()
+        
+        # Pairs linked by wikilinks (either direction)
+        for i, doc in enumerate(documents):
+            for rel in doc.relationships:
+                if rel.relationship_type in ["wikilink", "wikilink_header"]:
+                    j = index.get(rel.target_doc_id)
+                    if j is not None and j != i:
+                        pairs.add((min(i, j), max(i, j)))
+        
+        # Pairs sharing at least one keyword
+        pairs.update(keyword_scores)
+        
+        # Pairs similar enough on vectors alone
+        if vector_scores is not None:
+            i_idx, j_idx = np.nonzero(np.triu(vector_scores * 0.5 >= self.min_edge_weight, k=1))
+            pairs.update(zip(i_idx.tolist(), j_idx.tolist()))
+        
+        return sorted(pairs)
+    
     def _build_edge(
         self,
         doc1: Document,
         doc2: Document,
-        embeddings: Optional[Dict[str, List[float]]] = None
+        embeddings: Optional[Dict[str, List[float]]] = None,
+        vector_score: Optional[float] = None,
+        keyword_score: Optional[float] = None
     ) -> Optional[GraphEdge]:
         """
         Build an edge between two documents.
@@ -215,6 +607,9 @@ class GraphBuilder:
         - Wikilinks (20% weight)
         - Vector similarity (50% weight)
         - Keyword matching (30% weight)
+        
+        Precomputed vector_score (see _vector_score_matrix) and
+        keyword_score values are used as-is instead of being calculated.
         """
         edge = GraphEdge(
             source_id=doc1.doc_id,
@@ -225,7 +620,9 @@ class GraphBuilder:
         edge.wikilink_score = self._calculate_wikilink_score(doc1, doc2)
         
         # Calculate vector similarity score (50%)
-        if embeddings:
+        if vector_score is not None:
+            edge.vector_score = vector_score
+        elif embeddings:
             edge.vector_score = self._calculate_vector_score(
                 doc1.doc_id,
                 doc2.doc_id,
@@ -233,7 +630,10 @@ class GraphBuilder:
             )
         
         # Calculate keyword score (30%)
-        edge.keyword_score = self._calculate_keyword_score(doc1, doc2)
+        if keyword_score is not None:
+            edge.keyword_score = keyword_score
+        else:
+            edge.keyword_score = self._calculate_keyword_score(doc1, doc2)
         
         # Combine scores
         edge.calculate_weight()
@@ -298,6 +698,83 @@ class GraphBuilder:
         # Normalize to [0, 1]
         return max(0.0, min(1.0, (similarity + 1) / 2))
     
+    def _vector_score_matrix(
+        self,
+        documents: List[Document],
+        embeddings: Dict[str, List[float]]
+    ) -> np.ndarray:
+        """
+        Calculate vector similarity scores for all document pairs at once.
+        
+        Stacks the embeddings into an (N, D) matrix, L2-normalizes each row
+        and computes every cosine similarity with a single matrix product.
+        
+        Returns (N, N) scores in [0, 1], indexed like documents; pairs
+        involving a document without a (non-zero) embedding score 0.
+        """
+        scores = np.zeros((len(documents), len(documents)), dtype=np.float32)
+        
+        rows = [i for i, doc in enumerate(documents) if doc.doc_id in embeddings]
+        if not rows:
+            return scores
+        
+        vectors = np.asarray([embeddings[documents[i].doc_id] for i in rows], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        valid = norms[:, 0] > 0
+        vectors = vectors[valid] / norms[valid]
+        rows = np.asarray(rows)[valid]
+        
+        # Cosine similarity normalized to [0, 1]
+        similarity = vectors @ vectors.T
+        scores[np.ix_(rows, rows)] = np.clip((similarity + 1) * 0.5, 0.0, 1.0)
+        return scores
+    
+    def _keyword_score_pairs(self, keyword_sets: List[Set[str]]) -> Dict[Tuple[int, int], float]:
+        """
+        Calculate Jaccard keyword scores for every pair sharing a keyword.
+        
+        Keyword sets are encoded as rows of a sparse (N, V) indicator matrix
+        K, so all intersection counts come from one sparse product K @ K.T.
+        Falls back to an inverted keyword index without SciPy.
+        
+        Returns:
+            Dict mapping document index pairs (i < j) to their Jaccard score;
+            pairs without shared keywords are omitted (score 0)
+        """
+        if not HAS_SCIPY:
+            docs_by_keyword: Dict[str, List[int]] = {}
+            for i, keywords in enumerate(keyword_sets):
+                for keyword in keywords:
+                    docs_by_keyword.setdefault(keyword, []).append(i)
+            scores = {}
+            for doc_indices in docs_by_keyword.values():
+                for a, i in enumerate(doc_indices):
+                    for j in doc_indices[a + 1:]:
+                        if (i, j) not in scores:
+                            scores[(i, j)] = self._jaccard(keyword_sets[i], keyword_sets[j])
+            return scores
+        
+        vocabulary: Dict[str, int] = {}
+        indices: List[int] = []
+        indptr = [0]
+        for keywords in keyword_sets:
+            indices.extend(vocabulary.setdefault(keyword, len(vocabulary)) for keyword in keywords)
+            indptr.append(len(indices))
+        if not indices:
+            return {}
+        
+        matrix = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(keyword_sets), len(vocabulary))
+        )
+        sizes = np.diff(indptr)
+        
+        overlap = sp.triu(matrix @ matrix.T, k=1).tocoo()
+        union = sizes[overlap.row] + sizes[overlap.col] - overlap.data
+        scores = overlap.data / union
+        
+        return dict(zip(zip(overlap.row.tolist(), overlap.col.tolist()), scores.tolist()))
+    
     def _calculate_keyword_score(self, doc1: Document, doc2: Document) -> float:
         """
         Calculate keyword overlap score using Jaccard similarity.
@@ -309,19 +786,20 @@ class GraphBuilder:
         
         Returns Jaccard similarity in [0, 1] range.
         """
-        keywords1 = self._extract_keywords(doc1)
-        keywords2 = self._extract_keywords(doc2)
-        
+        return self._jaccard(self._extract_keywords(doc1), self._extract_keywords(doc2))
+    
+    @staticmethod
+    def _jaccard(keywords1: Set[str], keywords2: Set[str]) -> float:
+        """Jaccard similarity of two keyword sets (0.0 if either is empty)."""
         if not keywords1 or not keywords2:
             return 0.0
         
-        # Jaccard similarity
         intersection = len(keywords1 & keywords2)
         union = len(keywords1 | keywords2)
         
         return intersection / union if union > 0 else 0.0
     
-    def _extract_keywords(self, doc: Document) -> Set[str]:
+    def _extract_keywords(self, doc: Document) -> FrozenSet[str]:
         """
         Extract keywords from document.
         
@@ -329,25 +807,15 @@ class GraphBuilder:
         - Tags (highest priority)
         - Title words
         - High-frequency terms (simple extraction)
-        """
-        keywords = set()
-        
-        # Add tags
-        for tag in doc.metadata.tags:
-            # Handle nested tags: "程式語言/Rust" -> ["程式語言", "Rust"]
-            parts = tag.split('/')
-            for part in parts:
-                if len(part) >= self.keyword_min_length:
-                    keywords.add(part.lower())
         
-        # Add title words
-        title = doc.metadata.title or doc.file_path.stem
-        words = re.findall(r'\b\w+\b', title.lower())
-        for word in words:
-            if len(word) >= self.keyword_min_length:
-                keywords.add(word)
-        
-        return keywords
+        Results are cached by (title, tags), so unchanged documents are
+        not re-tokenized across builds.
+        """
+        return _extract_keywords_cached(
+            doc.metadata.title or doc.file_path.stem,
+            tuple(doc.metadata.tags),
+            self.keyword_min_length
+        )
     
     def _prune_edges(self, graph: DocumentGraph):
         """
@@ -358,38 +826,23 @@ class GraphBuilder:
         if self.max_edges_per_node <= 0:
             return
         
-        # Group edges by node
-        node_edges: Dict[str, List[Tuple[GraphEdge, float]]] = {}
-        for edge in graph.edges:
-            if edge.source_id not in node_edges:
-                node_edges[edge.source_id] = []
-            if edge.target_id not in node_edges:
-                node_edges[edge.target_id] = []
-            # Store edge with weight for sorting
-            node_edges[edge.source_id].append((edge, edge.weight))
-            node_edges[edge.target_id].append((edge, edge.weight))
-        
-        # Find edges to keep - each node votes for its top N edges
-        edge_votes: Dict[int, int] = {}  # edge id -> vote count
-        for node_id, edge_list in node_edges.items():
-            # Sort by weight descending
-            edge_list.sort(key=lambda x: x[1], reverse=True)
-            
-            # Vote for top N edges
-            for edge, _ in edge_list[:self.max_edges_per_node]:
-                edge_id = id(edge)
-                edge_votes[edge_id] = edge_votes.get(edge_id, 0) + 1
-        
-        # Keep edges that got at least one vote
-        # This ensures both ends of the edge are satisfied
-        edges_to_keep = set(edge_votes.keys())
-        
-        # Filter graph edges
-        graph.edges = [e for e in graph.edges if id(e) in edges_to_keep]
-        
-        # Recalculate degrees
-        for node in graph.nodes.values():
-            node.degree = 0
-        for edge in graph.edges:
-            graph.nodes[edge.source_id].degree += 1
-            graph.nodes[edge.target_id].degree += 1
+        _, src, tgt, weight = graph.edge_arrays()
+        num_edges = len(weight)
+        
+        # List every edge once per endpoint and order each node's entries by
+        # weight descending (ties in insertion order)
+        endpoints = np.concatenate([src, tgt])
+        edge_idx = np.concatenate([np.arange(num_edges), np.arange(num_edges)])
+        order = np.lexsort((edge_idx, -np.concatenate([weight, weight]), endpoints))
+        endpoints = endpoints[order]
+        
+        # Rank of each entry within its node's run; each node votes for its
+        # top N edges and edges with at least one vote are kept, which
+        # satisfies both ends
+        run_start = np.flatnonzero(np.r_[True, endpoints[1:] != endpoints[:-1]])
+        run_length = np.diff(np.r_[run_start, len(endpoints)])
+        rank = np.arange(len(endpoints)) - np.repeat(run_start, run_length)
+        
+        keep = np.zeros(num_edges, dtype=bool)
+        keep[edge_idx[order][rank < self.max_edges_per_node]] = True
+        graph._keep_edges(keep)
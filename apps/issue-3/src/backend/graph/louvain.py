@@ -0,0 +1,336 @@
+"""
+Louvain community detection.
+
+Small in-repo Louvain used when python-louvain is not installed:
+- Local moving scores each candidate community by its modularity gain
+  (ΔQ) from the vertex's links into it, in O(deg(v)) per vertex
+- Communities are then aggregated into a smaller graph and the process
+  repeats until no vertex moves
+
+The graph is held as CSR arrays (indptr, indices, data) with community
+volumes in a float64 array. The local-moving loop touches only these
+arrays and is JIT-compiled when Numba is installed, in which case a
+parallel variant moves all vertices at once from the previous partition.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+# Minimum modularity gain (scaled by m) for a vertex to change community
+MIN_GAIN = 1e-12
+
+# Upper bound on synchronous passes per level in the parallel local move
+MAX_PARALLEL_PASSES = 100
+
+
+def best_partition(
+    graph: Any,
+    resolution: float = 1.0,
+    weight: str = "weight"
+) -> Dict[Any, int]:
+    """
+    Partition a NetworkX graph into communities with the Louvain method.
+
+    Args:
+        graph: Undirected NetworkX graph
+        resolution: Resolution parameter (higher = more communities)
+        weight: Edge attribute to use as weight (missing = 1.0)
+
+    Returns:
+        Dict mapping each node to a community ID (0..C-1)
+    """
+    nodes = list(graph)
+    if not nodes:
+        return {}
+
+    indptr, indices, data, degrees = _to_csr(graph, nodes, weight)
+    m2 = float(degrees.sum())  # 2m
+    node_comm = np.arange(len(nodes))
+    local_move = _local_move_parallel if HAS_NUMBA else _local_move
+
+    if m2 > 0:
+        while True:
+            comm = np.arange(len(degrees))
+            if not local_move(indptr, indices, data, degrees, m2, resolution, comm):
+                break
+            _, comm = np.unique(comm, return_inverse=True)
+            node_comm = comm[node_comm]
+            indptr, indices, data, degrees = _aggregate(indptr, indices, data, degrees, comm)
+
+    _, node_comm = np.unique(node_comm, return_inverse=True)
+    return dict(zip(nodes, node_comm.tolist()))
+
+
+def _to_csr(
+    graph: Any,
+    nodes: List[Any],
+    weight: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build symmetric CSR arrays and weighted degrees for a NetworkX graph.
+
+    Self-loops count twice towards a vertex's degree, as in NetworkX.
+    """
+    index = {node: i for i, node in enumerate(nodes)}
+    rows: List[int] = []
+    cols: List[int] = []
+    weights: List[float] = []
+    for u, v, w in graph.edges(data=weight, default=1.0):
+        i, j = index[u], index[v]
+        rows.append(i)
+        cols.append(j)
+        weights.append(w)
+        if i != j:
+            rows.append(j)
+            cols.append(i)
+            weights.append(w)
+
+    rows_arr = np.asarray(rows, dtype=np.int64)
+    cols_arr = np.asarray(cols, dtype=np.int64)
+    data = np.asarray(weights, dtype=np.float64)
+    loops = rows_arr == cols_arr
+
+    degrees = (
+        np.bincount(rows_arr, weights=data, minlength=len(nodes)) +
+        np.bincount(rows_arr[loops], weights=data[loops], minlength=len(nodes))
+    )
+    return _csr(rows_arr, cols_arr, data, len(nodes)) + (degrees,)
+
+
+def _csr(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    data: np.ndarray,
+    n: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sort (row, col, weight) entries into CSR arrays."""
+    order = np.argsort(rows, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols[order], data[order]
+
+
+def _local_move(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    degrees: np.ndarray,
+    m2: float,
+    resolution: float,
+    comm: np.ndarray
+) -> bool:
+    """
+    Move vertices to the neighboring community with the best ΔQ.
+
+    For vertex v with degree k_v, taken out of its community, joining
+    community c gains k_v_in[c] - resolution * k_v * vol[c] / 2m (ΔQ
+    scaled by m), where k_v_in[c] is the weight of v's links into c.
+    Repeats until a full pass moves nothing. comm is updated in place.
+
+    Returns:
+        True if any vertex changed community
+    """
+    n = len(degrees)
+    vol = np.zeros(n)
+    for v in range(n):
+        vol[comm[v]] += degrees[v]
+    links = np.zeros(n)
+    seen = np.zeros(n, dtype=np.bool_)
+    touched = np.empty(n, dtype=np.int64)
+    moved = False
+
+    improved = True
+    while improved:
+        improved = False
+        for v in range(n):
+            current = comm[v]
+            k_v = degrees[v]
+
+            # Weight of v's links into each neighboring community
+            num_touched = 0
+            for p in range(indptr[v], indptr[v + 1]):
+                u = indices[p]
+                if u == v:
+                    continue
+                c = comm[u]
+                if not seen[c]:
+                    seen[c] = True
+                    touched[num_touched] = c
+                    num_touched += 1
+                links[c] += data[p]
+
+            vol[current] -= k_v
+            best = current
+            best_gain = links[current] - resolution * k_v * vol[current] / m2
+            for t in range(num_touched):
+                c = touched[t]
+                gain = links[c] - resolution * k_v * vol[c] / m2
+                if gain > best_gain + MIN_GAIN:
+                    best = c
+                    best_gain = gain
+            vol[best] += k_v
+
+            # Reset only the scratch entries this vertex touched
+            for t in range(num_touched):
+                c = touched[t]
+                links[c] = 0.0
+                seen[c] = False
+
+            if best != current:
+                comm[v] = best
+                improved = True
+                moved = True
+
+    return moved
+
+
+def _local_move_parallel(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    degrees: np.ndarray,
+    m2: float,
+    resolution: float,
+    comm: np.ndarray
+) -> bool:
+    """
+    Synchronous variant of _local_move where every vertex picks its best
+    community from the previous pass's partition (safe to run with prange).
+
+    Ties in ΔQ go to the lowest community label, and a singleton vertex
+    only joins another singleton with a lower label, so two singletons
+    cannot keep swapping. comm and the community volumes are updated
+    serially after each pass, and a pass is only kept if it improves the
+    partition. _local_move then finishes the level sequentially.
+
+    Returns:
+        True if any vertex changed community
+    """
+    n = len(degrees)
+    new_comm = comm.copy()
+    moved = False
+    quality = _partition_quality(indptr, indices, data, degrees, m2, resolution, comm)
+
+    for _ in range(MAX_PARALLEL_PASSES):
+        vol = np.zeros(n)
+        size = np.zeros(n, dtype=np.int64)
+        for v in range(n):
+            vol[comm[v]] += degrees[v]
+            size[comm[v]] += 1
+
+        for v in prange(n):
+            start = indptr[v]
+            end = indptr[v + 1]
+            current = comm[v]
+            k_v = degrees[v]
+
+            # Neighbors grouped by community, ascending by label
+            nbr_comm = comm[indices[start:end]]
+            order = np.argsort(nbr_comm)
+
+            links_current = 0.0
+            for p in range(start, end):
+                if indices[p] != v and comm[indices[p]] == current:
+                    links_current += data[p]
+            best = current
+            best_gain = links_current - resolution * k_v * (vol[current] - k_v) / m2
+
+            i = 0
+            while i < end - start:
+                c = nbr_comm[order[i]]
+                links = 0.0
+                while i < end - start and nbr_comm[order[i]] == c:
+                    if indices[start + order[i]] != v:
+                        links += data[start + order[i]]
+                    i += 1
+                if c == current:
+                    continue
+                gain = links - resolution * k_v * vol[c] / m2
+                if gain > best_gain + MIN_GAIN:
+                    best = c
+                    best_gain = gain
+
+            # Minimum-label rule for singleton-to-singleton moves
+            if best > current and size[current] == 1 and size[best] == 1:
+                best = current
+            new_comm[v] = best
+
+        # Simultaneous moves can cancel out; keep the pass only if the
+        # partition improved as a whole
+        new_quality = _partition_quality(indptr, indices, data, degrees, m2, resolution, new_comm)
+        if new_quality <= quality + MIN_GAIN:
+            break
+        quality = new_quality
+        comm[:] = new_comm
+        moved = True
+
+    # Finish sequentially from where the parallel passes stalled
+    if _local_move(indptr, indices, data, degrees, m2, resolution, comm):
+        moved = True
+
+    return moved
+
+
+def _partition_quality(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    degrees: np.ndarray,
+    m2: float,
+    resolution: float,
+    comm: np.ndarray
+) -> float:
+    """
+    Modularity of a partition up to constants (scaled by 2m, self-loops
+    excluded), consistent with the gains used in local moving.
+    """
+    n = len(degrees)
+    vol = np.zeros(n)
+    for v in range(n):
+        vol[comm[v]] += degrees[v]
+
+    internal = 0.0
+    for v in range(n):
+        for p in range(indptr[v], indptr[v + 1]):
+            u = indices[p]
+            if u != v and comm[u] == comm[v]:
+                internal += data[p]
+
+    return internal - resolution * np.sum(vol * vol) / m2
+
+
+if HAS_NUMBA:
+    _local_move = njit(cache=True)(_local_move)
+    _partition_quality = njit(cache=True)(_partition_quality)
+    _local_move_parallel = njit(cache=True, parallel=True)(_local_move_parallel)
+
+
+def _aggregate(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    degrees: np.ndarray,
+    comm: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collapse each community into a single vertex.
+
+    Edge weights between communities are summed. Degrees are carried over
+    as community volumes, so internal weight is kept without self-loop
+    bookkeeping (local moving ignores self-loops).
+    """
+    n = int(comm.max()) + 1
+    rows = np.repeat(comm, np.diff(indptr))
+    cols = comm[indices]
+    keys, inverse = np.unique(rows * n + cols, return_inverse=True)
+    summed = np.bincount(inverse, weights=data)
+    new_indptr, new_indices, new_data = _csr(keys // n, keys % n, summed, n)
+    return new_indptr, new_indices, new_data, np.bincount(comm, weights=degrees, minlength=n)
@@ -8,13 +8,32 @@ Exports document knowledge graphs in various formats:
 - GraphML (standard graph format)
 """
 
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Set
+from dataclasses import dataclass
+from typing import IO, Dict, Iterator, List, Optional, Set, Tuple
+import heapq
+import io
 import json
 
-from .builder import DocumentGraph, GraphNode, GraphEdge
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from .builder import DocumentGraph, GraphNode, GraphEdge, SubgraphView
 from .analyzer import GraphAnalyzer
 
+# Translation table for escaping XML special characters in one pass
+XML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    "\"": "&quot;",
+    "'": "&apos;",
+})
+
 
 @dataclass
 class D3Node:
@@ -48,6 +67,10 @@ class GraphVisualizer:
     Exports graphs in various formats for different visualization tools.
     """
     
+    # Mermaid edge connectors indexed by (weight > 0.4) + (weight > 0.7):
+    # weak, medium, strong
+    CONNECTORS = ("-.->", "-->", "==>")
+    
     def __init__(self, graph: DocumentGraph):
         """
         Initialize visualizer with a document graph
@@ -56,12 +79,28 @@ class GraphVisualizer:
             graph: DocumentGraph to visualize
         """
         self.graph = graph
-        self.analyzer = GraphAnalyzer(graph)
+        self._analyzer = GraphAnalyzer(graph)
+        self._analyzer_version = graph.version
+    
+    @property
+    def analyzer(self) -> GraphAnalyzer:
+        """
+        GraphAnalyzer for the current graph version
+        
+        Replaced when graph.version changes, so exports after add_node or
+        add_edge see the new graph while repeated exports of an unchanged
+        graph reuse its PageRank scores.
+        """
+        if self._analyzer_version != self.graph.version:
+            self._analyzer = GraphAnalyzer(self.graph)
+            self._analyzer_version = self.graph.version
+        return self._analyzer
     
     def to_d3_json(
         self,
         min_edge_weight: float = 0.0,
-        max_nodes: Optional[int] = None
+        max_nodes: Optional[int] = None,
+        pretty: bool = False
     ) -> str:
         """
         Export graph to D3.js force-directed graph format
@@ -69,6 +108,7 @@ class GraphVisualizer:
         Args:
             min_edge_weight: Minimum edge weight to include
             max_nodes: Maximum number of nodes (keeps highest centrality)
+            pretty: Indent the JSON by 2 spaces (default: compact)
         
         Returns:
             JSON string in D3.js format
@@ -80,47 +120,47 @@ class GraphVisualizer:
         nodes_to_include = set(self.graph.nodes.keys())
         if max_nodes and len(nodes_to_include) > max_nodes:
             # Keep top N by centrality
-            sorted_nodes = sorted(
+            top_nodes = heapq.nlargest(
+                max_nodes,
                 self.graph.nodes.items(),
-                key=lambda x: x[1].centrality,
-                reverse=True
+                key=lambda x: x[1].centrality
             )
-            nodes_to_include = {node_id for node_id, _ in sorted_nodes[:max_nodes]}
+            nodes_to_include = {node_id for node_id, _ in top_nodes}
         
-        # Create D3 nodes
+        # Create D3 nodes (same fields as D3Node, built as plain dicts)
         d3_nodes = []
         for node_id in nodes_to_include:
             node = self.graph.nodes[node_id]
-            d3_nodes.append(D3Node(
-                id=node_id,
-                name=node.title,
-                group=node.community if node.community is not None else 0,
-                degree=node.degree,
-                centrality=node.centrality
-            ))
-        
-        # Create D3 links (only between included nodes)
-        d3_links = []
-        for edge in self.graph.edges:
-            if (edge.source_id in nodes_to_include and
-                edge.target_id in nodes_to_include and
-                edge.weight >= min_edge_weight):
-                d3_links.append(D3Link(
-                    source=edge.source_id,
-                    target=edge.target_id,
-                    value=edge.weight
-                ))
+            d3_nodes.append({
+                "id": node_id,
+                "name": node.title,
+                "group": node.community if node.community is not None else 0,
+                "degree": node.degree,
+                "centrality": node.centrality
+            })
         
-        # Create D3 graph
-        d3_graph = D3Graph(nodes=d3_nodes, links=d3_links)
+        # Create D3 links (only between included nodes, same fields as D3Link)
+        ids, src, tgt, weights = self._select_edges(nodes_to_include, min_edge_weight)
+        d3_links = [
+            {"source": ids[s], "target": ids[t], "value": w}
+            for s, t, w in zip(src, tgt, weights)
+        ]
         
         # Convert to JSON
         graph_dict = {
-            "nodes": [asdict(node) for node in d3_graph.nodes],
-            "links": [asdict(link) for link in d3_graph.links]
+            "nodes": d3_nodes,
+            "links": d3_links
         }
         
-        return json.dumps(graph_dict, ensure_ascii=False, indent=2)
+        if HAS_ORJSON:
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(graph_dict, option=option).decode("utf-8")
+        
+        if pretty:
+            return json.dumps(graph_dict, ensure_ascii=False, indent=2)
+        return json.dumps(graph_dict, ensure_ascii=False, separators=(",", ":"))
     
     def to_mermaid(
         self,
@@ -139,18 +179,27 @@ class GraphVisualizer:
         Returns:
             Mermaid diagram syntax string
         """
-        lines = [f"graph {direction}"]
+        return "\n".join(self._iter_mermaid(direction, max_nodes, min_edge_weight))
+    
+    def _iter_mermaid(
+        self,
+        direction: str,
+        max_nodes: Optional[int],
+        min_edge_weight: float
+    ) -> Iterator[str]:
+        """Yield the Mermaid diagram line by line (see to_mermaid)"""
+        yield f"graph {direction}"
         
         # Get nodes to include
         nodes_to_include = set(self.graph.nodes.keys())
         if max_nodes and len(nodes_to_include) > max_nodes:
             # Keep nodes with highest degree
-            sorted_nodes = sorted(
+            top_nodes = heapq.nlargest(
+                max_nodes,
                 self.graph.nodes.items(),
-                key=lambda x: x[1].degree,
-                reverse=True
+                key=lambda x: x[1].degree
             )
-            nodes_to_include = {node_id for node_id, _ in sorted_nodes[:max_nodes]}
+            nodes_to_include = {node_id for node_id, _ in top_nodes}
         
         # Add nodes with labels
         node_labels = {}
@@ -166,34 +215,26 @@ class GraphVisualizer:
             node_labels[node_id] = safe_id
             
             # Add node with label
-            lines.append(f'    {safe_id}["{safe_title}"]')
+            yield f'    {safe_id}["{safe_title}"]'
         
         # Add edges
-        added_edges = set()
-        for edge in self.graph.edges:
-            if (edge.source_id in nodes_to_include and
-                edge.target_id in nodes_to_include and
-                edge.weight >= min_edge_weight):
+        connectors = self.CONNECTORS
+        ids, src, tgt, weights = self._select_edges(nodes_to_include, min_edge_weight)
+        added_edges: Set[int] = set()
+        for i, j, weight in zip(src, tgt, weights):
+            # Avoid duplicate edges (undirected), keyed by the ordered
+            # pair of ID table indices packed into one int
+            edge_key = (i << 32) | j if i < j else (j << 32) | i
+            if edge_key not in added_edges:
+                added_edges.add(edge_key)
+                
+                source_id = node_labels[ids[i]]
+                target_id = node_labels[ids[j]]
                 
-                # Avoid duplicate edges (undirected)
-                edge_key = tuple(sorted([edge.source_id, edge.target_id]))
-                if edge_key not in added_edges:
-                    added_edges.add(edge_key)
-                    
-                    source_id = node_labels[edge.source_id]
-                    target_id = node_labels[edge.target_id]
-                    
-                    # Edge style based on weight
-                    if edge.weight > 0.7:
-                        connector = "==>"  # Strong connection
-                    elif edge.weight > 0.4:
-                        connector = "-->"  # Medium connection
-                    else:
-                        connector = "-.->"  # Weak connection
-                    
-                    lines.append(f"    {source_id} {connector} {target_id}")
-        
-        return "\n".join(lines)
+                # Edge style based on weight
+                connector = connectors[(weight > 0.4) + (weight > 0.7)]
+                
+                yield f"    {source_id} {connector} {target_id}"
     
     def to_obsidian_format(
         self,
@@ -217,9 +258,11 @@ class GraphVisualizer:
             nodes_to_include = {center_node}
             for distance_nodes in neighbors.values():
                 nodes_to_include.update(distance_nodes)
+            edges = self.graph.edges_within(nodes_to_include)
         else:
             # Include all nodes
             nodes_to_include = set(self.graph.nodes.keys())
+            edges = self.graph.iter_edges()
         
         # Build node data
         nodes_data = []
@@ -236,7 +279,7 @@ class GraphVisualizer:
         
         # Build edge data
         edges_data = []
-        for edge in self.graph.edges:
+        for edge in edges:
             if (edge.source_id in nodes_to_include and
                 edge.target_id in nodes_to_include):
                 edges_data.append({
@@ -253,72 +296,94 @@ class GraphVisualizer:
             "depth": max_depth if center_node else None
         }
     
-    def to_graphml(self) -> str:
+    def to_graphml(self, out: Optional[IO[str]] = None) -> Optional[str]:
         """
         Export graph to GraphML format
         
+        Args:
+            out: Text stream to write to (None = return a string)
+        
         Returns:
-            GraphML XML string
+            GraphML XML string, or None when written to out
         """
-        lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-        lines.append('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">')
-        lines.append('  <key id="title" for="node" attr.name="title" attr.type="string"/>')
-        lines.append('  <key id="path" for="node" attr.name="path" attr.type="string"/>')
-        lines.append('  <key id="degree" for="node" attr.name="degree" attr.type="int"/>')
-        lines.append('  <key id="weight" for="edge" attr.name="weight" attr.type="double"/>')
-        lines.append('  <key id="type" for="edge" attr.name="type" attr.type="string"/>')
-        lines.append('  <graph id="G" edgedefault="undirected">')
-        
-        # Add nodes
-        for node_id, node in self.graph.nodes.items():
-            lines.append(f'    <node id="{node_id}">')
-            lines.append(f'      <data key="title">{self._escape_xml(node.title)}</data>')
-            lines.append(f'      <data key="path">{self._escape_xml(node.file_path)}</data>')
-            lines.append(f'      <data key="degree">{node.degree}</data>')
-            lines.append('    </node>')
+        if out is None:
+            buf = io.StringIO()
+            buf.writelines(self._iter_graphml())
+            return buf.getvalue()
         
-        # Add edges
-        for i, edge in enumerate(self.graph.edges):
-            lines.append(f'    <edge id="e{i}" source="{edge.source_id}" target="{edge.target_id}">')
-            lines.append(f'      <data key="weight">{edge.weight:.4f}</data>')
-            lines.append(f'      <data key="type">{edge.relationship_type}</data>')
-            lines.append('    </edge>')
+        out.writelines(self._iter_graphml())
+        return None
+    
+    def _iter_graphml(self) -> Iterator[str]:
+        """Yield the GraphML document in chunks (one per node/edge)"""
+        yield (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+            '  <key id="title" for="node" attr.name="title" attr.type="string"/>\n'
+            '  <key id="path" for="node" attr.name="path" attr.type="string"/>\n'
+            '  <key id="degree" for="node" attr.name="degree" attr.type="int"/>\n'
+            '  <key id="weight" for="edge" attr.name="weight" attr.type="double"/>\n'
+            '  <key id="type" for="edge" attr.name="type" attr.type="string"/>\n'
+            '  <graph id="G" edgedefault="undirected">\n'
+        )
+        
+        # Nodes (escaped IDs are kept for the edge pass)
+        escaped_ids: Dict[str, str] = {}
+        for node_id, node in self.graph.nodes.items():
+            escaped_id = escaped_ids[node_id] = node_id.translate(XML_ESCAPE_TABLE)
+            yield (
+                f'    <node id="{escaped_id}">\n'
+                f'      <data key="title">{node.title.translate(XML_ESCAPE_TABLE)}</data>\n'
+                f'      <data key="path">{node.file_path.translate(XML_ESCAPE_TABLE)}</data>\n'
+                f'      <data key="degree">{node.degree}</data>\n'
+                '    </node>\n'
+            )
         
-        lines.append('  </graph>')
-        lines.append('</graphml>')
+        # Edges
+        escaped_types: Dict[str, str] = {}
+        for i, edge in enumerate(self.graph.iter_edges()):
+            source = escaped_ids.get(edge.source_id)
+            if source is None:
+                source = escaped_ids[edge.source_id] = edge.source_id.translate(XML_ESCAPE_TABLE)
+            target = escaped_ids.get(edge.target_id)
+            if target is None:
+                target = escaped_ids[edge.target_id] = edge.target_id.translate(XML_ESCAPE_TABLE)
+            rel_type = escaped_types.get(edge.relationship_type)
+            if rel_type is None:
+                rel_type = escaped_types[edge.relationship_type] = (
+                    edge.relationship_type.translate(XML_ESCAPE_TABLE)
+                )
+            yield (
+                f'    <edge id="e{i}" source="{source}" target="{target}">\n'
+                f'      <data key="weight">{edge.weight:.4f}</data>\n'
+                f'      <data key="type">{rel_type}</data>\n'
+                '    </edge>\n'
+            )
         
-        return "\n".join(lines)
+        yield '  </graph>\n</graphml>'
     
-    def filter_by_tags(self, tags: List[str]) -> DocumentGraph:
+    def filter_by_tags(self, tags: List[str]) -> SubgraphView:
         """
-        Create filtered graph containing only nodes with specified tags
+        Create filtered view containing only nodes with specified tags
         
         Args:
             tags: List of tags to filter by
         
         Returns:
-            New DocumentGraph with filtered nodes
+            SubgraphView of the nodes with matching tags (call to_graph()
+            for a standalone DocumentGraph)
         """
-        filtered_graph = DocumentGraph()
-        
-        # Add nodes with matching tags
-        for node_id, node in self.graph.nodes.items():
-            if any(tag in node.tags for tag in tags):
-                filtered_graph.add_node(node)
-        
-        # Add edges between included nodes
-        for edge in self.graph.edges:
-            if (edge.source_id in filtered_graph.nodes and
-                edge.target_id in filtered_graph.nodes):
-                filtered_graph.add_edge(edge)
-        
-        return filtered_graph
+        tag_set = frozenset(tags)
+        return SubgraphView(self.graph, {
+            node_id for node_id, node in self.graph.nodes.items()
+            if not tag_set.isdisjoint(node.tags)
+        })
     
     def expand_from_node(
         self,
         node_id: str,
         max_hops: int = 2
-    ) -> DocumentGraph:
+    ) -> SubgraphView:
         """
         Create subgraph by expanding from a specific node
         
@@ -327,10 +392,11 @@ class GraphVisualizer:
             max_hops: Maximum number of hops to expand
         
         Returns:
-            New DocumentGraph with expanded nodes
+            SubgraphView of the expanded nodes (call to_graph() for a
+            standalone DocumentGraph)
         """
         if node_id not in self.graph.nodes:
-            return DocumentGraph()
+            return SubgraphView(self.graph, frozenset())
         
         # Get neighbors at different distances
         neighbors = self.analyzer.get_neighbors(node_id, max_distance=max_hops)
@@ -340,26 +406,29 @@ class GraphVisualizer:
         for distance_nodes in neighbors.values():
             nodes_to_include.update(distance_nodes)
         
-        # Create subgraph
-        subgraph = DocumentGraph()
-        
-        # Add nodes
-        for nid in nodes_to_include:
-            if nid in self.graph.nodes:
-                subgraph.add_node(self.graph.nodes[nid])
+        return SubgraphView(self.graph, nodes_to_include)
+    
+    def _select_edges(
+        self,
+        node_ids: Set[str],
+        min_edge_weight: float
+    ) -> Tuple[List[str], List[int], List[int], List[float]]:
+        """
+        Select edges between node_ids with weight >= min_edge_weight.
         
-        # Add edges
-        for edge in self.graph.edges:
-            if (edge.source_id in nodes_to_include and
-                edge.target_id in nodes_to_include):
-                subgraph.add_edge(edge)
+        Membership is resolved once per ID into a boolean mask over the
+        graph's ID table (see DocumentGraph.id_mask), so edges are filtered
+        on integer indices instead of hashing two ID strings per edge.
         
-        return subgraph
+        Returns:
+            Tuple of (ID table, source indices, target indices, weights)
+            for the selected edges, in insertion order
+        """
+        ids, src, tgt, weights = self.graph.edge_arrays()
+        present = self.graph.id_mask(node_ids)
+        keep = np.flatnonzero(present[src] & present[tgt] & (weights >= min_edge_weight))
+        return ids, src[keep].tolist(), tgt[keep].tolist(), weights[keep].tolist()
     
     def _escape_xml(self, text: str) -> str:
         """Escape special XML characters"""
-        return (text.replace("&", "&amp;")
-                   .replace("<", "&lt;")
-                   .replace(">", "&gt;")
-                   .replace("\"", "&quot;")
-                   .replace("'", "&apos;"))
+        return text.translate(XML_ESCAPE_TABLE)
@@ -5,9 +5,12 @@ This module provides a wrapper around ChromaDB for storing and retrieving
 document embeddings with metadata support.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any, Tuple
 from pathlib import Path
-import uuid
+import os
+
+import numpy as np
 
 try:
     import chromadb
@@ -16,6 +19,19 @@ try:
 except ImportError:
     HAS_CHROMADB = False
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+# Initial row capacity of the mock embedding buffer
+MOCK_INITIAL_CAPACITY = 64
+
+# Default number of concurrent Chroma writes in add_batch
+MAX_WRITE_WORKERS = 4
+
 
 class VectorStore:
     """
@@ -63,6 +79,11 @@ class VectorStore:
             self.client = None
             self.collection = None
             self._mock_store = {}  # Mock storage for testing
+            # Mock embedding buffer; row i holds the embedding of _mock_ids[i]
+            # and capacity doubles when full (rows past len(_mock_ids) unused)
+            self._mock_ids: List[str] = []
+            self._mock_rows: Dict[str, int] = {}
+            self._mock_emb: Optional[np.ndarray] = None
     
     def add(
         self,
@@ -104,6 +125,7 @@ class VectorStore:
                     'document': documents[i],
                     'metadata': metadatas[i] if metadatas else {}
                 }
+            self._mock_set_embeddings(ids, embeddings)
     
     def update(
         self,
@@ -141,6 +163,12 @@ class VectorStore:
                         self._mock_store[doc_id]['document'] = documents[i]
                     if metadatas:
                         self._mock_store[doc_id]['metadata'] = metadatas[i]
+            if embeddings:
+                known = [i for i, doc_id in enumerate(ids) if doc_id in self._mock_rows]
+                self._mock_set_embeddings(
+                    [ids[i] for i in known],
+                    [embeddings[i] for i in known]
+                )
     
     def delete(self, ids: List[str]) -> None:
         """
@@ -158,6 +186,7 @@ class VectorStore:
             # Mock delete
             for doc_id in ids:
                 self._mock_store.pop(doc_id, None)
+            self._mock_remove(ids)
     
     def query(
         self,
@@ -198,23 +227,26 @@ class VectorStore:
                 'metadatas': []
             }
             
-            for query_emb in query_embeddings:
-                # Calculate cosine similarity with all stored documents
-                similarities = []
-                for doc_id, doc_data in self._mock_store.items():
-                    # Simple dot product (assuming normalized vectors)
-                    similarity = sum(a * b for a, b in zip(query_emb, doc_data['embedding']))
-                    distance = 1 - similarity  # Convert to distance
-                    similarities.append((doc_id, distance, doc_data))
-                
-                # Sort by distance and take top n_results
-                similarities.sort(key=lambda x: x[1])
-                top_results = similarities[:n_results]
-                
-                results['ids'].append([r[0] for r in top_results])
-                results['distances'].append([r[1] for r in top_results])
-                results['documents'].append([r[2]['document'] for r in top_results])
-                results['metadatas'].append([r[2]['metadata'] for r in top_results])
+            if not self._mock_ids or n_results <= 0:
+                for _ in query_embeddings:
+                    for key in results:
+                        results[key].append([])
+                return results
+            
+            # Dot products of every stored row with every query in one matmul
+            # (cosine similarity, assuming normalized vectors)
+            # (Q, N) so that each query's distances are contiguous
+            queries = np.asarray(query_embeddings, dtype=np.float32)
+            distances = 1 - queries @ self._mock_emb[:len(self._mock_ids)].T
+            k = min(n_results, len(self._mock_ids))
+            top_k = _top_k_parallel if HAS_NUMBA else _top_k
+            
+            for row, top in zip(distances, top_k(distances, k)):
+                top_ids = [self._mock_ids[i] for i in top.tolist()]
+                results['ids'].append(top_ids)
+                results['distances'].append(row[top].tolist())
+                results['documents'].append([self._mock_store[i]['document'] for i in top_ids])
+                results['metadatas'].append([self._mock_store[i]['metadata'] for i in top_ids])
             
             return results
     
@@ -287,22 +319,73 @@ class VectorStore:
             )
         else:
             self._mock_store.clear()
+            self._mock_ids = []
+            self._mock_rows = {}
+            self._mock_emb = None
+    
+    def _mock_set_embeddings(self, ids: List[str], embeddings: List[List[float]]) -> None:
+        """Write embeddings into the mock matrix, appending rows for new IDs."""
+        new_rows: Dict[str, List[float]] = {}  # insertion-ordered
+        for doc_id, embedding in zip(ids, embeddings):
+            row = self._mock_rows.get(doc_id)
+            if row is not None:
+                self._mock_emb[row] = embedding
+            else:
+                new_rows[doc_id] = embedding
+        
+        if not new_rows:
+            return
+        
+        block = np.asarray(list(new_rows.values()), dtype=np.float32)
+        n = len(self._mock_ids)
+        capacity = 0 if self._mock_emb is None else len(self._mock_emb)
+        if n + len(block) > capacity:
+            buffer = np.empty(
+                (max(capacity * 2, n + len(block), MOCK_INITIAL_CAPACITY), block.shape[1]),
+                dtype=np.float32
+            )
+            if n:
+                buffer[:n] = self._mock_emb[:n]
+            self._mock_emb = buffer
+        self._mock_emb[n:n + len(block)] = block
+        
+        for doc_id in new_rows:
+            self._mock_rows[doc_id] = len(self._mock_ids)
+            self._mock_ids.append(doc_id)
+    
+    def _mock_remove(self, ids: List[str]) -> None:
+        """Drop the mock matrix rows of the given IDs, keeping row order."""
+        removed = {self._mock_rows[doc_id] for doc_id in ids if doc_id in self._mock_rows}
+        if not removed:
+            return
+        
+        keep = [row for row in range(len(self._mock_ids)) if row not in removed]
+        self._mock_ids = [self._mock_ids[row] for row in keep]
+        self._mock_rows = {doc_id: row for row, doc_id in enumerate(self._mock_ids)}
+        self._mock_emb[:len(keep)] = self._mock_emb[keep]
     
     def add_batch(
         self,
         documents: List[str],
         embeddings: List[List[float]],
         metadatas: Optional[List[Dict[str, Any]]] = None,
-        batch_size: int = 100
+        batch_size: int = 100,
+        max_workers: Optional[int] = None
     ) -> List[str]:
         """
         Add documents in batches.
         
+        With ChromaDB, batches are written from a thread pool so that
+        slicing the next batch overlaps with HNSW insertion (which releases
+        the GIL). The mock store is always written serially.
+        
         Args:
             documents: List of document texts
             embeddings: List of embedding vectors
             metadatas: Optional list of metadata dicts
             batch_size: Size of each batch
+            max_workers: Concurrent batch writes (default: min(4, CPU count);
+                         1 = serial)
             
         Returns:
             List of generated document IDs
@@ -310,22 +393,31 @@ class VectorStore:
         if not documents or not embeddings:
             return []
         
-        # Generate IDs
-        ids = [str(uuid.uuid4()) for _ in documents]
+        # Generate IDs (128 random bits as 32 hex chars)
+        ids = [os.urandom(16).hex() for _ in range(len(documents))]
         
-        # Process in batches
-        for i in range(0, len(documents), batch_size):
-            batch_ids = ids[i:i + batch_size]
-            batch_embeddings = embeddings[i:i + batch_size]
-            batch_documents = documents[i:i + batch_size]
-            batch_metadatas = metadatas[i:i + batch_size] if metadatas else None
-            
-            self.add(
-                ids=batch_ids,
-                embeddings=batch_embeddings,
-                documents=batch_documents,
-                metadatas=batch_metadatas
+        batches = (
+            dict(
+                ids=ids[i:i + batch_size],
+                embeddings=embeddings[i:i + batch_size],
+                documents=documents[i:i + batch_size],
+                metadatas=metadatas[i:i + batch_size] if metadatas else None
             )
+            for i in range(0, len(documents), batch_size)
+        )
+        
+        if max_workers is None:
+            max_workers = min(MAX_WRITE_WORKERS, os.cpu_count() or 1)
+        
+        if self.collection is None or max_workers <= 1 or len(documents) <= batch_size:
+            # Process in batches
+            for batch in batches:
+                self.add(**batch)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self.add, **batch) for batch in batches]
+                for future in futures:
+                    future.result()
         
         return ids
 
@@ -348,3 +440,61 @@ def create_vector_store(
         persist_directory=persist_directory,
         collection_name=collection_name
     )
+
+
+def _top_k(distances: np.ndarray, k: int) -> List[np.ndarray]:
+    """
+    Select the k smallest distances in each row.
+    
+    Partial sort for the top k, then order them by distance (ties by
+    column, i.e. insertion order).
+    
+    Args:
+        distances: (Q, N) distance matrix, one row per query
+        k: Number of entries to select per query (k <= N)
+        
+    Returns:
+        Per query, an array of k column indices
+    """
+    results = []
+    for row in distances:
+        top = np.argpartition(row, k - 1)[:k] if k < len(row) else np.arange(k)
+        results.append(top[np.lexsort((top, row[top]))])
+    return results
+
+
+def _top_k_parallel(distances: np.ndarray, k: int) -> np.ndarray:
+    """
+    Variant of _top_k that handles one query per thread (run with prange).
+    
+    Each row is scanned once into a sorted buffer of the k best columns
+    seen so far, O(N + k * insertions) instead of a full sort. A column
+    only displaces strictly larger distances, so ties are by column
+    throughout (_top_k may pick any of the rows tied at the k-th distance).
+    """
+    num_queries, n = distances.shape
+    top = np.empty((num_queries, k), dtype=np.int64)
+    for q in prange(num_queries):
+        row = distances[q]
+        best = np.empty(k, dtype=distances.dtype)
+        cols = top[q]
+        size = 0
+        for j in range(n):
+            d = row[j]
+            if size == k and not d < best[k - 1]:
+                continue
+            # Shift larger entries right and insert in sorted position
+            i = size if size < k else k - 1
+            while i > 0 and best[i - 1] > d:
+                best[i] = best[i - 1]
+                cols[i] = cols[i - 1]
+                i -= 1
+            best[i] = d
+            cols[i] = j
+            if size < k:
+                size += 1
+    return top
+
+
+if HAS_NUMBA:
+    _top_k_parallel = njit(cache=True, parallel=True)(_top_k_parallel)
@@ -8,13 +8,25 @@ for migration to different systems or backup purposes.
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import json
 import shutil
 import zipfile
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from ..models.document import Document
 from ..indexer.vector_store import VectorStore
+from ..utils.file_copy import copy_tree
+
+# Vector database files stored without compression in archives: Parquet is
+# compressed internally and HNSW index files (*.bin) hold float vectors,
+# which deflate barely shrinks. SQLite pages are plain and still deflated.
+STORED_SUFFIXES = frozenset({".parquet", ".bin"})
 
 
 @dataclass
@@ -47,16 +59,33 @@ class ExportManager:
     
     EXPORT_VERSION = "1.0"
     
-    def __init__(self, vector_store: VectorStore, export_dir: Path):
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        export_dir: Path,
+        pretty: bool = False,
+        compression: int = zipfile.ZIP_DEFLATED,
+        compress_level: Optional[int] = 3
+    ):
         """
         Initialize export manager
         
         Args:
             vector_store: VectorStore to export
             export_dir: Directory for export files
+            pretty: Indent JSON files by 2 spaces (default: compact)
+            compression: ZIP compression method for the archive (e.g.
+                         zipfile.ZIP_ZSTANDARD on Python 3.14+, which
+                         older Pythons cannot import)
+            compress_level: Compression level (None = the method's default;
+                            deflate level 3 is about twice as fast as the
+                            default 6 on exported JSON)
         """
         self.vector_store = vector_store
         self.export_dir = Path(export_dir)
+        self.pretty = pretty
+        self.compression = compression
+        self.compress_level = compress_level
         self.export_dir.mkdir(parents=True, exist_ok=True)
     
     def export_documents(
@@ -77,60 +106,69 @@ class ExportManager:
         if output_path is None:
             output_path = self.export_dir / "documents.json"
         
-        # Serialize documents
-        doc_data = []
-        for doc in documents:
-            doc_dict = {
-                "doc_id": doc.doc_id,
-                "file_path": str(doc.file_path),
-                "relative_path": str(doc.relative_path),
-                "source_folder": doc.source_folder,
-                "raw_content": doc.raw_content,
-                "parsed_content": doc.parsed_content,
-                "metadata": {
-                    "title": doc.metadata.title,
-                    "tags": doc.metadata.tags,
-                    "aliases": doc.metadata.aliases,
-                    "word_count": doc.metadata.word_count,
-                    "headings": doc.metadata.headings,
-                    "custom_fields": doc.metadata.custom_fields
-                },
-                "chunks": [
-                    {
-                        "chunk_id": chunk.chunk_id,
-                        "content": chunk.content,
-                        "document_id": chunk.document_id,
-                        "start_line": chunk.start_line,
-                        "end_line": chunk.end_line,
-                        "metadata": chunk.metadata
-                    }
-                    for chunk in doc.chunks
-                ],
-                "relationships": [
-                    {
-                        "source_doc_id": rel.source_doc_id,
-                        "target_doc_id": rel.target_doc_id,
-                        "relationship_type": rel.relationship_type,
-                        "strength": rel.strength,
-                        "keyword_score": rel.keyword_score,
-                        "vector_score": rel.vector_score,
-                        "manual_link_score": rel.manual_link_score,
-                        "metadata": rel.metadata
-                    }
-                    for rel in doc.relationships
-                ],
-                "status": doc.status.value,
-                "file_size": doc.file_size,
-                "file_hash": doc.file_hash
-            }
-            doc_data.append(doc_dict)
-        
-        # Write to file
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(doc_data, f, ensure_ascii=False, indent=2)
+        # Serialize documents one at a time
+        _write_json_array(
+            output_path,
+            (self._document_to_dict(doc) for doc in documents),
+            pretty=self.pretty
+        )
         
         return output_path
     
+    def _document_to_dict(self, doc: Document) -> Dict:
+        """
+        Convert a document to its JSON export form
+        
+        Args:
+            doc: Document to serialize
+        
+        Returns:
+            Dict of JSON-compatible values
+        """
+        return {
+            "doc_id": doc.doc_id,
+            "file_path": str(doc.file_path),
+            "relative_path": str(doc.relative_path),
+            "source_folder": doc.source_folder,
+            "raw_content": doc.raw_content,
+            "parsed_content": doc.parsed_content,
+            "metadata": {
+                "title": doc.metadata.title,
+                "tags": doc.metadata.tags,
+                "aliases": doc.metadata.aliases,
+                "word_count": doc.metadata.word_count,
+                "headings": doc.metadata.headings,
+                "custom_fields": doc.metadata.custom_fields
+            },
+            "chunks": [
+                {
+                    "chunk_id": chunk.chunk_id,
+                    "content": chunk.content,
+                    "document_id": chunk.document_id,
+                    "start_line": chunk.start_line,
+                    "end_line": chunk.end_line,
+                    "metadata": chunk.metadata
+                }
+                for chunk in doc.chunks
+            ],
+            "relationships": [
+                {
+                    "source_doc_id": rel.source_doc_id,
+                    "target_doc_id": rel.target_doc_id,
+                    "relationship_type": rel.relationship_type,
+                    "strength": rel.strength,
+                    "keyword_score": rel.keyword_score,
+                    "vector_score": rel.vector_score,
+                    "manual_link_score": rel.manual_link_score,
+                    "metadata": rel.metadata
+                }
+                for rel in doc.relationships
+            ],
+            "status": doc.status.value,
+            "file_size": doc.file_size,
+            "file_hash": doc.file_hash
+        }
+    
     def export_vector_database(
         self,
         output_path: Optional[Path] = None
@@ -152,10 +190,10 @@ class ExportManager:
         if self.vector_store.persist_directory:
             source_dir = Path(self.vector_store.persist_directory)
             if source_dir.exists():
-                # Copy directory recursively
+                # Copy directory recursively (reflink clones where supported)
                 if output_path.exists():
                     shutil.rmtree(output_path)
-                shutil.copytree(source_dir, output_path)
+                copy_tree(source_dir, output_path)
             else:
                 # Create empty directory if source doesn't exist
                 output_path.mkdir(parents=True, exist_ok=True)
@@ -220,8 +258,9 @@ class ExportManager:
         # Export documents
         docs_path = self.export_documents(documents)
         
-        # Export vector database
-        vector_db_path = self.export_vector_database()
+        # Export vector database (archives read it straight from the store)
+        if not create_archive:
+            self.export_vector_database()
         
         # Create manifest
         manifest = self.create_manifest(documents, source_folders)
@@ -234,23 +273,52 @@ class ExportManager:
             "vector_db_path": "vector_db"
         }
         
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(manifest_dict, f, ensure_ascii=False, indent=2)
+        _write_json(manifest_path, manifest_dict, pretty=self.pretty)
         
         # Create ZIP archive if requested
         if create_archive:
             archive_path = self.export_dir.parent / f"{self.export_dir.name}.zip"
-            with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                # Add all files in export directory
+            with zipfile.ZipFile(
+                archive_path,
+                "w",
+                compression=self.compression,
+                compresslevel=self.compress_level
+            ) as zipf:
+                # Add all files in export directory (except a vector_db
+                # folder left by an earlier unarchived export)
                 for file_path in self.export_dir.rglob("*"):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(self.export_dir)
+                    arcname = file_path.relative_to(self.export_dir)
+                    if file_path.is_file() and arcname.parts[0] != "vector_db":
                         zipf.write(file_path, arcname)
+                
+                self._write_vector_database(zipf)
             
             return archive_path
         
         return self.export_dir
     
+    def _write_vector_database(self, zipf: zipfile.ZipFile) -> None:
+        """
+        Add the vector store's files to an archive under vector_db/
+        
+        Args:
+            zipf: Archive open for writing
+        """
+        if not self.vector_store.persist_directory:
+            return
+        
+        source_dir = Path(self.vector_store.persist_directory)
+        if not source_dir.exists():
+            return
+        
+        for file_path in sorted(source_dir.rglob("*")):
+            if file_path.is_file():
+                arcname = Path("vector_db") / file_path.relative_to(source_dir)
+                if file_path.suffix in STORED_SUFFIXES:
+                    zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zipf.write(file_path, arcname)
+    
     def get_export_stats(self, documents: List[Document]) -> Dict[str, any]:
         """
         Get statistics about what will be exported
@@ -273,3 +341,52 @@ class ExportManager:
             "avg_chunks_per_doc": total_chunks / len(documents) if documents else 0,
             "avg_relationships_per_doc": total_relationships / len(documents) if documents else 0
         }
+
+
+def _dumps(data, pretty: bool) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, compact or indented by 2 spaces
+    
+    Uses orjson when installed, otherwise the standard json module.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_json(path: Path, data, pretty: bool = False) -> None:
+    """Write data as a UTF-8 JSON file (see _dumps)"""
+    path.write_bytes(_dumps(data, pretty))
+
+
+def _write_json_array(path: Path, items: Iterable, pretty: bool = False) -> None:
+    """
+    Write items as a JSON array, serializing one item at a time
+    
+    The output matches _write_json on a list of the items, but only one
+    item's dict and serialized bytes are held in memory at once.
+    """
+    if pretty:
+        first, separator, end = b"\n  ", b",\n  ", b"\n]"
+    else:
+        first, separator, end = b"", b",", b"]"
+    
+    with open(path, "wb") as f:
+        f.write(b"[")
+        empty = True
+        for item in items:
+            f.write(first if empty else separator)
+            data = _dumps(item, pretty)
+            if pretty:
+                # Nest the item's indentation one level inside the array
+                # (string values cannot contain raw newlines, they are escaped)
+                data = data.replace(b"\n", b"\n  ")
+            f.write(data)
+            empty = False
+        f.write(b"]" if empty else end)
@@ -7,12 +7,24 @@ from exported backup files.
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import json
 import shutil
 import zipfile
 import tempfile
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 from ..models.document import (
     Document,
     DocumentMetadata,
@@ -21,6 +33,10 @@ from ..models.document import (
     DocumentStatus
 )
 from ..indexer.vector_store import VectorStore
+from ..utils.file_copy import copy_tree
+
+# Errors raised for malformed JSON (orjson's subclasses json.JSONDecodeError)
+JSON_DECODE_ERRORS = (json.JSONDecodeError, ijson.JSONError) if HAS_IJSON else (json.JSONDecodeError,)
 
 
 @dataclass
@@ -89,8 +105,7 @@ class ImportManager:
             return None
         
         try:
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _load_json(manifest_path)
         except json.JSONDecodeError as e:
             self.errors.append(f"Invalid manifest JSON: {e}")
             return None
@@ -110,77 +125,88 @@ class ImportManager:
             self.errors.append("Documents file not found")
             return []
         
+        documents = []
         try:
-            with open(docs_path, "r", encoding="utf-8") as f:
-                doc_data = json.load(f)
-        except json.JSONDecodeError as e:
+            for doc_dict in _iter_json_array(docs_path):
+                doc = self._document_from_dict(doc_dict)
+                if doc is not None:
+                    documents.append(doc)
+        except JSON_DECODE_ERRORS as e:
             self.errors.append(f"Invalid documents JSON: {e}")
             return []
         
-        documents = []
-        for doc_dict in doc_data:
-            try:
-                # Reconstruct metadata
-                metadata = DocumentMetadata(
-                    title=doc_dict["metadata"]["title"],
-                    tags=doc_dict["metadata"]["tags"],
-                    aliases=doc_dict["metadata"]["aliases"],
-                    word_count=doc_dict["metadata"]["word_count"],
-                    headings=doc_dict["metadata"]["headings"],
-                    custom_fields=doc_dict["metadata"]["custom_fields"]
+        return documents
+    
+    def _document_from_dict(self, doc_dict: Dict[str, Any]) -> Optional[Document]:
+        """
+        Rebuild a document from its JSON export form
+        
+        Args:
+            doc_dict: Document dict from documents.json
+        
+        Returns:
+            Document, or None if the dict is invalid (error recorded)
+        """
+        try:
+            # Reconstruct metadata
+            metadata = DocumentMetadata(
+                title=doc_dict["metadata"]["title"],
+                tags=doc_dict["metadata"]["tags"],
+                aliases=doc_dict["metadata"]["aliases"],
+                word_count=doc_dict["metadata"]["word_count"],
+                headings=doc_dict["metadata"]["headings"],
+                custom_fields=doc_dict["metadata"]["custom_fields"]
+            )
+            
+            # Reconstruct chunks
+            chunks = []
+            for chunk_dict in doc_dict["chunks"]:
+                chunk = DocumentChunk(
+                    chunk_id=chunk_dict["chunk_id"],
+                    content=chunk_dict["content"],
+                    document_id=chunk_dict["document_id"],
+                    start_line=chunk_dict["start_line"],
+                    end_line=chunk_dict["end_line"],
+                    metadata=chunk_dict.get("metadata", {})
                 )
-                
-                # Reconstruct chunks
-                chunks = []
-                for chunk_dict in doc_dict["chunks"]:
-                    chunk = DocumentChunk(
-                        chunk_id=chunk_dict["chunk_id"],
-                        content=chunk_dict["content"],
-                        document_id=chunk_dict["document_id"],
-                        start_line=chunk_dict["start_line"],
-                        end_line=chunk_dict["end_line"],
-                        metadata=chunk_dict.get("metadata", {})
-                    )
-                    chunks.append(chunk)
-                
-                # Reconstruct relationships
-                relationships = []
-                for rel_dict in doc_dict["relationships"]:
-                    rel = Relationship(
-                        source_doc_id=rel_dict["source_doc_id"],
-                        target_doc_id=rel_dict["target_doc_id"],
-                        relationship_type=rel_dict["relationship_type"],
-                        strength=rel_dict["strength"],
-                        keyword_score=rel_dict.get("keyword_score", 0.0),
-                        vector_score=rel_dict.get("vector_score", 0.0),
-                        manual_link_score=rel_dict.get("manual_link_score", 0.0),
-                        metadata=rel_dict.get("metadata", {})
-                    )
-                    relationships.append(rel)
-                
-                # Reconstruct document
-                doc = Document(
-                    doc_id=doc_dict["doc_id"],
-                    file_path=Path(doc_dict["file_path"]),
-                    relative_path=Path(doc_dict["relative_path"]),
-                    source_folder=doc_dict["source_folder"],
-                    raw_content=doc_dict["raw_content"],
-                    parsed_content=doc_dict["parsed_content"],
-                    metadata=metadata,
-                    chunks=chunks,
-                    relationships=relationships,
-                    status=DocumentStatus(doc_dict["status"]),
-                    file_size=doc_dict.get("file_size", 0),
-                    file_hash=doc_dict.get("file_hash", "")
+                chunks.append(chunk)
+            
+            # Reconstruct relationships
+            relationships = []
+            for rel_dict in doc_dict["relationships"]:
+                rel = Relationship(
+                    source_doc_id=rel_dict["source_doc_id"],
+                    target_doc_id=rel_dict["target_doc_id"],
+                    relationship_type=rel_dict["relationship_type"],
+                    strength=rel_dict["strength"],
+                    keyword_score=rel_dict.get("keyword_score", 0.0),
+                    vector_score=rel_dict.get("vector_score", 0.0),
+                    manual_link_score=rel_dict.get("manual_link_score", 0.0),
+                    metadata=rel_dict.get("metadata", {})
                 )
-                
-                documents.append(doc)
-                
-            except (KeyError, ValueError) as e:
-                self.errors.append(f"Failed to import document {doc_dict.get('doc_id', 'unknown')}: {e}")
-                continue
-        
-        return documents
+                relationships.append(rel)
+            
+            # Reconstruct document
+            doc = Document(
+                doc_id=doc_dict["doc_id"],
+                file_path=Path(doc_dict["file_path"]),
+                relative_path=Path(doc_dict["relative_path"]),
+                source_folder=doc_dict["source_folder"],
+                raw_content=doc_dict["raw_content"],
+                parsed_content=doc_dict["parsed_content"],
+                metadata=metadata,
+                chunks=chunks,
+                relationships=relationships,
+                status=DocumentStatus(doc_dict["status"]),
+                file_size=doc_dict.get("file_size", 0),
+                file_hash=doc_dict.get("file_hash", "")
+            )
+            
+            return doc
+            
+        except (KeyError, ValueError) as e:
+            self.errors.append(f"Failed to import document {doc_dict.get('doc_id', 'unknown')}: {e}")
+            return None
     
     def import_vector_database(self, import_dir: Path) -> bool:
         """
@@ -206,8 +232,8 @@ class ImportManager:
                 if target_dir.exists():
                     shutil.rmtree(target_dir)
                 
-                # Copy imported database
-                shutil.copytree(vector_db_path, target_dir)
+                # Copy imported database (reflink clones where supported)
+                copy_tree(vector_db_path, target_dir)
                 return True
                 
             except Exception as e:
@@ -284,3 +310,32 @@ class ImportManager:
         if manifest:
             return manifest.get("metadata", {})
         return None
+
+
+def _iter_json_array(path: Path) -> Iterator[Any]:
+    """
+    Iterate over the items of a JSON array file
+    
+    With ijson installed the file is parsed incrementally, so only one
+    item is held in memory at a time; otherwise the whole file is loaded.
+    """
+    if HAS_IJSON:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+        return
+    
+    yield from _load_json(path)
+
+
+def _load_json(path: Path):
+    """
+    Load a UTF-8 JSON file
+    
+    Uses orjson when installed (its JSONDecodeError subclasses
+    json.JSONDecodeError), otherwise the standard json module.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
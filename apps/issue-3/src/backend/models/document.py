@@ -27,7 +27,7 @@ class LinkType(Enum):
     EMBED = "embed"  # ![[Document]]
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentMetadata:
     """Metadata extracted from document frontmatter and content."""
     
@@ -48,7 +48,7 @@ class DocumentMetadata:
     incoming_links: List['DocumentLink'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentLink:
     """Represents a link from one document to another."""
     
@@ -59,7 +59,7 @@ class DocumentLink:
     source_line: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentChunk:
     """A chunk of document content for vector indexing."""
     
@@ -74,7 +74,7 @@ class DocumentChunk:
     embedding: Optional[List[float]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Represents a complete document in the knowledge base."""
     
@@ -95,6 +95,9 @@ class Document:
     # Relationships to other documents
     relationships: List['Relationship'] = field(default_factory=list)
     
+    # Wikilinks parsed from the content ({'target': ..., ...} dicts)
+    wikilinks: List[Dict[str, any]] = field(default_factory=list)
+    
     # Status
     status: DocumentStatus = DocumentStatus.PENDING
     last_indexed: Optional[datetime] = None
@@ -114,7 +117,7 @@ class Document:
             self.metadata.title = self.file_path.stem
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceFolder:
     """Represents a source folder containing documents."""
     
@@ -134,7 +137,7 @@ class SourceFolder:
         return self.path.exists() and self.path.is_dir()
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """Represents a relationship between two documents."""
     
@@ -158,7 +161,7 @@ class Relationship:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeBase:
     """Represents the entire knowledge base."""
     
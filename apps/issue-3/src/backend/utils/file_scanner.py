@@ -93,7 +93,8 @@ class FileScanner:
     def detect_changes(
         self,
         directory: str,
-        recursive: bool = True
+        recursive: bool = True,
+        current_files: Optional[List[FileInfo]] = None
     ) -> List[FileChange]:
         """
         Detect which files have changed since last scan.
@@ -101,12 +102,15 @@ class FileScanner:
         Args:
             directory: Directory to scan
             recursive: Whether to scan subdirectories
+            current_files: Result of an earlier scan_directory call for
+                directory, to diff without scanning again
             
         Returns:
             List of FileChange objects
         """
         # Scan current files
-        current_files = self.scan_directory(directory, recursive)
+        if current_files is None:
+            current_files = self.scan_directory(directory, recursive)
         current_paths = {str(f.path): f for f in current_files}
         cached_paths = set(str(p) for p in self._file_cache.keys())
         
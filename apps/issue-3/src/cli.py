@@ -512,11 +512,14 @@ def graph(output: str, format: str, max_nodes: int):
                 output_data = visualizer.to_mermaid(max_nodes=max_nodes)
             elif format == "obsidian":
                 output_data = visualizer.to_obsidian_format()
-            else:  # graphml
-                output_data = visualizer.to_graphml()
+            else:  # graphml (streamed straight to the file)
+                output_data = None
+                with output_path.open("w", encoding="utf-8") as f:
+                    visualizer.to_graphml(f)
             
             # Write output
-            output_path.write_text(output_data, encoding="utf-8")
+            if output_data is not None:
+                output_path.write_text(output_data, encoding="utf-8")
             
             progress.update(task, description="✓ Graph generated")
         
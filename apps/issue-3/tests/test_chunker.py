@@ -2,6 +2,8 @@
 Tests for document chunker.
 """
 
+import re
+
 import pytest
 from src.backend.core.chunker import DocumentChunker, create_chunker
 
@@ -31,6 +33,14 @@ class TestDocumentChunker:
         count = chunker.count_tokens(text)
         assert count > 0
     
+    def test_count_tokens_batch_matches_single(self):
+        """Test batch token counting matches per-text counting."""
+        chunker = DocumentChunker()
+        texts = ["Hello world", "你好世界", ""]
+        assert chunker.count_tokens_batch(texts) == [
+            chunker.count_tokens(text) for text in texts
+        ]
+    
     def test_split_by_sentences_english(self):
         """Test sentence splitting for English."""
         chunker = DocumentChunker()
@@ -149,6 +159,24 @@ More text after code."""
         full_text = ' '.join(chunk.text for chunk in chunks)
         assert 'def hello' in full_text
     
+    def test_chunk_text_restores_code_blocks_in_order(self):
+        """Test each chunk gets its own code blocks back, not the first ones."""
+        chunker = DocumentChunker(chunk_size=20, chunk_overlap=10)
+        text = "\n\n".join(
+            f"Paragraph {i} has enough words. Another sentence follows.\n```\nblock{i}\n```"
+            for i in range(4)
+        )
+        
+        chunks = chunker.chunk_text(text)
+        assert len(chunks) > 1
+        
+        full_text = ' '.join(chunk.text for chunk in chunks)
+        assert '[CODE_BLOCK]' not in full_text
+        # Overlap may repeat a block, but blocks must appear in document order
+        block_ids = [int(c) for c in re.findall(r'block(\d)', full_text)]
+        assert block_ids == sorted(block_ids)
+        assert set(block_ids) == {0, 1, 2, 3}
+    
     def test_chunk_document(self):
         """Test chunking a complete document."""
         chunker = DocumentChunker(chunk_size=100, chunk_overlap=20)
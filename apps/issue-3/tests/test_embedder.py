@@ -5,6 +5,7 @@ Tests for embedder module.
 import pytest
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from src.backend.core.embedder import Embedder, create_embedder
 
@@ -93,10 +94,55 @@ class TestEmbedder:
         embedding2 = embedder.embed(text)
         
         assert embedding1 == embedding2
-        # Check cache file exists
+        # Check cache files exist
         cache_key = embedder._get_cache_key(text)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        assert cache_file.exists()
+        assert cache_key in embedder._cache_index
+        assert embedder._cache_vectors_file.exists()
+        assert embedder._cache_keys_file.exists()
+    
+    def test_cache_persists_across_instances(self):
+        """Test that a new embedder reuses embeddings cached on disk."""
+        texts = ["First cached text", "Second cached text"]
+        first = Embedder(cache_dir=str(self.cache_dir), use_cache=True)
+        embeddings = first.embed(texts)
+        
+        second = Embedder(cache_dir=str(self.cache_dir), use_cache=True)
+        cache_key = second._get_cache_key(texts[1])
+        assert second._load_from_cache(cache_key) == embeddings[1]
+    
+    def test_cache_concurrent_writers(self):
+        """Test that threads and instances sharing a cache keep rows aligned."""
+        first = Embedder(cache_dir=str(self.cache_dir), use_cache=True)
+        second = Embedder(cache_dir=str(self.cache_dir), use_cache=True)
+        batches = [[f"text {i} {j}" for j in range(50)] for i in range(8)]
+        
+        def embed(i):
+            (first if i % 2 else second).embed_batch(batches[i])
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(embed, range(len(batches))))
+        
+        reloaded = Embedder(cache_dir=str(self.cache_dir), use_cache=True)
+        assert len(reloaded._cache_index) == 400
+        for text in (t for batch in batches for t in batch):
+            cache_key = reloaded._get_cache_key(text)
+            assert reloaded._load_from_cache(cache_key) == reloaded._generate_mock_embedding(text)
+    
+    def test_cache_rebuilt_when_misaligned(self):
+        """Test that a partial row discards the cache instead of misreading it."""
+        embedder = Embedder(cache_dir=str(self.cache_dir), use_cache=True)
+        embedder.embed(["First cached text", "Second cached text"])
+        with open(embedder._cache_vectors_file, 'ab') as f:
+            f.write(b"\x00" * 10)
+        
+        reloaded = Embedder(cache_dir=str(self.cache_dir), use_cache=True)
+        
+        assert reloaded._cache_index == {}
+        assert not reloaded._cache_vectors_file.exists()
+        assert reloaded.embed("Third text") == reloaded._generate_mock_embedding("Third text")
+        assert Embedder(cache_dir=str(self.cache_dir))._cache_index == {
+            reloaded._get_cache_key("Third text"): 0
+        }
     
     def test_embed_batch(self):
         """Test batch embedding."""
@@ -133,7 +179,7 @@ class TestEmbedder:
         
         assert key1 == key2
         assert isinstance(key1, str)
-        assert len(key1) == 64  # SHA-256 hex digest length
+        assert len(key1) == 64  # 32-byte hex digest (BLAKE3 or SHA-256)
     
     def test_cache_key_different_texts(self):
         """Test that different texts have different cache keys."""
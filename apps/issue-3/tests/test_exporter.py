@@ -7,6 +7,7 @@ Tests exporting vector database, metadata, and creating migration packages.
 import pytest
 import json
 import shutil
+import zipfile
 from pathlib import Path
 from datetime import datetime
 
@@ -139,6 +140,18 @@ def test_export_documents_custom_path(export_manager, test_documents, tmp_path):
     assert custom_path.exists()
 
 
+def test_export_documents_pretty(test_documents, tmp_path):
+    """Test that JSON is compact by default and indented when pretty"""
+    vector_store = VectorStore(persist_directory=str(tmp_path / "chroma_db"))
+    compact = ExportManager(vector_store, tmp_path / "compact").export_documents(test_documents)
+    pretty = ExportManager(vector_store, tmp_path / "pretty", pretty=True).export_documents(test_documents)
+    
+    assert "\n" not in compact.read_text(encoding="utf-8")
+    assert pretty.read_text(encoding="utf-8").startswith('[\n  {\n    "doc_id": "doc0"')
+    with open(compact, "r", encoding="utf-8") as f_compact, open(pretty, "r", encoding="utf-8") as f_pretty:
+        assert json.load(f_compact) == json.load(f_pretty)
+
+
 # Test Vector Database Export
 
 def test_export_vector_database(export_manager, tmp_path):
@@ -223,6 +236,39 @@ def test_export_all_with_archive(export_manager, test_documents):
     assert archive_path.suffix == ".zip"
 
 
+def test_export_all_archive_compression(test_documents, tmp_path):
+    """Test that the archive uses the configured compression"""
+    vector_store = VectorStore(persist_directory=str(tmp_path / "chroma_db"))
+    manager = ExportManager(
+        vector_store, tmp_path / "export", compression=zipfile.ZIP_STORED, compress_level=None
+    )
+    
+    archive_path = manager.export_all(test_documents, [], create_archive=True)
+    
+    with zipfile.ZipFile(archive_path) as zipf:
+        infos = zipf.infolist()
+        assert {info.compress_type for info in infos} == {zipfile.ZIP_STORED}
+        assert "documents.json" in zipf.namelist()
+
+
+def test_export_all_archive_streams_vector_db(test_documents, tmp_path):
+    """Test that the vector database is zipped from the store without a copy"""
+    db_dir = tmp_path / "chroma_db"
+    (db_dir / "index").mkdir(parents=True)
+    (db_dir / "chroma.sqlite3").write_bytes(b"\x00" * 4096)
+    (db_dir / "index" / "data_level0.bin").write_bytes(b"\x01" * 4096)
+    manager = ExportManager(VectorStore(persist_directory=str(db_dir)), tmp_path / "export")
+    
+    archive_path = manager.export_all(test_documents, [], create_archive=True)
+    
+    assert not (tmp_path / "export" / "vector_db").exists()
+    with zipfile.ZipFile(archive_path) as zipf:
+        assert zipf.getinfo("vector_db/chroma.sqlite3").compress_type == zipfile.ZIP_DEFLATED
+        assert zipf.getinfo("vector_db/index/data_level0.bin").compress_type == zipfile.ZIP_STORED
+        assert zipf.getinfo("documents.json").compress_type == zipfile.ZIP_DEFLATED
+        assert zipf.read("vector_db/index/data_level0.bin") == b"\x01" * 4096
+
+
 def test_export_manifest_content(export_manager, test_documents):
     """Test manifest file content"""
     export_manager.export_all(test_documents, [], create_archive=False)
@@ -0,0 +1,53 @@
+"""
+Tests for File Copy
+
+Tests copying files and directory trees with reflink clones and the
+regular-copy fallback.
+"""
+
+import os
+
+from src.backend.utils import file_copy
+from src.backend.utils.file_copy import clone_file, copy_tree
+
+
+def test_copy_tree(tmp_path):
+    """Test that a tree is copied with contents and timestamps"""
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.bin").write_bytes(b"\x00\x01" * 1000)
+    (src / "sub" / "b.txt").write_text("hello")
+    os.utime(src / "sub" / "b.txt", (1_000_000, 1_000_000))
+    
+    dst = copy_tree(src, tmp_path / "dst")
+    
+    assert (dst / "a.bin").read_bytes() == b"\x00\x01" * 1000
+    assert (dst / "sub" / "b.txt").read_text() == "hello"
+    assert (dst / "sub" / "b.txt").stat().st_mtime == 1_000_000
+
+
+def test_copy_is_independent(tmp_path):
+    """Test that writing to the source does not change the copy"""
+    src = tmp_path / "a.txt"
+    src.write_text("original")
+    dst = tmp_path / "b.txt"
+    
+    clone_file(src, dst)
+    src.write_text("changed")
+    
+    assert dst.read_text() == "original"
+    assert not os.path.samefile(src, dst)
+
+
+def test_clone_falls_back_to_copy(tmp_path, monkeypatch):
+    """Test the regular copy when the filesystem cannot clone"""
+    def ioctl(fd, request, arg):
+        raise OSError(95, "Operation not supported")
+    
+    monkeypatch.setattr(file_copy, "HAS_FCNTL", True)
+    monkeypatch.setattr(file_copy, "fcntl", type("fcntl", (), {"ioctl": staticmethod(ioctl)}), raising=False)
+    src = tmp_path / "a.txt"
+    src.write_text("data")
+    
+    assert clone_file(src, tmp_path / "b.txt") == tmp_path / "b.txt"
+    assert (tmp_path / "b.txt").read_text() == "data"
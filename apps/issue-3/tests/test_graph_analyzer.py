@@ -6,6 +6,7 @@ path finding, and other graph analysis capabilities.
 """
 
 import pytest
+import networkx as nx
 from src.backend.graph.builder import (
     GraphBuilder, GraphNode, GraphEdge, DocumentGraph
 )
@@ -113,6 +114,34 @@ def test_analyzer_initialization():
     assert analyzer._pagerank is None
 
 
+def test_analyzer_reuses_state_until_graph_changes():
+    """Test that analyzers of an unchanged graph share conversions and metrics"""
+    graph = create_test_graph()
+    first = GraphAnalyzer(graph)
+    pagerank = first.calculate_pagerank()
+    
+    second = GraphAnalyzer(graph)
+    assert second.nx_graph is first.nx_graph
+    assert second._pagerank is pagerank
+    
+    graph.add_node(GraphNode("new", "New", "/new.md", [], {}))
+    third = GraphAnalyzer(graph)
+    assert third.nx_graph is not first.nx_graph
+    assert "new" in third.nx_graph
+    assert third._pagerank is None
+
+
+def test_analyzer_explicit_backend():
+    """Test that an explicit dispatch backend is used for centrality"""
+    graph = create_test_graph()
+    analyzer = GraphAnalyzer(graph, backend="networkx")
+    
+    assert analyzer.backend == "networkx"
+    assert len(analyzer.calculate_pagerank()) == graph.total_nodes
+    assert len(analyzer.calculate_betweenness_centrality()) == graph.total_nodes
+    assert sum(c.size for c in analyzer.detect_communities()) == graph.total_nodes
+
+
 def test_detect_communities():
     """Test community detection"""
     graph = create_test_graph()
@@ -196,6 +225,18 @@ def test_calculate_betweenness_centrality():
     assert all(score >= 0.0 for score in betweenness.values())
 
 
+def test_betweenness_exact_for_small_graphs():
+    """Test that graphs below the sample size get exact betweenness"""
+    graph = create_test_graph()
+    analyzer = GraphAnalyzer(graph)
+    
+    betweenness = analyzer.calculate_betweenness_centrality()
+    exact = nx.betweenness_centrality(analyzer.nx_graph)
+    
+    for node_id, score in exact.items():
+        assert betweenness[node_id] == pytest.approx(score)
+
+
 # Test Hub Identification
 
 def test_identify_hubs():
@@ -251,6 +292,21 @@ def test_find_shortest_path_exists():
     assert path_info.total_weight > 0.0
 
 
+def test_find_shortest_path_cached_per_source():
+    """Test that queries from one source share a single Dijkstra run"""
+    graph = create_test_graph()
+    analyzer = GraphAnalyzer(graph)
+    
+    first = analyzer.find_shortest_path("doc0", "doc2")
+    analyzer.find_shortest_path("doc0", "doc1")
+    
+    assert len(analyzer._sp_cache) == 1
+    assert analyzer.find_shortest_path("doc0", "doc2") == first
+    
+    expected = nx.shortest_path(analyzer.nx_graph, "doc0", "doc2", weight="weight")
+    assert first.path == expected
+
+
 def test_find_shortest_path_not_exists():
     """Test finding shortest path when no path exists"""
     graph = create_test_graph()
@@ -288,6 +344,17 @@ def test_find_all_paths():
         assert path.length <= 5
 
 
+def test_find_all_paths_limited_to_k():
+    """Test that path search stops after k shortest paths"""
+    graph = create_test_graph()
+    analyzer = GraphAnalyzer(graph)
+    
+    paths = analyzer.find_all_paths("doc0", "doc5", max_length=5, k=1)
+    
+    assert len(paths) == 1
+    assert paths[0].length == nx.shortest_path_length(analyzer.nx_graph, "doc0", "doc5")
+
+
 # Test Neighbors
 
 def test_get_neighbors_one_hop():
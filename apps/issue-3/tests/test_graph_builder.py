@@ -16,7 +16,8 @@ from src.backend.graph.builder import (
     GraphNode,
     GraphEdge,
     DocumentGraph,
-    GraphBuilder
+    GraphBuilder,
+    SubgraphView
 )
 from src.backend.models.document import (
     Document,
@@ -209,6 +210,21 @@ def test_document_graph_add_edge():
     assert node2.degree == 1
 
 
+def test_document_graph_edges_init_and_equality():
+    """Test passing edges to the constructor and comparing graphs."""
+    nodes = {"doc1": GraphNode("doc1", "Test1", "/test1"), "doc2": GraphNode("doc2", "Test2", "/test2")}
+    graph = DocumentGraph(nodes=nodes, edges=[GraphEdge("doc1", "doc2", weight=0.8)])
+    
+    assert graph.total_edges == 1
+    assert graph.edges == (GraphEdge("doc1", "doc2", weight=0.8),)
+    assert graph == DocumentGraph(nodes=dict(nodes), edges=[GraphEdge("doc1", "doc2", weight=0.8)])
+    assert graph != DocumentGraph(nodes=dict(nodes), edges=[GraphEdge("doc1", "doc2", weight=0.5)])
+    assert graph != DocumentGraph(nodes=dict(nodes))
+    
+    with pytest.raises(AttributeError):
+        graph.edges.append(GraphEdge("doc2", "doc1"))
+
+
 def test_document_graph_get_edges_for_node():
     """Test retrieving edges for a node."""
     graph = DocumentGraph()
@@ -226,6 +242,85 @@ def test_document_graph_get_edges_for_node():
     assert all(e.source_id == "doc1" or e.target_id == "doc1" for e in edges)
 
 
+def test_document_graph_edges_within():
+    """Test retrieving edges inside a node subset."""
+    graph = DocumentGraph()
+    graph.add_edge(GraphEdge("doc1", "doc2", weight=0.8))
+    graph.add_edge(GraphEdge("doc2", "doc3", weight=0.6))
+    graph.add_edge(GraphEdge("doc1", "doc3", weight=0.4))
+    
+    edges = graph.edges_within({"doc1", "doc3"})
+    
+    assert [(e.source_id, e.target_id) for e in edges] == [("doc1", "doc3")]
+    assert len(graph.edges_within({"doc1", "doc2", "doc3"})) == 3
+
+
+def test_document_graph_id_mask():
+    """Test marking a node subset in the edge ID table."""
+    graph = DocumentGraph()
+    graph.add_edge(GraphEdge("doc1", "doc2", weight=0.8))
+    graph.add_edge(GraphEdge("doc2", "doc3", weight=0.6))
+    
+    ids, src, tgt, _ = graph.edge_arrays()
+    small = graph.id_mask({"doc3", "missing"})
+    large = graph.id_mask({"doc1", "doc2", "x", "y"})
+    
+    assert [doc_id for doc_id, hit in zip(ids, small) if hit] == ["doc3"]
+    assert [doc_id for doc_id, hit in zip(ids, large) if hit] == ["doc1", "doc2"]
+    assert (large[src] & large[tgt]).tolist() == [True, False]
+
+
+def test_subgraph_view():
+    """Test a subgraph view over a node subset without copying."""
+    graph = DocumentGraph()
+    for doc_id in ("doc1", "doc2", "doc3"):
+        graph.add_node(GraphNode(doc_id, doc_id, f"/{doc_id}"))
+    graph.add_edge(GraphEdge("doc1", "doc2", weight=0.8))
+    graph.add_edge(GraphEdge("doc2", "doc3", weight=0.6))
+    
+    view = SubgraphView(graph, {"doc1", "doc2", "missing"})
+    
+    assert sorted(view.nodes) == ["doc1", "doc2"]
+    assert "missing" not in view.nodes
+    assert view.total_nodes == 2
+    assert [(e.source_id, e.target_id) for e in view.edges] == [("doc1", "doc2")]
+    assert view.get_edges_for_node("doc3") == []
+    
+    # Follows later changes to the parent graph
+    graph.add_edge(GraphEdge("doc2", "doc1", weight=0.5))
+    assert view.total_edges == 2
+    
+    # Copying does not change the parent's node degrees
+    subgraph = view.to_graph()
+    assert subgraph.total_nodes == 2
+    assert subgraph.total_edges == 2
+    assert graph.nodes["doc2"].degree == 3
+
+
+def test_document_graph_edge_storage_grows():
+    """Test that edges survive array growth with all fields intact."""
+    graph = DocumentGraph()
+    graph.add_node(GraphNode("hub", "Hub", "/hub"))
+    
+    for i in range(100):
+        graph.add_edge(GraphEdge(
+            "hub", f"doc{i}", weight=i / 100, keyword_score=0.5,
+            relationship_type="keyword"
+        ))
+    
+    assert graph.total_edges == 100
+    assert graph.nodes["hub"].degree == 100
+    
+    edge = graph.edges[42]
+    assert edge.target_id == "doc42"
+    assert edge.weight == pytest.approx(0.42)
+    assert edge.keyword_score == 0.5
+    assert edge.relationship_type == "keyword"
+    
+    G = graph.to_networkx()
+    assert G["hub"]["doc42"]["weight"] == pytest.approx(0.42)
+
+
 # --- GraphBuilder Tests ---
 
 def test_graph_builder_creation():
@@ -316,6 +411,10 @@ def test_edge_pruning(sample_documents):
     
     # Verify pruning worked - without it we'd have more edges
     assert graph.total_edges < 3  # Should be less than all possible pairs
+    
+    # Neighbor lookups only see the surviving edges
+    for doc_id, node in graph.nodes.items():
+        assert len(graph.get_edges_for_node(doc_id)) == node.degree
 
 
 def test_wikilink_score_calculation():
@@ -380,6 +479,25 @@ def test_vector_score_calculation():
     assert abs(score - 0.0) < 0.01
 
 
+def test_vector_score_matrix_matches_pairwise(sample_documents):
+    """Test the batched similarity matrix agrees with pairwise scoring."""
+    builder = GraphBuilder()
+    embeddings = {
+        "rust-ownership": [0.9, 0.1, 0.3],
+        "python-gc": [0.2, 0.8, -0.4],
+        "cpp-memory": [0.0, 0.0, 0.0],  # Zero vector scores 0
+    }
+    
+    scores = builder._vector_score_matrix(sample_documents, embeddings)
+    
+    for i, doc1 in enumerate(sample_documents):
+        for j, doc2 in enumerate(sample_documents):
+            if i == j:
+                continue
+            expected = builder._calculate_vector_score(doc1.doc_id, doc2.doc_id, embeddings)
+            assert abs(scores[i, j] - expected) < 1e-5
+
+
 def test_keyword_extraction(sample_documents):
     """Test keyword extraction from documents."""
     builder = GraphBuilder()
@@ -405,6 +523,18 @@ def test_keyword_score_calculation(sample_documents):
     assert score > 0
 
 
+def test_keyword_score_pairs():
+    """Test batched keyword Jaccard scores for overlapping pairs."""
+    builder = GraphBuilder()
+    keyword_sets = [{"rust", "memory"}, {"memory", "python"}, set(), {"rust", "memory", "python"}]
+    
+    scores = builder._keyword_score_pairs(keyword_sets)
+    
+    assert set(scores) == {(0, 1), (0, 3), (1, 3)}
+    assert abs(scores[(0, 1)] - 1 / 3) < 1e-9
+    assert abs(scores[(0, 3)] - 2 / 3) < 1e-9
+
+
 def test_empty_document_list():
     """Test building graph with no documents."""
     builder = GraphBuilder()
@@ -0,0 +1,99 @@
+"""
+Tests for Louvain community detection.
+
+Tests the in-repo Louvain partitioning including:
+- Recovering clearly separated communities
+- Modularity compared to NetworkX's greedy algorithm
+- Edge cases (empty graphs, isolated nodes, self-loops)
+"""
+
+import networkx as nx
+
+from src.backend.graph import louvain
+from src.backend.graph.louvain import best_partition
+
+
+def _communities(partition):
+    """Group a node -> community partition into a list of sets."""
+    groups = {}
+    for node, comm_id in partition.items():
+        groups.setdefault(comm_id, set()).add(node)
+    return list(groups.values())
+
+
+def test_two_cliques():
+    """Test that two cliques joined by one edge are split apart."""
+    G = nx.barbell_graph(5, 0)
+
+    partition = best_partition(G)
+
+    assert sorted(map(sorted, _communities(partition))) == [
+        [0, 1, 2, 3, 4],
+        [5, 6, 7, 8, 9]
+    ]
+
+
+def test_modularity_matches_greedy():
+    """Test partition quality against greedy modularity."""
+    G = nx.karate_club_graph()
+
+    partition = best_partition(G)
+    greedy = nx.community.greedy_modularity_communities(G, weight="weight")
+
+    assert set(partition) == set(G)
+    assert (
+        nx.community.modularity(G, _communities(partition)) >=
+        nx.community.modularity(G, greedy)
+    )
+
+
+def test_community_ids_are_contiguous():
+    """Test that community IDs run from 0 to C-1."""
+    partition = best_partition(nx.connected_caveman_graph(4, 5))
+
+    assert sorted(set(partition.values())) == [0, 1, 2, 3]
+
+
+def test_resolution_increases_communities():
+    """Test that a higher resolution gives at least as many communities."""
+    G = nx.karate_club_graph()
+
+    low = len(set(best_partition(G, resolution=0.5).values()))
+    high = len(set(best_partition(G, resolution=2.0).values()))
+
+    assert high >= low
+
+
+def test_parallel_local_move(monkeypatch):
+    """Test the synchronous (prange) local move used with Numba."""
+    monkeypatch.setattr(louvain, "HAS_NUMBA", True)
+
+    partition = best_partition(nx.barbell_graph(5, 0))
+    assert len(set(partition.values())) == 2
+    assert len({partition[i] for i in range(5)}) == 1
+
+    G = nx.karate_club_graph()
+    greedy = nx.community.greedy_modularity_communities(G, weight="weight")
+    assert (
+        nx.community.modularity(G, _communities(best_partition(G))) >=
+        nx.community.modularity(G, greedy)
+    )
+
+
+def test_empty_graph():
+    """Test partitioning a graph without nodes."""
+    assert best_partition(nx.Graph()) == {}
+
+
+def test_isolated_nodes_and_self_loops():
+    """Test nodes without edges and self-loops."""
+    G = nx.Graph()
+    G.add_nodes_from(["a", "b"])
+    G.add_edge("c", "c", weight=2.0)
+    G.add_edge("d", "e", weight=1.0)
+
+    partition = best_partition(G)
+
+    assert set(partition) == {"a", "b", "c", "d", "e"}
+    assert partition["d"] == partition["e"]
+    assert len({partition["a"], partition["b"], partition["c"], partition["d"]}) == 4
@@ -5,7 +5,9 @@ Tests export functionality for D3.js, Mermaid, Obsidian, and GraphML formats.
 """
 
 import pytest
+import io
 import json
+import networkx as nx
 from src.backend.graph.builder import GraphBuilder, GraphNode, GraphEdge, DocumentGraph
 from src.backend.graph.visualizer import GraphVisualizer, D3Node, D3Link, D3Graph
 
@@ -119,6 +121,26 @@ def test_d3_link_structure():
     assert "value" in link
 
 
+def test_to_d3_json_reuses_pagerank(monkeypatch):
+    """Test that PageRank is recomputed only after the graph changes"""
+    graph = create_test_graph()
+    visualizer = GraphVisualizer(graph)
+    
+    calls = []
+    pagerank = nx.pagerank
+    monkeypatch.setattr(nx, "pagerank", lambda *args, **kwargs: calls.append(1) or pagerank(*args, **kwargs))
+    
+    visualizer.to_d3_json()
+    visualizer.to_d3_json()
+    assert len(calls) == 1
+    
+    graph.add_node(GraphNode(doc_id="new", title="New", file_path="/new.md", tags=[], metadata={}))
+    data = json.loads(visualizer.to_d3_json())
+    
+    assert len(calls) == 2
+    assert "new" in {node["id"] for node in data["nodes"]}
+
+
 # Test Mermaid Export
 
 def test_to_mermaid_basic():
@@ -162,6 +184,21 @@ def test_to_mermaid_with_filtering():
     assert edge_count < 5
 
 
+def test_to_mermaid_deduplicates_reverse_edges():
+    """Test that an edge and its reverse are drawn once"""
+    graph = DocumentGraph()
+    for doc_id in ("a", "b"):
+        graph.add_node(GraphNode(
+            doc_id=doc_id, title=doc_id, file_path=f"/{doc_id}.md", tags=[], metadata={}
+        ))
+    graph.add_edge(GraphEdge(source_id="a", target_id="b", weight=0.9, relationship_type="similarity"))
+    graph.add_edge(GraphEdge(source_id="b", target_id="a", weight=0.9, relationship_type="similarity"))
+    
+    mermaid = GraphVisualizer(graph).to_mermaid()
+    
+    assert mermaid.count("==>") == 1
+
+
 # Test Obsidian Format
 
 def test_to_obsidian_format_full_graph():
@@ -257,6 +294,34 @@ def test_graphml_structure():
     assert edge_count == 5
 
 
+def test_graphml_to_stream():
+    """Test GraphML export written to a text stream"""
+    graph = create_test_graph()
+    visualizer = GraphVisualizer(graph)
+    
+    out = io.StringIO()
+    result = visualizer.to_graphml(out)
+    
+    assert result is None
+    assert out.getvalue() == visualizer.to_graphml()
+
+
+def test_graphml_escapes_ids():
+    """Test that node IDs and edge attributes are XML-escaped"""
+    graph = DocumentGraph()
+    for doc_id in ("a&b", 'c"d'):
+        graph.add_node(GraphNode(
+            doc_id=doc_id, title=doc_id, file_path=f"/{doc_id}.md", tags=[], metadata={}
+        ))
+    graph.add_edge(GraphEdge(source_id="a&b", target_id='c"d', weight=0.5, relationship_type="<wikilink>"))
+    
+    graphml = GraphVisualizer(graph).to_graphml()
+    
+    assert '<node id="a&amp;b">' in graphml
+    assert 'source="a&amp;b" target="c&quot;d"' in graphml
+    assert '<data key="type">&lt;wikilink&gt;</data>' in graphml
+
+
 # Test Filtering
 
 def test_filter_by_tags():
@@ -234,6 +234,20 @@ def test_import_documents_missing(tmp_path, vector_store):
     assert "Documents file not found" in manager.errors[0]
 
 
+def test_import_documents_truncated(export_dir, vector_store):
+    """Test importing a documents.json cut off after the first document"""
+    docs_path = export_dir / "documents.json"
+    content = docs_path.read_text(encoding="utf-8")
+    docs_path.write_text(content[:content.index('"doc_id": "doc1"')], encoding="utf-8")
+    
+    manager = ImportManager(vector_store, export_dir)
+    documents = manager.import_documents(export_dir)
+    
+    assert documents == []
+    assert len(manager.errors) == 1
+    assert "Invalid documents JSON" in manager.errors[0]
+
+
 def test_import_vector_database(export_dir, vector_store, tmp_path):
     """Test importing vector database"""
     manager = ImportManager(vector_store, export_dir)
@@ -2,6 +2,7 @@
 Tests for OCRProcessor.
 """
 
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -12,12 +13,13 @@ from src.backend.core.ocr_processor import OCRProcessor, OCRResult, create_ocr_p
 def ocr_processor(tmp_path):
     """Create an OCR processor with cache."""
     cache_dir = tmp_path / "ocr_cache"
-    return OCRProcessor(
+    with OCRProcessor(
         languages=['ch', 'en'],
         confidence_threshold=0.5,
         use_gpu=False,
         cache_dir=cache_dir
-    )
+    ) as processor:
+        yield processor
 
 
 def test_ocr_processor_initialization():
@@ -27,6 +29,8 @@ def test_ocr_processor_initialization():
     assert processor.languages == ['ch', 'en']
     assert processor.confidence_threshold == 0.5
     assert not processor.use_gpu
+    assert not processor.use_angle_cls
+    assert processor.rec_batch_num == 1
 
 
 def test_ocr_result_dataclass():
@@ -84,6 +88,38 @@ def test_process_images_batch(ocr_processor, tmp_path):
         assert isinstance(result, OCRResult)
 
 
+def test_close_stops_pool_threads(tmp_path):
+    """Test the context manager shuts down the batch thread pool."""
+    images = [tmp_path / f"test{i}.jpg" for i in range(3)]
+    for img in images:
+        img.write_bytes(b"fake image data")
+    
+    with OCRProcessor(cache_dir=tmp_path / "ocr_cache") as processor:
+        processor.process_images_batch(images, preprocess=False)
+        assert processor._pool._threads
+    
+    assert not any(thread.is_alive() for thread in processor._pool._threads)
+
+
+def test_process_images_batch_uses_cache(ocr_processor, tmp_path):
+    """Test batch processing serves cached images without rerunning OCR."""
+    cached = tmp_path / "cached.jpg"
+    cached.write_bytes(b"fake image data")
+    fresh = tmp_path / "fresh.jpg"
+    fresh.write_bytes(b"fake image data")
+    
+    ocr_processor.process_image(cached)
+    
+    with patch.object(ocr_processor, '_mock_ocr', wraps=ocr_processor._mock_ocr) as mock_ocr:
+        results = ocr_processor.process_images_batch([cached, fresh])
+    
+    assert [r.text for r in results] == [
+        "Mock OCR result for cached",
+        "Mock OCR result for fresh",
+    ]
+    mock_ocr.assert_called_once_with(fresh)
+
+
 def test_cache_functionality(ocr_processor, tmp_path):
     """Test OCR result caching."""
     test_image = tmp_path / "test.jpg"
@@ -100,6 +136,69 @@ def test_cache_functionality(ocr_processor, tmp_path):
     assert result1.confidence == result2.confidence
 
 
+def test_memory_cache_skips_disk(ocr_processor, tmp_path):
+    """Test repeated lookups are served from the in-memory LRU cache."""
+    test_image = tmp_path / "test.jpg"
+    test_image.write_bytes(b"fake image data")
+    
+    result1 = ocr_processor.process_image(test_image)
+    
+    with patch.object(ocr_processor, '_load_from_cache') as load_from_cache:
+        result2 = ocr_processor.process_image(test_image)
+    
+    load_from_cache.assert_not_called()
+    assert result2 is result1
+
+
+def test_memory_cache_evicts_oldest(tmp_path):
+    """Test the in-memory cache stays within its size limit."""
+    processor = OCRProcessor(memory_cache_size=2)
+    images = []
+    for i in range(3):
+        img = tmp_path / f"test{i}.jpg"
+        img.write_bytes(b"fake image data")
+        images.append(img)
+        processor.process_image(img)
+    
+    cached_paths = [key[0] for key in processor._mem_cache]
+    assert cached_paths == [str(images[1]), str(images[2])]
+
+
+def test_process_image_stats_once(ocr_processor, tmp_path):
+    """Test one os.stat call serves the memory and disk cache keys."""
+    test_image = tmp_path / "test.jpg"
+    test_image.write_bytes(b"fake image data")
+    
+    with patch('src.backend.core.ocr_processor.os.stat', wraps=os.stat) as stat:
+        ocr_processor.process_image(test_image)
+    
+    assert [c.args[0] for c in stat.call_args_list].count(test_image) == 1
+
+
+def test_preprocess_applies_exif_orientation(tmp_path):
+    """Test that EXIF-rotated photos are preprocessed upright."""
+    from PIL import Image
+    
+    test_image = tmp_path / "rotated.jpg"
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: rotate 90° clockwise to display
+    Image.new('RGB', (300, 100), 'white').save(test_image, exif=exif)
+    
+    processor = OCRProcessor(denoise_strength="none", cache_dir=None)
+    
+    assert processor._preprocess_image(test_image).shape == (300, 100)
+
+
+def test_process_missing_image_without_disk_cache(tmp_path):
+    """Test that the memory cache does not stat paths it cannot key."""
+    processor = OCRProcessor(cache_dir=None)
+    
+    result = processor.process_image(tmp_path / "nonexistent.png")
+    
+    assert isinstance(result, OCRResult)
+    assert processor._mem_cache == {}
+
+
 def test_clear_cache(ocr_processor, tmp_path):
     """Test clearing cache."""
     test_image = tmp_path / "test.jpg"
@@ -109,17 +208,50 @@ def test_clear_cache(ocr_processor, tmp_path):
     ocr_processor.process_image(test_image)
     
     # Verify cache exists
-    cache_files = list(ocr_processor.cache_dir.glob("*.json"))
+    cache_files = list(ocr_processor.cache_dir.glob("*.pkl"))
     assert len(cache_files) > 0
     
     # Clear cache
     ocr_processor.clear_cache()
     
     # Verify cache is empty
-    cache_files = list(ocr_processor.cache_dir.glob("*.json"))
+    cache_files = list(ocr_processor.cache_dir.glob("*.pkl"))
     assert len(cache_files) == 0
 
 
+def test_cache_boxes_loaded_on_request(ocr_processor, tmp_path):
+    """Test text boxes are cached separately and only read when requested."""
+    test_image = tmp_path / "test.jpg"
+    test_image.write_bytes(b"fake image data")
+    boxes = [([[0, 0], [10, 0], [10, 5], [0, 5]], "text", 0.9)]
+    ocr_processor._save_to_cache(test_image, OCRResult("text", 0.9, "ch", boxes=boxes))
+    
+    assert len(list(ocr_processor.cache_dir.glob("*.boxes.pkl"))) == 1
+    assert ocr_processor._load_from_cache(test_image).boxes == boxes
+    assert ocr_processor._load_from_cache(test_image, boxes=False).boxes == []
+    
+    result = ocr_processor.process_image(test_image, boxes=False)
+    assert result.text == "text"
+    assert result.boxes == []
+    assert ocr_processor.process_image(test_image).boxes == boxes
+
+
+def test_json_cache_format(tmp_path):
+    """Test the JSON cache format round-trips results."""
+    processor = OCRProcessor(cache_dir=tmp_path / "ocr_cache", cache_format="json")
+    test_image = tmp_path / "test.jpg"
+    test_image.write_bytes(b"fake image data")
+    
+    result1 = processor.process_image(test_image)
+    assert len(list(processor.cache_dir.glob("*.json"))) == 1
+    
+    result2 = processor._load_from_cache(test_image)
+    assert result2.text == result1.text
+    
+    with pytest.raises(ValueError):
+        OCRProcessor(cache_format="xml")
+
+
 def test_create_ocr_processor_factory(tmp_path):
     """Test factory function."""
     cache_dir = tmp_path / "cache"
@@ -159,7 +291,24 @@ def test_cache_key_generation(ocr_processor, tmp_path):
     
     # Same file should produce same key
     assert key1 == key2
-    assert len(key1) == 64  # SHA-256 hex length
+    assert len(key1) == 64  # BLAKE3 / SHA-256 hex length
+
+
+def test_denoise_strength_validation():
+    """Test denoise strength defaults to the fast filter and rejects unknown values."""
+    assert OCRProcessor().denoise_strength == "fast"
+    assert OCRProcessor(denoise_strength="none").denoise_strength == "none"
+    
+    with pytest.raises(ValueError):
+        OCRProcessor(denoise_strength="extreme")
+
+
+def test_backend_validation():
+    """Test backend selection validates values and falls back on GPU."""
+    assert OCRProcessor(backend="onnx", use_gpu=True).backend == "paddle"
+    
+    with pytest.raises(ValueError):
+        OCRProcessor(backend="tensorrt")
 
 
 def test_ocr_processor_without_cache():
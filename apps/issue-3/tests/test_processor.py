@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 import tempfile
 import shutil
+from unittest.mock import patch
 
 from src.backend.core.processor import DocumentProcessor, ProcessingStats
 from src.backend.models.document import Document
@@ -155,6 +156,32 @@ class TestDocumentProcessor:
         stats = processor.process_folders([str(tmp_path)], force=True)
         assert stats.new_files == 1  # Treated as new with force=True
     
+    def test_process_document_with_image(self, tmp_path):
+        """Test OCR text from referenced images is chunked with the document."""
+        (tmp_path / "diagram.png").write_bytes(b"fake image data")
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Test\n\nSee ![diagram](diagram.png)", encoding='utf-8')
+        
+        processor = DocumentProcessor()
+        stats = processor.process_folders([str(tmp_path)], force=True)
+        
+        assert stats.errors == 0
+        chunks = processor.documents[str(test_file)].chunks
+        assert "Mock OCR result for diagram" in chunks[-1].content
+        assert all(chunk.embedding for chunk in chunks)
+    
+    def test_close_stops_ocr_threads(self, tmp_path):
+        """Test the context manager shuts down its own and the OCR processor's pools."""
+        (tmp_path / "diagram.png").write_bytes(b"fake image data")
+        (tmp_path / "test.md").write_text("See ![diagram](diagram.png)", encoding='utf-8')
+        
+        with DocumentProcessor() as processor:
+            processor.process_folders([str(tmp_path)], force=True)
+            assert processor._pool._threads
+        
+        assert not any(thread.is_alive() for thread in processor._pool._threads)
+        assert not any(thread.is_alive() for thread in processor.ocr_processor._pool._threads)
+    
     def test_build_relationships_wikilinks(self, tmp_path):
         """Test relationship building from wikilinks."""
         # Create documents with wikilinks
@@ -177,6 +204,21 @@ class TestDocumentProcessor:
         wikilink_rels = [r for r in doc1_obj.relationships if r.relationship_type == 'wikilink']
         assert len(wikilink_rels) > 0
     
+    def test_build_relationships_similarity(self, tmp_path):
+        """Test similarity relationships come from one batched vector query."""
+        for i in range(3):
+            (tmp_path / f"doc{i}.md").write_text(f"# Doc {i}\n\nShared content.", encoding='utf-8')
+        
+        processor = DocumentProcessor()
+        with patch.object(processor.vector_store, 'query', wraps=processor.vector_store.query) as query:
+            processor.process_folders([str(tmp_path)], force=True)
+        
+        assert query.call_count == 1
+        assert len(query.call_args.kwargs['query_embeddings']) == 3
+        for doc in processor.documents.values():
+            targets = {r.target_doc_id for r in doc.relationships if r.relationship_type == 'similarity'}
+            assert targets == set(processor.documents) - {doc.doc_id}
+    
     def test_get_knowledge_base(self, tmp_path):
         """Test getting knowledge base object."""
         # Create test file
@@ -224,6 +266,21 @@ class TestDocumentProcessor:
         # Should process successfully in normal case
         assert stats.errors == 0
     
+    def test_process_multiple_folders(self, tmp_path):
+        """Test scanning several folders in one call."""
+        for name in ("a", "b", "c"):
+            folder = tmp_path / name
+            folder.mkdir()
+            (folder / f"{name}.md").write_text(f"# {name}", encoding='utf-8')
+        
+        processor = DocumentProcessor()
+        folders = [str(tmp_path / name) for name in ("a", "b", "c")]
+        stats = processor.process_folders(folders + ["/nonexistent/path"], force=True)
+        
+        assert stats.total_files == 3
+        assert stats.errors == 0
+        assert len(processor.documents) == 3
+    
     def test_empty_folder(self, tmp_path):
         """Test processing empty folder."""
         processor = DocumentProcessor()
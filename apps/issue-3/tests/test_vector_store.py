@@ -0,0 +1,98 @@
+"""
+Tests for VectorStore
+
+Tests add/query/update/delete round trips on the vector store.
+"""
+
+import numpy as np
+import pytest
+
+from src.backend.indexer import vector_store
+from src.backend.indexer.vector_store import VectorStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a vector store with three orthogonal documents"""
+    store = VectorStore(persist_directory=str(tmp_path / "db"), embedding_dim=3)
+    store.add(
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        documents=["doc a", "doc b", "doc c"],
+        metadatas=[{"name": "a"}, {"name": "b"}, {"name": "c"}]
+    )
+    return store
+
+
+def test_query_orders_by_similarity(store):
+    """Test that the closest documents come first for every query"""
+    results = store.query(
+        query_embeddings=[[0.9, 0.1, 0.0], [0.0, 0.2, 0.8]],
+        n_results=2
+    )
+
+    assert results["ids"] == [["a", "b"], ["c", "b"]]
+    assert results["documents"][0] == ["doc a", "doc b"]
+    assert results["metadatas"][1][0] == {"name": "c"}
+    assert results["distances"][0][0] == pytest.approx(0.1, abs=1e-5)
+
+
+def test_query_after_update_and_delete(store):
+    """Test that queries see updated and deleted embeddings"""
+    store.update(ids=["b"], embeddings=[[0.0, 0.0, 1.0]])
+    store.delete(["c"])
+
+    results = store.query(query_embeddings=[[0.0, 0.0, 1.0]], n_results=5)
+
+    assert results["ids"] == [["b", "a"]]
+    assert store.count() == 2
+
+
+def test_query_empty_store(tmp_path):
+    """Test querying a store without documents"""
+    store = VectorStore(persist_directory=str(tmp_path / "db"))
+
+    results = store.query(query_embeddings=[[1.0, 0.0]], n_results=3)
+
+    assert results["ids"] == [[]]
+
+
+def test_add_batch_keeps_document_order(tmp_path):
+    """Test that batched adds return IDs in input order"""
+    store = VectorStore(persist_directory=str(tmp_path / "db"), embedding_dim=2)
+
+    ids = store.add_batch(
+        documents=[f"doc {i}" for i in range(5)],
+        embeddings=[[1.0, float(i)] for i in range(5)],
+        batch_size=2,
+        max_workers=4
+    )
+
+    assert len(set(ids)) == 5
+    assert store.count() == 5
+    assert store.get(ids=[ids[3]])["documents"] == ["doc 3"]
+
+
+def test_query_parallel_top_k(store, monkeypatch):
+    """Test the per-query (prange) top-k selection used with Numba"""
+    monkeypatch.setattr(vector_store, "HAS_NUMBA", True)
+
+    results = store.query(
+        query_embeddings=[[0.9, 0.1, 0.0], [0.0, 0.2, 0.8]],
+        n_results=2
+    )
+
+    assert results["ids"] == [["a", "b"], ["c", "b"]]
+    assert results["distances"][0][0] == pytest.approx(0.1, abs=1e-5)
+
+
+def test_top_k_parallel_matches_top_k():
+    """Test the bounded per-query selection against the argpartition path"""
+    rng = np.random.default_rng(0)
+    distances = rng.random((4, 500), dtype=np.float32)
+
+    expected = vector_store._top_k(distances, 7)
+
+    assert vector_store._top_k_parallel(distances, 7).tolist() == [t.tolist() for t in expected]
+    ties = np.array([[0.5, 0.1, 0.5, 0.1, 0.3]], dtype=np.float32)
+    assert vector_store._top_k_parallel(ties, 4).tolist() == [[1, 3, 4, 0]]